@@ -0,0 +1,23 @@
+# backend/apps/community/caches.py
+
+"""
+[설계 의도]
+- community 앱에서 사용하는 캐시 영역 정의
+- View(조회)와 signals(무효화)가 같은 인스턴스를 공유하도록 별도 모듈로 분리
+"""
+
+from django.db import transaction
+
+from apps.core.utils.cache import NamespacedCache
+
+# 게시판 목록 응답 캐시 (게시판 + 게시판별 게시글 수)
+# - 게시판/게시글 변경 시 세대 번호를 올려 즉시 무효화하므로 TTL은 길게 (1시간)
+board_list_cache = NamespacedCache('board_list', timeout=3600)
+
+
+def invalidate_board_list():
+    """
+    게시판 목록 캐시 전체 무효화 (세대 번호 증가, 트랜잭션 커밋 이후 반영)
+    - 세대 번호는 게시판 목록 ETag에도 사용되므로 클라이언트 캐시도 함께 무효화됨
+    """
+    transaction.on_commit(board_list_cache.bump_generation)
@@ -0,0 +1,21 @@
+# backend/apps/community/signals.py
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caches import invalidate_board_list
+from .models import Board, Post
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def invalidate_board_list_on_board_change(sender, **kwargs):
+    # 게시판 추가/수정/삭제 -> 게시판 목록 캐시 무효화
+    invalidate_board_list()
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_board_list_on_post_change(sender, **kwargs):
+    # 게시글 작성/삭제/게시판 이동 -> 게시판별 게시글 수(posts_count)가 바뀌므로 무효화
+    invalidate_board_list()
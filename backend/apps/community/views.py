@@ -8,6 +8,8 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.views import APIView # APIView : 기본 뷰 클래스, 좋아요 및 스크랩 토글에 사용
 
+from apps.core.utils.conditional import conditional_response, make_etag
+from .caches import board_list_cache
 from .models import Board, Post, Comment, Scrap, PostLike
 from .serializers import (
     BoardSerializer, PostListSerializer, PostSerializer,
@@ -54,11 +56,27 @@ class BoardListView(generics.ListAPIView):
     [최적화 내용]
     - annotate로 집계한 posts_count를 Serializer에서 그대로 사용
     - N+1 문제 완전 제거 (Board 10개 → 쿼리 1개)
+    - 응답을 board_list_cache에 저장 (게시판/게시글 변경 signal에서 세대 번호 증가로 무효화)
+    - 조건부 GET: ETag = (캐시 세대 번호, 페이지) -> 변경이 없으면 DB 조회/직렬화 없이 304
+      (사용자별 값이 없으므로 공유 캐시 허용)
     """
     queryset = Board.objects.annotate(posts_count=Count('posts')).all()
     serializer_class = BoardSerializer
     permission_classes = []
-    # TODO: 캐싱 적용 시 cache_page 데코레이터 또는 get_queryset에서 cache 사용
+
+    def list(self, request, *args, **kwargs):
+        page = request.query_params.get('page', '1')
+        # 세대 번호를 본문보다 먼저 읽음 -> 사이에 세대가 바뀌어도 다음 요청에서 ETag 불일치로 새 본문을 받음
+        etag = make_etag('board_list', board_list_cache.get_generation(), page)
+
+        def build_response():
+            data = board_list_cache.get_or_set(
+                f'page={page}',
+                lambda: super(BoardListView, self).list(request, *args, **kwargs).data,
+            )
+            return Response(data)
+
+        return conditional_response(request, build_response, etag=etag)
 
 # =========================
 # 2) Post Views
@@ -3,13 +3,13 @@
 import os
 import json
 import time
-import requests
 import csv
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.conf import settings
 from apps.courses.models import Course
 from apps.comparisons.models import CourseAIReview
+from apps.core.utils.http_client import gms_client
 
 """
 [설계의도]
@@ -136,9 +136,8 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('=' * 70))
 
         # =============================================
-        # 1. GMS API 설정
+        # 1. GMS API 설정 (URL/타임아웃/재시도는 공용 클라이언트의 chat_completion 엔드포인트 설정 사용)
         # =============================================
-        gms_url = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/chat/completions"
         gms_key = os.environ.get("GMS_KEY")
 
         # 키 없으면 즉시 중단
@@ -199,7 +198,7 @@ class Command(BaseCommand):
 
             try:
                 # LLM 호출하여 AI 평가 생성
-                ai_review_data = self._generate_ai_review(course, gms_url, gms_key)
+                ai_review_data = self._generate_ai_review(course, gms_key)
 
                 # DB 저장 (원자성 보장)
                 with transaction.atomic():
@@ -259,7 +258,17 @@ class Command(BaseCommand):
         self.stdout.write(f'✗ 실패: {error_count}개')
         if options['output']:
             self.stdout.write(f'📁 파일: {options["output"]}')
-        self.stdout.write(f'총 처리: {success_count + error_count}개\n')
+        self.stdout.write(f'총 처리: {success_count + error_count}개')
+        self._print_api_metrics()
+
+    def _print_api_metrics(self):
+        """GMS API 호출 지표 출력 (호출 수/에러/재시도/지연)"""
+        metrics = gms_client.metrics()['chat_completion']
+        latency = metrics['latency_ms']
+        self.stdout.write(
+            f"API 호출: {metrics['calls']}회 (에러 {metrics['errors']}, 재시도 {metrics['retries']}) | "
+            f"지연 avg {latency['avg']}ms / p95 {latency['p95']}ms / max {latency['max']}ms\n"
+        )
 
     def _calculate_duration_rating(self, week):
         """
@@ -357,20 +366,19 @@ class Command(BaseCommand):
                 writer.writeheader()
             writer.writerows(data_list)
 
-    def _generate_ai_review(self, course, gms_url, gms_key):
+    def _generate_ai_review(self, course, gms_key):
         """
         LLM을 호출하여 강좌 평가 생성 (메인 로직)
 
         Args:
             course: Course 인스턴스
-            gms_url: GMS API URL
             gms_key: GMS API 키
 
         Returns:
             dict: AI 평가 데이터
         """
         system_prompt, user_prompt = self._build_prompts(course)
-        response_data = self._call_gms_api(gms_url, gms_key, system_prompt, user_prompt)
+        response_data = self._call_gms_api(gms_key, system_prompt, user_prompt)
         ai_review = self._parse_and_validate_response(response_data)
 
         # Duration rating을 코드로 직접 계산하여 추가
@@ -446,12 +454,12 @@ class Command(BaseCommand):
 
         return system_prompt, user_prompt
 
-    def _call_gms_api(self, gms_url, gms_key, system_prompt, user_prompt):
+    def _call_gms_api(self, gms_key, system_prompt, user_prompt):
         """
         GMS API를 호출하여 LLM 응답 받기
+        - 공용 클라이언트 사용: keep-alive 연결 재사용, 타임아웃/429·5xx 재시도(jitter 백오프)
 
         Args:
-            gms_url: GMS API URL
             gms_key: GMS API 키
             system_prompt: 시스템 프롬프트
             user_prompt: 사용자 프롬프트
@@ -478,12 +486,7 @@ class Command(BaseCommand):
             "max_tokens": self.LLM_MAX_TOKENS
         }
 
-        response = requests.post(
-            gms_url,
-            headers=headers,
-            data=json.dumps(data),
-            timeout=30
-        )
+        response = gms_client.post('chat_completion', json=data, headers=headers)
 
         if response.status_code != 200:
             raise Exception(
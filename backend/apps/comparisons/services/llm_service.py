@@ -36,6 +36,7 @@ from django.db.models import Q # Q가 있어야 복잡한 쿼리 연산이 가
 from apps.courses.models import CourseReview
 from apps.comparisons.models import CourseAIReview
 from apps.courses.models import Course
+from apps.core.utils.http_client import ENDPOINTS, gms_client
 
 # =========================
 # LLM 설정 상수
@@ -46,7 +47,7 @@ LLM_MODEL_NAME = 'gpt-4o-mini'  # 사용할 LLM 모델 버전
 LLM_TEMPERATURE_CREATIVE = 0.6  # 코멘트 생성용 (창의성 조금 필요)
 LLM_TEMPERATURE_FACTUAL = 0.3   # 요약용 (일관성 조금 더 중요)
 LLM_MAX_TOKENS = 500            # 최대 토큰 수
-LLM_TIMEOUT = 30                # API 호출 타임아웃 (초)
+LLM_TIMEOUT = ENDPOINTS['chat_completion'].read_timeout  # API 호출 타임아웃 (초, 공용 HTTP 클라이언트 엔드포인트 설정)
 
 # =========================
 # 리뷰 요약 정책 상수
@@ -85,9 +86,9 @@ class LLMService:
 
         [상세 고려 사항]
         - GMS_KEY는 환경변수에서 주입 (보안)
-        - API URL은 상수로 정의 (향후 변경 가능성 고려)
+        - API URL/타임아웃/재시도 정책은 공용 HTTP 클라이언트(apps.core.utils.http_client)의 chat_completion 엔드포인트에서 관리
         """
-        self.gms_url = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/chat/completions"
+        self.gms_url = ENDPOINTS['chat_completion'].url
         self.gms_key = os.environ.get("GMS_KEY")
 
         # 키 없으면 미리 시패 처리함.
@@ -396,7 +397,8 @@ class LLMService:
 
         [상세 고려 사항]
         - JSON 모드 활성화로 구조화된 응답 보장
-        - timeout 30초로 설정하여 무한 대기 방지 -> 수정하고 싶으면 LLM_TIMEOUT 바꾸면 됨. 
+        - timeout 30초로 설정하여 무한 대기 방지 -> 수정하고 싶으면 http_client.ENDPOINTS['chat_completion'] 바꾸면 됨.
+        - 공용 클라이언트(gms_client) 사용: keep-alive 연결 재사용, 연결 실패/429/5xx는 jitter 백오프 후 재시도
         - HTTP 상태 코드별 명확한 에러 메시지 제공
 
         Args:
@@ -427,12 +429,7 @@ class LLMService:
 
         # 3. API 호출
         try:
-            response = requests.post(
-                self.gms_url,
-                headers=headers,
-                data=json.dumps(data),
-                timeout=LLM_TIMEOUT
-            )
+            response = gms_client.post('chat_completion', json=data, headers=headers)
         except requests.Timeout:
             raise Exception(
                 f"GMS API 호출 시간 초과 (timeout: {LLM_TIMEOUT}초). "
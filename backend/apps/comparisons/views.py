@@ -64,6 +64,7 @@ from rest_framework import status
 from rest_framework.permissions import AllowAny
 from django.shortcuts import get_object_or_404
 
+from apps.core.utils.conditional import conditional_response, make_etag
 from apps.courses.models import Course
 from apps.comparisons.models import CourseAIReview
 from apps.comparisons.serializers import (
@@ -303,6 +304,7 @@ class CourseAIReviewDetailView(APIView):
     - 인증 필요 (전역 설정 IsAuthenticated)
     # NOTE 비로그인 사용자도 체험 가능하게 할지에 대해서 -> 추후 변경 검토
     - AI 평가가 없으면 404 반환
+    - AI 평가 updated_at을 검증자(ETag / Last-Modified)로 사용 -> 변경이 없으면 304
     """
 
 
@@ -330,12 +332,21 @@ class CourseAIReviewDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        # 3. 직렬화 및 응답
-        serializer = CourseAIReviewDetailSerializer(ai_review)
+        # 3. 조건부 GET: AI 평가 updated_at이 같으면 직렬화 없이 304
+        #    - 인증 필요 API이므로 공유 캐시에는 저장하지 않음 (private, 브라우저는 ETag로 재검증)
+        def build_response():
+            serializer = CourseAIReviewDetailSerializer(ai_review)
+            return Response(
+                serializer.data,
+                status=status.HTTP_200_OK
+            )
 
-        return Response(
-            serializer.data,
-            status=status.HTTP_200_OK
+        return conditional_response(
+            request,
+            build_response,
+            etag=make_etag('course_ai_review', course_id, ai_review.updated_at.isoformat()),
+            last_modified=ai_review.updated_at,
+            shared=False,
         )
     
 # =========================
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.urls import get_resolver
+
+from apps.core.utils.cache import NamespacedCache, get_namespaced_caches
+
+
+class Command(BaseCommand):
+    help = '공유 캐시의 영역(namespace)별 hit/miss 카운터와 적중률을 출력합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'namespaces',
+            nargs='*',
+            help='조회할 캐시 영역 (생략 시 등록된 전체 영역)'
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='출력 후 카운터 초기화'
+        )
+
+    def handle(self, *args, **options):
+        # URLConf를 로드하면 각 앱 views에 선언된 NamespacedCache가 등록됨
+        get_resolver().url_patterns
+        registered = get_namespaced_caches()
+
+        namespaces = options['namespaces'] or sorted(registered)
+        if not namespaces:
+            self.stdout.write(self.style.WARNING('등록된 캐시 영역이 없습니다.'))
+            return
+
+        self.stdout.write(f"Cache backend: {settings.CACHES['default']['BACKEND']}")
+        for namespace in namespaces:
+            namespaced_cache = registered.get(namespace) or NamespacedCache(namespace)
+            stats = namespaced_cache.stats()
+            hit_rate = f"{stats['hit_rate'] * 100:.1f}%" if stats['hit_rate'] is not None else '-'
+            self.stdout.write(
+                f"{namespace}: hits={stats['hits']}, misses={stats['misses']}, hit_rate={hit_rate}"
+            )
+            if options['reset']:
+                namespaced_cache.reset_stats()
+
+        if options['reset']:
+            self.stdout.write(self.style.SUCCESS('카운터를 초기화했습니다.'))
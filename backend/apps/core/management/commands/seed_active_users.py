@@ -41,7 +41,7 @@ from django.conf import settings
 # 모델 임포트
 from apps.accounts.models import User, UserConsent, EmailVerification
 from apps.community.models import Board, Post, Comment, PostLike, Scrap
-from apps.courses.models import Course, Enrollment, Wishlist, CourseReview
+from apps.courses.models import Course, Enrollment, Wishlist, CourseReview, CourseRatingStats
 from apps.comparisons.models import CourseAIReview
 
 # 헬퍼 함수 임포트
@@ -1062,6 +1062,8 @@ class Command(BaseCommand):
                 reviews.append(review)
 
         CourseReview.objects.bulk_create(reviews, batch_size=BATCH_SIZE, ignore_conflicts=True)
+        # bulk_create는 signal을 발생시키지 않으므로 평점 통계를 직접 재계산
+        CourseRatingStats.rebuild()
         self.stdout.write(self.style.SUCCESS(f'✓ {len(reviews)}개의 강의 리뷰 생성'))
 
         return reviews
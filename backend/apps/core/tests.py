@@ -1,3 +1,167 @@
-from django.test import TestCase
+import threading
+import time
 
-# Create your tests here.
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.utils import timezone
+from django.utils.http import http_date
+
+from apps.core.utils.cache import NamespacedCache
+from apps.core.utils.conditional import conditional_response, make_etag
+
+# 테스트는 워커 1개 기준이므로 원자적 add/incr를 제공하는 LocMem 캐시 사용
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'core-tests',
+    }
+}
+
+
+# ========================
+# 1. NamespacedCache
+# ========================
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NamespacedCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.cache = NamespacedCache('test_namespace', timeout=60)
+
+    def test_get_or_set_computes_once_then_hits(self):
+        calls = []
+        compute = lambda: calls.append(1) or {'value': len(calls)}
+
+        first = self.cache.get_or_set('key', compute)
+        second = self.cache.get_or_set('key', compute)
+
+        self.assertEqual(first, {'value': 1})
+        self.assertEqual(second, first)
+        self.assertEqual(len(calls), 1)
+
+    def test_bump_generation_invalidates_every_key(self):
+        self.cache.get_or_set('a', lambda: 'old-a')
+        self.cache.get_or_set('b', lambda: 'old-b')
+        generation = self.cache.get_generation()
+
+        self.cache.bump_generation()
+
+        self.assertEqual(self.cache.get_generation(), generation + 1)
+        self.assertEqual(self.cache.get_or_set('a', lambda: 'new-a'), 'new-a')
+        self.assertEqual(self.cache.get_or_set('b', lambda: 'new-b'), 'new-b')
+
+    def test_invalidate_drops_only_that_key(self):
+        self.cache.get_or_set('a', lambda: 'old-a')
+        self.cache.get_or_set('b', lambda: 'old-b')
+
+        self.cache.invalidate('a')
+
+        self.assertEqual(self.cache.get_or_set('a', lambda: 'new-a'), 'new-a')
+        self.assertEqual(self.cache.get_or_set('b', lambda: 'new-b'), 'old-b')
+
+    def test_missing_generation_restarts_from_current_time(self):
+        # 세대 키가 사라져도(eviction) 이전 세대 번호로 되돌아가지 않음
+        cache.delete(self.cache._generation_key())
+        before = int(time.time() * 1000)
+
+        self.assertGreaterEqual(self.cache.get_generation(), before)
+
+    def test_get_or_set_single_flight(self):
+        # 계산 중인 워커가 있으면 다른 워커는 계산하지 않고 결과를 기다림
+        started = threading.Event()
+        calls = []
+
+        def slow_compute():
+            calls.append(1)
+            started.set()
+            time.sleep(0.3)
+            return 'computed'
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(self.cache.get_or_set('key', slow_compute)))
+        leader.start()
+        started.wait(timeout=5)
+        follower_result = self.cache.get_or_set('key', slow_compute)
+        leader.join()
+
+        self.assertEqual(follower_result, 'computed')
+        self.assertEqual(results, ['computed'])
+        self.assertEqual(len(calls), 1)
+
+    def test_early_refresh_only_near_expiry(self):
+        now = time.time()
+        self.assertFalse(self.cache._should_refresh_early({'delta': 0.01, 'expires_at': now + 3600}))
+        self.assertTrue(self.cache._should_refresh_early({'delta': 0.01, 'expires_at': now - 1}))
+
+    def test_stats_are_flushed_to_shared_cache(self):
+        self.cache.reset_stats()
+        self.cache.get('missing')
+        self.cache.set('present', 1)
+        self.cache.get('present')
+        self.cache.flush_stats()
+
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+
+# ========================
+# 2. 조건부 GET (ETag / Last-Modified)
+# ========================
+
+@override_settings(HTTP_CACHE_SHARED_MAX_AGE=60)
+class ConditionalResponseTests(SimpleTestCase):
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.calls = []
+
+    def build_response(self):
+        self.calls.append(1)
+        return HttpResponse('body')
+
+    def test_make_etag_is_weak_and_stable(self):
+        etag = make_etag('course_list', 3, 'page=1')
+
+        self.assertRegex(etag, r'^W/"[0-9a-f]{32}"$')
+        self.assertEqual(etag, make_etag('course_list', 3, 'page=1'))
+        self.assertNotEqual(etag, make_etag('course_list', 4, 'page=1'))
+
+    def test_matching_if_none_match_returns_304_without_building(self):
+        etag = make_etag('v1')
+        request = self.factory.get('/', HTTP_IF_NONE_MATCH=etag)
+
+        response = conditional_response(request, self.build_response, etag=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(self.calls, [])
+
+    def test_stale_etag_builds_full_response(self):
+        request = self.factory.get('/', HTTP_IF_NONE_MATCH=make_etag('v1'))
+
+        response = conditional_response(request, self.build_response, etag=make_etag('v2'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'body')
+        self.assertEqual(self.calls, [1])
+
+    def test_if_modified_since(self):
+        last_modified = timezone.now()
+        request = self.factory.get('/', HTTP_IF_MODIFIED_SINCE=http_date(last_modified.timestamp() + 1))
+
+        response = conditional_response(request, self.build_response, last_modified=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('Last-Modified', response.headers)
+
+    def test_cache_control_depends_on_shared(self):
+        request = self.factory.get('/')
+
+        shared = conditional_response(request, self.build_response, etag=make_etag('v1'))
+        private = conditional_response(request, self.build_response, etag=make_etag('v1'), shared=False)
+
+        self.assertIn('public', shared.headers['Cache-Control'])
+        self.assertIn('s-maxage=60', shared.headers['Cache-Control'])
+        self.assertIn('private', private.headers['Cache-Control'])
+        self.assertIn('Authorization', shared.headers['Vary'])
@@ -0,0 +1,254 @@
+# backend/apps/core/utils/cache.py
+
+"""
+[설계 의도]
+- 앱 전역에서 사용하는 공용 캐시 접근 레이어
+- settings.CACHES(default)가 Redis/파일/LocMem 중 무엇이든 같은 인터페이스로 사용
+- 캐시 영역(namespace)별 hit/miss 카운터를 공유 캐시에 누적 -> 워커 수와 무관하게 적중률 확인 가능
+
+[상세 고려사항]
+- 키는 "{namespace}:{key}" 형태로 구성 (백엔드 KEY_PREFIX는 settings에서 별도로 붙음)
+- 카운터는 요청마다 공유 캐시에 쓰지 않고, 프로세스 내에서 모았다가 STATS_FLUSH_EVERY번마다 incr로 반영
+- 카운터 반영 실패(캐시 서버 장애 등)는 응답에 영향을 주지 않도록 무시
+- get_or_set(): 캐시 스탬피드 방지
+  - 만료 직전 확률적 조기 갱신(XFetch): 계산 비용(delta)이 클수록, 만료가 가까울수록 미리 1개 워커만 재계산
+  - single-flight 락: 캐시 미스 시 한 워커만 계산하고 나머지는 잠시 대기 후 결과를 재사용
+- 백엔드별 보장 수준: 락(add)과 카운터(incr)가 원자적인 것은 Redis뿐
+  - file  : add/incr가 "읽기 -> 쓰기" 두 단계라 여러 워커가 동시에 락을 얻거나 카운터 증가분이 유실될 수 있음
+  - locmem: 워커 내부에서만 원자적 (워커 간 공유 자체가 없음)
+  -> 여러 워커/컨테이너로 운영할 때는 Redis 필수, file/locmem은 로컬 개발/테스트용
+- 세대(generation) 기반 무효화: bump_generation() 한 번으로 영역 전체 키를 무효화 (키 스캔/삭제 없음)
+"""
+
+import math
+import random
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import caches
+
+DEFAULT_CACHE_ALIAS = 'default'
+STATS_KEY_FORMAT = 'cache_stats:{namespace}:{kind}'
+STATS_FLUSH_EVERY = 50   # 프로세스 로컬 카운터를 공유 캐시에 반영하는 주기 (조회 횟수)
+STATS_TIMEOUT = None     # 카운터는 만료시키지 않음 (eviction 정책에 의해서만 제거)
+
+GENERATION_KEY_FORMAT = '{namespace}:__generation__'
+LOCK_TIMEOUT = 10        # single-flight 락 유지 시간 (초, 계산 중 워커가 죽어도 자동 해제)
+LOCK_WAIT = 2.0          # 락을 얻지 못한 워커가 결과를 기다리는 최대 시간 (초)
+LOCK_POLL_INTERVAL = 0.05
+EARLY_REFRESH_BETA = 1.0  # XFetch 조기 갱신 강도 (클수록 일찍 갱신)
+
+# 생성된 캐시 영역 목록 (cache_stats 커맨드에서 사용)
+_registry = {}
+
+
+class NamespacedCache:
+    """
+    [설계 의도]
+    - 특정 기능(예: course_list) 전용 캐시 영역
+    - get/set/delete 호출 시 네임스페이스 키 구성과 hit/miss 집계를 대신 처리
+
+    [사용 예]
+        course_list_cache = NamespacedCache('course_list', timeout=300)
+        data = course_list_cache.get_or_set(key, lambda: ...)   # 권장 (스탬피드 방지 + 세대 무효화)
+        course_list_cache.bump_generation()                     # 데이터 변경 시 영역 전체 무효화
+        course_list_cache.invalidate(key)                       # 특정 키만 무효화
+    """
+
+    def __init__(self, namespace, timeout=300, alias=DEFAULT_CACHE_ALIAS):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.alias = alias
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        _registry[namespace] = self
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def make_key(self, key):
+        return f"{self.namespace}:{key}"
+
+    # ---- 세대(generation) 기반 무효화 ----
+
+    def _generation_key(self):
+        return GENERATION_KEY_FORMAT.format(namespace=self.namespace)
+
+    def get_generation(self):
+        """
+        현재 세대 번호 반환
+        - 세대 키가 없거나(최초/eviction) 사라진 경우 현재 시각(ms)으로 시작
+          -> 이전 세대 번호와 겹치지 않아 예전 캐시가 되살아나지 않음
+        """
+        generation_key = self._generation_key()
+        generation = self.backend.get(generation_key)
+        if generation is None:
+            self.backend.add(generation_key, int(time.time() * 1000), None)
+            generation = self.backend.get(generation_key, 0)
+        return generation
+
+    def bump_generation(self):
+        """영역 전체 무효화: 세대 번호를 올려 이전 세대 키를 모두 미사용 상태로 만듦 (이전 키는 TTL로 자연 소멸)"""
+        generation_key = self._generation_key()
+        try:
+            return self.backend.incr(generation_key)
+        except ValueError:
+            generation = int(time.time() * 1000)
+            self.backend.set(generation_key, generation, None)
+            return generation
+
+    def make_versioned_key(self, key):
+        return self.make_key(f"g{self.get_generation()}:{key}")
+
+    def invalidate(self, key):
+        """키 1개만 무효화: get_or_set()이 저장한 현재 세대 키 삭제 (다음 조회에서 재계산)"""
+        self.backend.delete(self.make_versioned_key(key))
+
+    # ---- 스탬피드 방지 조회 ----
+
+    def get_or_set(self, key, compute, timeout=None):
+        """
+        [설계 의도]
+        - 캐시 조회 -> 없으면 compute() 결과를 저장 후 반환
+        - 현재 세대 키를 사용하므로 bump_generation() 이후에는 자동으로 새로 계산
+
+        [처리 흐름]
+        1. 캐시 히트 + 조기 갱신 대상 아님 -> 캐시 값 반환
+        2. 캐시 히트 + 조기 갱신 대상 -> 락을 얻은 1개 워커만 재계산, 나머지는 기존 값 반환
+        3. 캐시 미스 -> 락을 얻은 1개 워커만 계산, 나머지는 LOCK_WAIT 동안 결과 대기
+           (대기 시간 초과 시 직접 계산)
+
+        [상세 고려사항]
+        - "1개 워커만 계산"은 Redis 백엔드에서만 보장 (원자적 add)
+          file/locmem 백엔드에서는 best-effort: 동시에 여러 워커가 계산할 수 있으나 결과 값은 동일하므로 정확성에는 영향 없음
+        """
+        timeout = self.timeout if timeout is None else timeout
+        versioned_key = self.make_versioned_key(key)
+        lock_key = f"{versioned_key}:lock"
+
+        entry = self.backend.get(versioned_key)
+        if entry is not None:
+            if not self._should_refresh_early(entry) or not self.backend.add(lock_key, 1, LOCK_TIMEOUT):
+                self._record('hits')
+                return entry['value']
+            return self._compute_and_set(versioned_key, lock_key, compute, timeout)
+
+        if not self.backend.add(lock_key, 1, LOCK_TIMEOUT):
+            entry = self._wait_for(versioned_key)
+            if entry is not None:
+                self._record('hits')
+                return entry['value']
+            self._record('misses')
+            value = compute()
+            self._store(versioned_key, value, timeout, delta=0)
+            return value
+
+        return self._compute_and_set(versioned_key, lock_key, compute, timeout)
+
+    def _compute_and_set(self, versioned_key, lock_key, compute, timeout):
+        self._record('misses')
+        try:
+            started = time.monotonic()
+            value = compute()
+            self._store(versioned_key, value, timeout, delta=time.monotonic() - started)
+            return value
+        finally:
+            self.backend.delete(lock_key)
+
+    def _store(self, versioned_key, value, timeout, delta):
+        entry = {'value': value, 'delta': delta, 'expires_at': time.time() + timeout}
+        self.backend.set(versioned_key, entry, timeout)
+
+    def _should_refresh_early(self, entry):
+        # XFetch: now - delta * beta * ln(rand) >= expires_at 이면 조기 갱신
+        # random.random()이 0이면 log 불가이므로 1 - random() 사용 (0 < x <= 1)
+        jitter = entry['delta'] * EARLY_REFRESH_BETA * math.log(1.0 - random.random())
+        return time.time() - jitter >= entry['expires_at']
+
+    def _wait_for(self, versioned_key):
+        deadline = time.monotonic() + LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            entry = self.backend.get(versioned_key)
+            if entry is not None:
+                return entry
+        return None
+
+    def get(self, key, default=None):
+        value = self.backend.get(self.make_key(key), default)
+        self._record('hits' if value is not default else 'misses')
+        return value
+
+    def set(self, key, value, timeout=None):
+        self.backend.set(self.make_key(key), value, self.timeout if timeout is None else timeout)
+
+    def add(self, key, value, timeout=None):
+        return self.backend.add(self.make_key(key), value, self.timeout if timeout is None else timeout)
+
+    def delete(self, key):
+        self.backend.delete(self.make_key(key))
+
+    # ---- hit/miss 집계 ----
+
+    def record_hit(self):
+        """get()을 거치지 않는 캐시 계층(예: 프로세스 내 LRU, DB 테이블)의 적중을 직접 집계"""
+        self._record('hits')
+
+    def record_miss(self):
+        self._record('misses')
+
+    def _record(self, kind):
+        with self._lock:
+            self._pending[kind] += 1
+            if sum(self._pending.values()) < STATS_FLUSH_EVERY:
+                return
+            pending, self._pending = self._pending, Counter()
+        self._flush(pending)
+
+    def _flush(self, pending):
+        for kind, count in pending.items():
+            stats_key = STATS_KEY_FORMAT.format(namespace=self.namespace, kind=kind)
+            try:
+                try:
+                    self.backend.incr(stats_key, count)
+                except ValueError:
+                    # 키가 없으면 생성 (동시에 생성된 경우 add가 실패하므로 incr 재시도)
+                    if not self.backend.add(stats_key, count, STATS_TIMEOUT):
+                        self.backend.incr(stats_key, count)
+            except Exception:
+                pass
+
+    def flush_stats(self):
+        """프로세스에 남아 있는 카운터를 즉시 공유 캐시에 반영"""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        self._flush(pending)
+
+    def stats(self):
+        """공유 캐시에 누적된 hit/miss 및 적중률 반환 (모든 워커 합산)"""
+        keys = {
+            kind: STATS_KEY_FORMAT.format(namespace=self.namespace, kind=kind)
+            for kind in ('hits', 'misses')
+        }
+        values = self.backend.get_many(keys.values())
+        hits = values.get(keys['hits'], 0)
+        misses = values.get(keys['misses'], 0)
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 4) if total else None,
+        }
+
+    def reset_stats(self):
+        self.backend.delete_many([
+            STATS_KEY_FORMAT.format(namespace=self.namespace, kind=kind)
+            for kind in ('hits', 'misses')
+        ])
+
+
+def get_namespaced_caches():
+    """등록된 캐시 영역 목록 반환 {namespace: NamespacedCache}"""
+    return dict(_registry)
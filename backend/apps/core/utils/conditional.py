@@ -0,0 +1,66 @@
+# backend/apps/core/utils/conditional.py
+
+"""
+[설계 의도]
+- HTTP 조건부 GET(ETag / Last-Modified) 공용 처리
+- 자주 바뀌지 않는 조회 API에서 클라이언트가 이미 가진 응답이면 본문 없이 304 반환
+  -> 네트워크 전송량 감소 + 직렬화 생략
+
+[상세 고려사항]
+- 검증자(validator)는 응답 본문이 아니라 "데이터 버전"으로 만듦
+  (updated_at, 통계 갱신 시각, 캐시 세대 번호 등) -> 304 판단 전에 serializer를 실행하지 않음
+- 조건 비교는 django.utils.cache.get_conditional_response 사용 (RFC 9110 순서: If-None-Match 우선, 약한 비교)
+- ETag는 약한 ETag(W/"...")로 발급 -> GZip 등 본문 인코딩이 달라져도 같은 데이터면 일치
+- Cache-Control
+  - shared=True : 사용자와 무관한 응답 -> public, max-age=0, s-maxage=HTTP_CACHE_SHARED_MAX_AGE
+    (브라우저는 매번 304 검증, nginx proxy_cache는 s-maxage 동안 저장 후 재사용)
+  - shared=False: 로그인 사용자별 값이 섞인 응답 -> private, no-cache (공유 캐시 저장 금지, 브라우저는 매번 검증)
+  - Vary: Authorization, Cookie -> 인증 상태가 다른 요청이 같은 공유 캐시 항목을 받지 않도록
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+
+
+def make_etag(*parts):
+    """데이터 버전 값들 -> 약한 ETag (W/"sha1 앞 32자")"""
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def conditional_response(request, build_response, etag=None, last_modified=None, shared=True):
+    """
+    [처리 흐름]
+    1. 검증자로 If-None-Match / If-Modified-Since 평가 -> 일치하면 304 (build_response 호출 안 함)
+    2. 불일치 -> build_response()로 응답 생성
+    3. 200 응답/304 응답 모두에 ETag, Last-Modified, Cache-Control, Vary 헤더 설정
+
+    Args:
+        build_response: 인자 없이 Response를 반환하는 함수 (직렬화/캐시 조회는 여기서만 수행)
+        etag: make_etag() 결과
+        last_modified: datetime (초 단위로 절삭되어 비교됨)
+        shared: 공유 캐시(nginx) 저장 허용 여부
+    """
+    last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified_ts)
+    if response is None:
+        response = build_response()
+    if response.status_code not in (200, 304):
+        # 412(If-Match 불일치) 또는 build_response의 오류 응답은 그대로 반환
+        return response
+
+    # 304는 본문이 없으므로 검증자/캐시 헤더만 실어 보냄 (RFC 9110 15.4.5)
+    if etag:
+        response.headers['ETag'] = etag
+    if last_modified_ts is not None:
+        response.headers['Last-Modified'] = http_date(last_modified_ts)
+    if shared:
+        patch_cache_control(response, public=True, max_age=0, s_maxage=settings.HTTP_CACHE_SHARED_MAX_AGE)
+    else:
+        patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ('Authorization', 'Cookie'))
+    return response
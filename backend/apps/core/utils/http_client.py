@@ -0,0 +1,211 @@
+# backend/apps/core/utils/http_client.py
+
+"""
+[설계 의도]
+- 외부 API(GMS 임베딩/LLM) 호출을 위한 공용 HTTP 클라이언트
+- 호출마다 requests.post로 새 TCP+TLS 연결을 맺지 않도록 Session 커넥션 풀(keep-alive)을 프로세스 내에서 공유
+- 타임아웃/재시도/동시 호출 수 제한/지표 수집을 호출부마다 따로 구현하지 않고 한 곳에서 관리
+
+[상세 고려사항]
+- 엔드포인트(논리적 이름) 단위로 URL과 정책(타임아웃, 재시도 횟수, 동시 호출 수)을 정의
+  - 검색 요청 경로(query_embedding)는 짧은 타임아웃 + 재시도 최소화 (사용자 응답 지연 방지)
+  - 배치 작업(batch_embedding, chat_completion)은 긴 타임아웃 + 재시도 여유
+- 재시도 대상: 연결 실패/타임아웃, 429, 5xx
+  - 지수 백오프 + full jitter (여러 워커가 같은 순간에 몰려서 재시도하지 않도록)
+  - Retry-After 헤더가 있으면 해당 시간 우선
+- 재시도 후에도 실패하면
+  - 네트워크 예외는 그대로 전파 (호출부의 requests.Timeout/RequestException 처리 유지)
+  - HTTP 에러 응답은 Response를 그대로 반환 (호출부의 status_code 검사 유지)
+- 지표는 프로세스 단위로 엔드포인트별 호출 수/에러 수/재시도 수/지연(평균, p50, p95, 최대) 집계 -> metrics()
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+GMS_BASE_URL = "https://gms.ssafy.io/gmsapi/api.openai.com/v1"
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 0.5       # 첫 재시도 최대 대기 시간 (초)
+BACKOFF_MAX = 8.0        # 재시도 대기 시간 상한 (초)
+POOL_MAXSIZE = 20        # 호스트당 유지할 keep-alive 연결 수
+LATENCY_SAMPLES = 1000   # 지연 백분위 계산에 사용할 최근 호출 수 (엔드포인트별)
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    url: str
+    connect_timeout: float
+    read_timeout: float
+    max_retries: int
+    max_concurrency: int
+
+
+ENDPOINTS = {
+    # 시맨틱 검색 질의 임베딩 (사용자 요청 경로)
+    'query_embedding': Endpoint(
+        url=f"{GMS_BASE_URL}/embeddings",
+        connect_timeout=2, read_timeout=5, max_retries=1, max_concurrency=8,
+    ),
+    # 강좌 임베딩 일괄 생성 (make_embeddings)
+    'batch_embedding': Endpoint(
+        url=f"{GMS_BASE_URL}/embeddings",
+        connect_timeout=5, read_timeout=30, max_retries=3, max_concurrency=4,
+    ),
+    # LLM 호출 (맞춤 코멘트/리뷰 요약/AI 평가 생성)
+    'chat_completion': Endpoint(
+        url=f"{GMS_BASE_URL}/chat/completions",
+        connect_timeout=5, read_timeout=30, max_retries=2, max_concurrency=4,
+    ),
+}
+
+
+class OutboundClient:
+    """
+    [사용 예]
+        response = gms_client.post('query_embedding', json={...})
+        response.status_code, response.json()
+    """
+
+    def __init__(self, endpoints):
+        self.endpoints = endpoints
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._semaphores = {
+            name: threading.BoundedSemaphore(endpoint.max_concurrency)
+            for name, endpoint in endpoints.items()
+        }
+        self._metrics_lock = threading.Lock()
+        self._counters = {name: Counter() for name in endpoints}
+        self._latencies = {name: deque(maxlen=LATENCY_SAMPLES) for name in endpoints}
+
+    @property
+    def session(self):
+        # 최초 사용 시 생성 (import 시점에 커넥션 풀을 만들지 않음)
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=len(self.endpoints), pool_maxsize=POOL_MAXSIZE)
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def post(self, endpoint_name, json=None, headers=None, timeout=None):
+        """
+        [처리 흐름]
+        1. 엔드포인트 동시 호출 수 제한 (세마포어 획득까지 대기)
+        2. 요청 -> 재시도 대상이면 jitter 백오프 후 재요청 (최대 max_retries회)
+        3. 호출 1건당 지연/에러/재시도 수 기록
+        - headers 미지정 시 GMS_KEY 환경변수로 인증 헤더 구성
+        - timeout 미지정 시 엔드포인트 기본값 (connect, read)
+        """
+        endpoint = self.endpoints[endpoint_name]
+        headers = headers or self.default_headers()
+        timeout = timeout or (endpoint.connect_timeout, endpoint.read_timeout)
+
+        with self._semaphores[endpoint_name]:
+            started = time.monotonic()
+            attempt = 0
+            while True:
+                try:
+                    response = self.session.post(endpoint.url, json=json, headers=headers, timeout=timeout)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    if attempt >= endpoint.max_retries:
+                        self._record(endpoint_name, started, error=True)
+                        logger.warning(f"[{endpoint_name}] 호출 실패 ({attempt + 1}회 시도): {e}")
+                        raise
+                    self._sleep_before_retry(endpoint_name, attempt)
+                    attempt += 1
+                    continue
+
+                if response.status_code in RETRY_STATUS_CODES and attempt < endpoint.max_retries:
+                    self._sleep_before_retry(endpoint_name, attempt, response.headers.get('Retry-After'))
+                    attempt += 1
+                    continue
+
+                self._record(endpoint_name, started, error=response.status_code >= 400)
+                return response
+
+    @staticmethod
+    def default_headers():
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {os.environ.get('GMS_KEY', '')}",
+        }
+
+    def _sleep_before_retry(self, endpoint_name, attempt, retry_after=None):
+        with self._metrics_lock:
+            self._counters[endpoint_name]['retries'] += 1
+        delay = None
+        if retry_after:
+            try:
+                delay = min(float(retry_after), BACKOFF_MAX)
+            except ValueError:
+                delay = None  # HTTP-date 형식은 무시하고 백오프 사용
+        if delay is None:
+            # full jitter: 0 ~ min(상한, base * 2^attempt) 사이 임의 시간
+            delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+        time.sleep(delay)
+
+    # ---- 지표 ----
+
+    def _record(self, endpoint_name, started, error):
+        elapsed_ms = (time.monotonic() - started) * 1000
+        with self._metrics_lock:
+            counter = self._counters[endpoint_name]
+            counter['calls'] += 1
+            counter['errors'] += int(error)
+            counter['latency_ms_total'] += elapsed_ms
+            counter['latency_ms_max'] = max(counter['latency_ms_max'], elapsed_ms)
+            self._latencies[endpoint_name].append(elapsed_ms)
+
+    def metrics(self):
+        """
+        현재 프로세스의 엔드포인트별 지표
+        {name: {calls, errors, retries, error_rate, latency_ms: {avg, p50, p95, max}}}
+        - 지연은 재시도/백오프 대기를 포함한 호출 1건 전체 시간
+        """
+        result = {}
+        with self._metrics_lock:
+            for name, counter in self._counters.items():
+                samples = sorted(self._latencies[name])
+                calls = counter['calls']
+                result[name] = {
+                    'calls': calls,
+                    'errors': counter['errors'],
+                    'retries': counter['retries'],
+                    'error_rate': round(counter['errors'] / calls, 4) if calls else None,
+                    'latency_ms': {
+                        'avg': round(counter['latency_ms_total'] / calls, 1) if calls else None,
+                        'p50': round(_percentile(samples, 0.50), 1) if samples else None,
+                        'p95': round(_percentile(samples, 0.95), 1) if samples else None,
+                        'max': round(counter['latency_ms_max'], 1) if calls else None,
+                    },
+                }
+        return result
+
+    def reset_metrics(self):
+        with self._metrics_lock:
+            for name in self._counters:
+                self._counters[name] = Counter()
+                self._latencies[name].clear()
+
+
+def _percentile(sorted_samples, q):
+    index = min(len(sorted_samples) - 1, int(round(q * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+# 프로세스 공용 GMS 클라이언트
+gms_client = OutboundClient(ENDPOINTS)
@@ -0,0 +1,58 @@
+# backend/apps/courses/caches.py
+
+"""
+[설계 의도]
+- courses 앱에서 사용하는 캐시 영역 정의
+- View(조회)와 signals(무효화)가 같은 인스턴스를 공유하도록 별도 모듈로 분리
+  (signals에서 views를 import하면 ES 클라이언트 등 불필요한 초기화가 딸려오므로)
+"""
+
+from django.db import transaction
+
+from apps.core.utils.cache import NamespacedCache
+
+# 강좌 목록 응답 캐시 (settings.CACHES 공유 백엔드 사용, TTL 5분)
+course_list_cache = NamespacedCache('course_list', timeout=300)
+
+# 강좌 상세 공용 응답 캐시 (강좌 필드 + 평점 통계 + AI 요약, 사용자별 is_wished 제외)
+# - 변경 시 signal로 해당 강좌 키를 바로 지우므로 TTL은 길게 (1시간)
+course_detail_cache = NamespacedCache('course_detail', timeout=3600)
+
+# 목록 필터 패싯(대분류/중분류/운영기관별 강좌 수) 캐시 - 검색/필터 조합(filter signature)별
+# - 리뷰 변경과 무관하므로 목록 캐시와 세대를 분리 (강좌 추가/수정/삭제, 대표 강좌 갱신 시에만 무효화)
+course_facets_cache = NamespacedCache('course_facets', timeout=3600)
+
+# 자동완성 인덱스 세대 (값은 저장하지 않고 세대 번호만 사용 -> 워커가 바뀐 것을 보고 인덱스 재구축)
+# - 순위에 리뷰 수가 들어가므로 강좌 변경 외에 리뷰 작성/삭제, 평점 통계 재계산 시에도 증가
+course_suggest_cache = NamespacedCache('course_suggest', timeout=3600)
+
+
+def invalidate_course_list():
+    """
+    강좌 목록 캐시 전체 무효화 (세대 번호 증가)
+    - 트랜잭션 커밋 이후에 반영 -> 커밋 전 데이터로 새 세대 캐시가 채워지는 것을 방지
+    - 트랜잭션 밖에서 호출되면 즉시 실행
+    """
+    transaction.on_commit(course_list_cache.bump_generation)
+
+
+def invalidate_course_detail(course_id=None):
+    """
+    강좌 상세 캐시 무효화 (트랜잭션 커밋 이후 반영)
+    - course_id: 해당 강좌 키만 삭제 (강좌/리뷰/AI 평가 저장·삭제 signal)
+    - None: 세대 번호 증가로 전체 무효화 (signal을 거치지 않는 대량 적재/통계 재계산 후)
+    """
+    if course_id is None:
+        transaction.on_commit(course_detail_cache.bump_generation)
+    else:
+        transaction.on_commit(lambda: course_detail_cache.invalidate(str(course_id)))
+
+
+def invalidate_course_facets():
+    """강좌 패싯 캐시 전체 무효화 (세대 번호 증가, 트랜잭션 커밋 이후 반영)"""
+    transaction.on_commit(course_facets_cache.bump_generation)
+
+
+def invalidate_course_suggest():
+    """자동완성 인덱스 세대 번호 증가 (트랜잭션 커밋 이후 반영, 각 워커가 다음 확인 때 재구축)"""
+    transaction.on_commit(course_suggest_cache.bump_generation)
@@ -0,0 +1,200 @@
+# backend/apps/courses/embedding_cache.py
+
+"""
+[설계 의도]
+- 시맨틱 검색 질의문 임베딩 캐시 (검색 p50 지연의 대부분을 차지하는 임베딩 API 호출 제거)
+- 2단계 구성
+  1) 프로세스 내 LRU: 같은 워커에서 반복되는 질의는 DB 조회 없이 즉시 반환
+  2) QueryEmbedding 테이블: 워커/재배포와 무관하게 유지되는 영구 캐시
+- 두 단계 모두 미스일 때만 임베딩 API 호출 후 양쪽에 저장
+
+[상세 고려사항]
+- 키: (모델명, 정규화된 질의문) -> 대소문자/공백/유니코드 표기만 다른 질의는 같은 임베딩 사용
+  (정규화는 캐시 키에만 사용하고 API에는 사용자가 입력한 원문(앞뒤 공백 제거)을 보냄
+   -> 캐시 미스 시의 검색 결과는 캐시 도입 전과 동일, 표기만 다른 질의는 처음 들어온 표기의 벡터를 공유)
+- 사용 기록(hit_count, last_used_at)은 조회 경로에서 바로 UPDATE하지 않고 프로세스 내에 모아 두었다가
+  HIT_FLUSH_INTERVAL초마다 한 번에 반영 (읽기 요청마다 쓰기 쿼리가 생기지 않도록, 워커 종료 시 미반영분은 유실 허용)
+- 적중률: NamespacedCache('query_embedding') 카운터로 집계 -> cache_stats 커맨드로 확인
+  (LRU/DB 적중 = hit, API 호출 = miss), 계층별 적중 수는 local_stats()로 프로세스 단위 확인
+- 벡터는 float32 배열(1536차원 약 6KB)로 보관/반환 (float 리스트는 항목당 약 50KB)
+  리스트가 필요한 곳(ES 질의 JSON)에서만 변환, pgvector/NumPy는 배열을 그대로 사용
+- DB 저장 실패(동시 저장 충돌 등)는 검색 응답에 영향을 주지 않도록 무시
+- 테이블 정리는 prune_query_embeddings 커맨드 (QueryEmbedding.prune)
+"""
+
+import hashlib
+import logging
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+
+import numpy as np
+from django.db.models import F
+from django.utils import timezone
+
+from apps.core.utils.cache import NamespacedCache
+
+from .models import QueryEmbedding
+
+LRU_MAX_SIZE = 1024        # 프로세스 내 LRU 최대 항목 수 (1536차원 float32 배열 기준 워커당 약 6MB)
+HIT_FLUSH_INTERVAL = 60    # 사용 기록을 DB에 반영하는 주기 (초)
+
+logger = logging.getLogger(__name__)
+
+# 적중률 집계용 캐시 영역 (값은 저장하지 않고 hit/miss 카운터만 사용)
+query_embedding_stats = NamespacedCache('query_embedding')
+
+
+def normalize_query(text):
+    """유니코드 정규화(NFKC) + 소문자 + 연속 공백 정리"""
+    return ' '.join(unicodedata.normalize('NFKC', text).lower().split())
+
+
+def make_query_hash(model, normalized_text):
+    return hashlib.sha256(f"{model}\n{normalized_text}".encode('utf-8')).hexdigest()
+
+
+class QueryEmbeddingCache:
+    """
+    [사용 예]
+        vector = query_embedding_cache.get_or_fetch(query, model, fetch=lambda text: ...)
+        - fetch(text): 질의 원문(앞뒤 공백 제거)을 받아 임베딩(list[float])을 반환, 실패 시 None
+        - 반환 값: float32 배열 (읽기 전용, LRU 항목을 공유하므로), 실패 시 None
+    """
+
+    def __init__(self, max_size=LRU_MAX_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local_stats = Counter()
+        self._pending_hits = Counter()   # query_hash -> DB에 아직 반영하지 않은 적중 수
+        self._flushed_at = time.monotonic()
+
+    def get_or_fetch(self, text, model, fetch):
+        """
+        [처리 흐름]
+        1. 질의문 정규화 (빈 문자열이면 None)
+        2. LRU 조회 -> 적중 시 반환
+        3. DB 조회 -> 적중 시 LRU 저장 후 반환
+        4. fetch(원문) 호출 -> 성공 시 DB/LRU 저장 후 반환 (실패 시 None, 캐시하지 않음)
+        (2, 3 적중은 사용 기록에 누적 -> 주기적으로 DB 반영)
+        """
+        normalized = normalize_query(text)
+        if not normalized:
+            return None
+        query_hash = make_query_hash(model, normalized)
+
+        vector = self._lru_get(query_hash)
+        if vector is not None:
+            self._count('lru_hits', query_hash)
+            return vector
+
+        vector = self._db_get(query_hash)
+        if vector is not None:
+            self._count('db_hits', query_hash)
+            self._lru_set(query_hash, vector)
+            return vector
+
+        self._count('api_calls')
+        vector = fetch(text.strip())
+        if vector is None:
+            return None
+        vector = self._to_array(vector)
+        self._db_set(query_hash, model, normalized, vector)
+        self._lru_set(query_hash, vector)
+        return vector
+
+    @staticmethod
+    def _to_array(vector):
+        # LRU 항목을 여러 요청이 공유하므로 읽기 전용으로 고정
+        array = np.array(vector, dtype=np.float32)
+        array.setflags(write=False)
+        return array
+
+    # ---- LRU ----
+
+    def _lru_get(self, query_hash):
+        with self._lock:
+            vector = self._entries.get(query_hash)
+            if vector is not None:
+                self._entries.move_to_end(query_hash)
+            return vector
+
+    def _lru_set(self, query_hash, vector):
+        with self._lock:
+            self._entries[query_hash] = vector
+            self._entries.move_to_end(query_hash)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    # ---- DB ----
+
+    def _db_get(self, query_hash):
+        embedding = QueryEmbedding.objects.filter(query_hash=query_hash).values_list('embedding', flat=True).first()
+        return self._to_array(embedding) if embedding is not None else None
+
+    def _db_set(self, query_hash, model, normalized, vector):
+        try:
+            QueryEmbedding.objects.bulk_create(
+                [QueryEmbedding(query_hash=query_hash, model=model, query_text=normalized, embedding=vector)],
+                ignore_conflicts=True,  # 다른 워커가 먼저 저장한 경우
+            )
+        except Exception as e:
+            logger.warning("질의 임베딩 캐시 저장 실패: %s", e)
+
+    def flush_hits(self):
+        """
+        누적된 사용 기록을 DB에 반영 (적중 수가 같은 행끼리 UPDATE 1번)
+        - 반영 실패 시 해당 기록은 버림 (통계용 값이므로 재시도하지 않음)
+        """
+        with self._lock:
+            pending, self._pending_hits = self._pending_hits, Counter()
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return
+
+        by_count = {}
+        for query_hash, count in pending.items():
+            by_count.setdefault(count, []).append(query_hash)
+        now = timezone.now()
+        try:
+            for count, query_hashes in by_count.items():
+                QueryEmbedding.objects.filter(query_hash__in=query_hashes).update(
+                    hit_count=F('hit_count') + count,
+                    last_used_at=now,
+                )
+        except Exception as e:
+            logger.warning("질의 임베딩 사용 기록 반영 실패: %s", e)
+
+    # ---- 적중률 ----
+
+    def _count(self, kind, query_hash=None):
+        with self._lock:
+            self._local_stats[kind] += 1
+            if query_hash is not None:
+                self._pending_hits[query_hash] += 1
+            flush_due = time.monotonic() - self._flushed_at >= HIT_FLUSH_INTERVAL
+        if kind == 'api_calls':
+            query_embedding_stats.record_miss()
+        else:
+            query_embedding_stats.record_hit()
+        if flush_due:
+            self.flush_hits()
+
+    def local_stats(self):
+        """현재 프로세스의 계층별 적중 수 {lru_hits, db_hits, api_calls, size}"""
+        with self._lock:
+            return {
+                'lru_hits': self._local_stats['lru_hits'],
+                'db_hits': self._local_stats['db_hits'],
+                'api_calls': self._local_stats['api_calls'],
+                'size': len(self._entries),
+            }
+
+
+query_embedding_cache = QueryEmbeddingCache()
@@ -0,0 +1,73 @@
+# backend/apps/courses/embedding_profile.py
+
+"""
+[설계 의도]
+- 임베딩 저장 프로파일: 검색 인덱스(ES/mmap/pgvector)에 넣는 벡터의 차원/정밀도를 설정으로 선택
+- DB(Course.embedding)에는 항상 1536차원 float32 원본을 보관
+  -> 프로파일을 바꿔도 임베딩 API를 다시 호출할 필요 없이 인덱스만 재구축
+
+[상세 고려사항]
+- 차원 축소(Matryoshka): text-embedding-3 계열은 앞쪽 차원에 정보가 몰리도록 학습되어
+  앞 N개만 잘라 L2 재정규화해도 코사인 유사도 순위가 대부분 유지됨 (API의 dimensions 파라미터와 같은 방식)
+- 정밀도 축소:
+  - ES: dense_vector index_options.type = int8_hnsw (HNSW 그래프용 벡터를 int8로 양자화, 메모리 약 1/4)
+  - pgvector: 원본 컬럼은 그대로 두고 halfvec(float16) 표현식 HNSW 인덱스 사용 (인덱스 크기 약 1/2)
+- 질의 벡터도 같은 프로파일로 변환해야 인덱스와 차원이 맞음 -> 색인/검색 모두 to_serving_vector() 사용
+- 프로파일별 정확도(recall)/지연 시간은 benchmark_embedding_profiles 커맨드로 원본 대비 측정
+"""
+
+import numpy as np
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+FULL_DIMENSIONS = 1536                       # Course.embedding 원본 차원
+SUPPORTED_DIMENSIONS = (512, 768, 1536)
+ES_VECTOR_INDEX_TYPES = ('hnsw', 'int8_hnsw')
+PGVECTOR_HALFVEC_INDEX_PREFIX = 'idx_course_embedding_hnsw_half'
+
+
+def serving_dimensions():
+    """검색 인덱스에 사용하는 임베딩 차원 (settings.EMBEDDING_DIMENSIONS)"""
+    dims = settings.EMBEDDING_DIMENSIONS
+    if dims not in SUPPORTED_DIMENSIONS:
+        raise ImproperlyConfigured(f'EMBEDDING_DIMENSIONS는 {SUPPORTED_DIMENSIONS} 중 하나여야 합니다: {dims}')
+    return dims
+
+
+def es_vector_index_type():
+    index_type = settings.ES_VECTOR_INDEX_TYPE
+    if index_type not in ES_VECTOR_INDEX_TYPES:
+        raise ImproperlyConfigured(f'ES_VECTOR_INDEX_TYPE은 {ES_VECTOR_INDEX_TYPES} 중 하나여야 합니다: {index_type}')
+    return index_type
+
+
+def truncate_vector(vector, dims):
+    """
+    앞 dims개 차원만 남기고 L2 재정규화 -> float32 배열 (벡터 1개 또는 (N, 1536) 행렬)
+    - dims가 원본 이상이면 자르지 않고 float32 변환만 수행 (기존 색인 값과 동일)
+    """
+    array = np.asarray(vector, dtype=np.float32)
+    if dims >= array.shape[-1]:
+        return array
+    array = np.array(array[..., :dims], dtype=np.float32)
+    norms = np.linalg.norm(array, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return array / norms
+
+
+def to_serving_vector(vector):
+    """원본 임베딩/질의 벡터 -> 현재 프로파일 차원의 float32 배열"""
+    return truncate_vector(vector, serving_dimensions())
+
+
+def pgvector_halfvec_index_name(dims):
+    return f'{PGVECTOR_HALFVEC_INDEX_PREFIX}{dims}'
+
+
+def pgvector_halfvec_sql(dims, column='embedding'):
+    """
+    halfvec 표현식 인덱스/정렬식 SQL (인덱스 정의와 knn() 정렬식이 같아야 플래너가 인덱스를 사용)
+    - 예: (subvector(embedding, 1, 512))::halfvec(512)
+    """
+    source = column if dims >= FULL_DIMENSIONS else f'subvector({column}, 1, {int(dims)})'
+    return f'({source})::halfvec({int(dims)})'
@@ -0,0 +1,167 @@
+# backend/apps/courses/es_index.py
+
+"""
+[설계 의도]
+- 강좌 검색 인덱스를 버전별 실제 인덱스(kmooc_courses_v<N>) + 읽기 alias(kmooc_courses)로 운영
+- 검색/추천/색인은 항상 alias 이름으로 접근 -> 새 버전을 다 만든 뒤 alias만 교체 (무중단 재색인)
+
+[상세 고려사항]
+- 새 인덱스는 색인용 설정(refresh 끔, 레플리카 0)으로 생성 -> 적재 후 운영 설정 복구 + force-merge
+- alias 교체는 _aliases API 한 번으로 remove/add를 함께 수행 (중간에 alias가 비는 순간 없음)
+- alias 이름과 같은 실제 인덱스(버전 관리 이전의 kmooc_courses)가 있으면 교체 시 remove_index로 함께 제거
+- embedding 필드의 차원/HNSW 타입은 임베딩 저장 프로파일(embedding_profile.py)을 따름
+  -> 프로파일 변경은 매핑 변경이므로 reindex_es로 새 버전 인덱스를 만들어 반영
+"""
+
+import re
+
+from django.conf import settings
+from elasticsearch import Elasticsearch, NotFoundError
+
+from .embedding_profile import es_vector_index_type, serving_dimensions, to_serving_vector
+
+ES_INDEX = "kmooc_courses"                 # 읽기/쓰기 alias 이름
+VERSIONED_INDEX_PATTERN = re.compile(rf"^{ES_INDEX}_v(\d+)$")
+SERVING_REFRESH_INTERVAL = "1s"            # 운영 중 refresh 주기 (ES 기본값)
+FORCE_MERGE_TIMEOUT = 600                  # force-merge 요청 타임아웃 (초)
+
+INDEX_ANALYSIS = {
+    "analyzer": {
+        "nori_analyzer": {
+            "type": "custom",
+            "tokenizer": "nori_tokenizer"
+        }
+    }
+}
+
+INDEX_MAPPINGS = {
+    "properties": {
+        "id": {"type": "integer"},
+        "kmooc_id": {"type": "keyword"},
+        "name": {"type": "text", "analyzer": "nori_analyzer"},
+        "summary": {"type": "text", "analyzer": "nori_analyzer"},
+        "professor": {"type": "keyword"},
+        "org_name": {"type": "keyword"},
+        "classfy_name": {"type": "keyword"},
+        "middle_classfy_name": {"type": "keyword"},
+        "course_image": {"type": "keyword", "index": False},
+        "url": {"type": "keyword", "index": False},
+        "content_key": {"type": "keyword"},
+        # 시리즈 키 (같은 이름+교수 = 같은 시리즈), 중복 제거는 is_canonical 필터로 처리
+        "series_key": {"type": "keyword"},
+        "is_canonical": {"type": "boolean"},
+        "embedding": {
+            "type": "dense_vector",
+            "dims": serving_dimensions(),
+            "index": True,
+            "similarity": "cosine",
+            # hnsw: float32 그대로 / int8_hnsw: HNSW용 벡터를 int8로 양자화 (메모리 약 1/4, ES 8.12 이상)
+            "index_options": {"type": es_vector_index_type()}
+        }
+    },
+    # 인덱스가 어떤 프로파일로 만들어졌는지 기록 (GET <index>/_mapping으로 확인)
+    "_meta": {
+        "embedding_dims": serving_dimensions(),
+        "embedding_index_type": es_vector_index_type(),
+    }
+}
+
+# ES 문서에 포함되는 Course 컬럼 (.only()로 이 컬럼만 조회)
+COURSE_DOC_FIELDS = [
+    'id', 'kmooc_id', 'name', 'summary', 'professor', 'org_name',
+    'classfy_name', 'middle_classfy_name', 'course_image', 'url',
+    'content_key', 'series_key', 'is_canonical', 'embedding',
+]
+
+
+def build_course_document(course):
+    """Course -> ES 문서 (push_to_es, sync_es_outbox 공용)"""
+    return {
+        "id": course.id,
+        "kmooc_id": course.kmooc_id,
+        "name": course.name,
+        "summary": course.summary,
+        "professor": course.professor,
+        "org_name": course.org_name,
+        "classfy_name": course.classfy_name,
+        "middle_classfy_name": course.middle_classfy_name,
+        "course_image": course.course_image,
+        "url": course.url,
+        "content_key": course.content_key,
+        "series_key": course.series_key,
+        "is_canonical": course.is_canonical,
+        # 프로파일 차원으로 자른 float32 배열 -> 파이썬 float 리스트 (JSON 직렬화 가능)
+        "embedding": to_serving_vector(course.embedding).tolist(),
+    }
+
+
+def get_es_client():
+    return Elasticsearch(getattr(settings, 'ELASTICSEARCH_URL', 'http://elasticsearch:9200'))
+
+
+def versioned_indices(es):
+    """존재하는 버전 인덱스 이름 목록 (버전 오름차순)"""
+    names = es.indices.get(index=f"{ES_INDEX}_v*").keys()
+    matched = [(int(m.group(1)), name) for name in names if (m := VERSIONED_INDEX_PATTERN.match(name))]
+    return [name for _, name in sorted(matched)]
+
+
+def alias_targets(es):
+    """alias가 가리키는 실제 인덱스 목록 (alias가 없으면 빈 리스트)"""
+    try:
+        return sorted(es.indices.get_alias(name=ES_INDEX).keys())
+    except NotFoundError:
+        return []
+
+
+def has_legacy_index(es):
+    """alias가 아닌 실제 인덱스가 alias 이름(kmooc_courses)을 쓰고 있는지"""
+    return bool(es.indices.exists(index=ES_INDEX)) and not es.indices.exists_alias(name=ES_INDEX)
+
+
+def create_versioned_index(es, bulk=False):
+    """
+    다음 버전 인덱스 생성 후 이름 반환
+    - bulk=True: 대량 색인용 설정 (refresh_interval=-1, replicas=0) -> 적재 후 finalize_index() 필요
+    """
+    existing = versioned_indices(es)
+    next_version = int(VERSIONED_INDEX_PATTERN.match(existing[-1]).group(1)) + 1 if existing else 1
+    index_name = f"{ES_INDEX}_v{next_version}"
+
+    index_settings = {"analysis": INDEX_ANALYSIS}
+    if bulk:
+        index_settings.update({"refresh_interval": "-1", "number_of_replicas": 0})
+    es.indices.create(index=index_name, settings=index_settings, mappings=INDEX_MAPPINGS)
+    return index_name
+
+
+def finalize_index(es, index_name, replicas):
+    """대량 색인 후 운영 설정 복구 -> refresh -> 세그먼트 1개로 force-merge -> 샤드 할당 대기"""
+    es.indices.put_settings(
+        index=index_name,
+        settings={"refresh_interval": SERVING_REFRESH_INTERVAL, "number_of_replicas": replicas},
+    )
+    es.indices.refresh(index=index_name)
+    es.options(request_timeout=FORCE_MERGE_TIMEOUT).indices.forcemerge(index=index_name, max_num_segments=1)
+    es.cluster.health(index=index_name, wait_for_status="yellow", timeout="60s")
+
+
+def swap_alias(es, index_name):
+    """alias를 index_name으로 원자적으로 교체, 이전 대상 인덱스 목록 반환"""
+    previous = alias_targets(es)
+    actions = [{"remove": {"index": name, "alias": ES_INDEX}} for name in previous if name != index_name]
+    if has_legacy_index(es):
+        actions.append({"remove_index": {"index": ES_INDEX}})
+    actions.append({"add": {"index": index_name, "alias": ES_INDEX, "is_write_index": True}})
+    es.indices.update_aliases(actions=actions)
+    return [name for name in previous if name != index_name]
+
+
+def delete_old_indices(es, keep=0):
+    """alias 대상이 아닌 버전 인덱스 삭제 (최신 keep개는 롤백용으로 보관), 삭제한 이름 목록 반환"""
+    current = set(alias_targets(es))
+    old = [name for name in versioned_indices(es) if name not in current]
+    to_delete = old[:-keep] if keep > 0 else old
+    for name in to_delete:
+        es.indices.delete(index=name)
+    return to_delete
@@ -0,0 +1,137 @@
+# backend/apps/courses/importers.py
+
+"""
+[설계 의도]
+- 강좌 백업(JSON)/원본(CSV) 적재 공용 유틸 (import_courses, load_courses)
+- 파일 전체를 메모리에 올리지 않고 한 건씩 읽어 chunk 단위로 upsert (행마다 조회/저장 왕복 제거)
+
+[상세 고려사항]
+- bulk_create는 save()/signal을 거치지 않으므로
+  - series_key는 Course.build_series_key()로 직접 계산
+  - ES 동기화 outbox 기록은 같은 트랜잭션에서 직접 수행 (목록 캐시 무효화/대표 강좌 갱신은 커맨드 종료 시 1번)
+- chunk 전체가 실패하면(잘못된 값, 같은 chunk 내 kmooc_id 중복 등) 행 단위로 다시 시도하여 실패한 행만 건너뜀
+"""
+
+import hashlib
+import json
+import re
+
+import numpy as np
+from django.db import transaction
+
+from .models import Course, CourseSyncOutbox
+
+IMPORT_CHUNK_SIZE = 500
+# 백업/복원 대상 메타데이터 필드 (kmooc_id, 임베딩 제외 / 이미 있는 강좌는 이 필드들을 덮어씀)
+COURSE_METADATA_FIELDS = [
+    'name', 'content_key', 'professor', 'org_name', 'certificate_yn',
+    'classfy_name', 'middle_classfy_name', 'summary', 'raw_summary', 'url', 'course_image',
+    'enrollment_start', 'enrollment_end', 'study_start', 'study_end',
+    'week', 'course_playtime',
+]
+COURSE_DATE_FIELDS = ['enrollment_start', 'enrollment_end', 'study_start', 'study_end']
+
+# 바이너리 백업 (export_course_backup / import_course_backup)
+BACKUP_FORMAT = 'course-backup/1'
+BACKUP_METADATA_FILE = 'courses.ndjson'
+BACKUP_EMBEDDINGS_FILE = 'embeddings.npy'
+BACKUP_EMBEDDING_IDS_FILE = 'embedding_ids.npy'
+BACKUP_MANIFEST_FILE = 'manifest.json'
+
+JSON_READ_SIZE = 1 << 20               # 증분 파싱 시 한 번에 읽을 크기 (1MB)
+_SEPARATOR = re.compile(r'[\s,]*')     # 배열 원소 사이 공백/쉼표
+
+
+def iter_json_array(path, read_size=JSON_READ_SIZE):
+    """
+    최상위가 객체 배열인 JSON 파일(dumpdata 형식)의 원소를 하나씩 반환
+    - json.load로 전체를 파싱하지 않고 read_size씩 읽으며 raw_decode로 원소 단위 파싱
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(read_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError('JSON 배열 형식의 백업 파일이 아닙니다.')
+        pos = 1
+        eof = False
+        while True:
+            pos = _SEPARATOR.match(buffer, pos).end()
+            if buffer.startswith(']', pos):
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # 원소가 버퍼 경계에서 잘린 경우 -> 더 읽어서 다시 파싱
+                if eof:
+                    raise
+                chunk = f.read(read_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            yield item
+
+
+def parse_embedding(value):
+    """백업의 임베딩 값 -> float32 배열 (문자열 "[...]"은 json.loads로 파싱), 값이 없으면 None"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        value = json.loads(value)
+    return np.asarray(value, dtype=np.float32)
+
+
+def upsert_courses(courses, update_fields):
+    """
+    kmooc_id 기준 upsert -> (생성 수, 수정 수, [(kmooc_id, 에러), ...])
+    - update_fields: 이미 있는 강좌에서 덮어쓸 필드 (updated_at은 자동 포함)
+    - 같은 chunk 안에 kmooc_id가 중복되면 마지막 항목만 사용
+      (한 INSERT ... ON CONFLICT 문은 같은 행을 두 번 갱신할 수 없고, 생성/수정 수도 실제 행 수와 맞춤)
+    """
+    courses = list({course.kmooc_id: course for course in courses}.values())
+    if 'name' in update_fields or 'professor' in update_fields:
+        update_fields = [*update_fields, 'series_key']
+    for course in courses:
+        course.series_key = Course.build_series_key(course.name, course.professor)
+
+    existing = set(
+        Course.objects.filter(kmooc_id__in=[course.kmooc_id for course in courses])
+        .values_list('kmooc_id', flat=True)
+    )
+
+    errors = []
+    try:
+        _bulk_upsert(courses, update_fields)
+    except Exception:
+        # chunk 단위 실패 -> 행 단위로 다시 시도
+        succeeded = []
+        for course in courses:
+            try:
+                _bulk_upsert([course], update_fields)
+                succeeded.append(course)
+            except Exception as e:
+                errors.append((course.kmooc_id, e))
+        courses = succeeded
+
+    created = sum(1 for course in courses if course.kmooc_id not in existing)
+    return created, len(courses) - created, errors
+
+
+def _bulk_upsert(courses, update_fields):
+    with transaction.atomic():
+        Course.objects.bulk_create(
+            courses,
+            update_conflicts=True,
+            unique_fields=['kmooc_id'],
+            update_fields=[*update_fields, 'updated_at'],
+        )
+        CourseSyncOutbox.enqueue([course.pk for course in courses if course.pk])
+
+
+def sha256_file(path, block_size=1 << 20):
+    """파일 sha256 (백업 무결성 확인용, block_size씩 읽음)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,196 @@
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from apps.courses.embedding_profile import (
+    FULL_DIMENSIONS, SUPPORTED_DIMENSIONS, es_vector_index_type, serving_dimensions, to_serving_vector, truncate_vector,
+)
+from apps.courses.es_index import ES_INDEX, get_es_client
+from apps.courses.models import Course
+from apps.courses.vector_index import course_vector_index
+
+PRECISIONS = ('float32', 'float16', 'int8')
+BYTES_PER_VALUE = {'float32': 4, 'float16': 2, 'int8': 1}
+
+
+class Command(BaseCommand):
+    help = '임베딩 저장 프로파일(차원 x 정밀도)별 recall@k / 탐색 지연 시간을 원본(1536 float32) 대비 측정합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--queries',
+            type=int,
+            default=200,
+            help='질의로 사용할 강좌 수 (대표 강좌 중 무작위, default: 200)'
+        )
+        parser.add_argument(
+            '--k',
+            type=int,
+            default=10,
+            help='recall 계산 기준 top-k (default: 10)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='질의 표본 난수 시드 (default: 42)'
+        )
+        parser.add_argument(
+            '--live',
+            action='store_true',
+            help='현재 설정된 검색 백엔드(VECTOR_SEARCH_BACKEND)에 실제 kNN 질의를 보내 recall/지연 시간도 측정'
+        )
+
+    def handle(self, *args, **options):
+        """
+        [설계 의도]
+        - 차원 축소/양자화로 줄어드는 메모리 대비 검색 품질이 얼마나 떨어지는지 숫자로 확인 후 프로파일 선택
+
+        [처리 흐름]
+        1. 임베딩이 있는 대표 강좌 전체를 float32 행렬로 로드 + L2 정규화 (원본 기준)
+        2. 질의 강좌를 무작위 추출 -> 원본으로 정확한 top-k 계산 (기준 정답, 자기 자신 제외)
+        3. 프로파일(차원 512/768/1536 x 정밀도 float32/float16/int8)별로
+           - 차원 축소(앞부분 + 재정규화) -> 정밀도 변환(float16 캐스팅 / int8 스칼라 양자화 후 복원)
+           - 전수 탐색 top-k와 기준 정답의 겹침 비율(recall@k), 질의당 전수 탐색 시간, 벡터 메모리 계산
+        4. --live: 실제 백엔드(ES / pgvector / mmap)에 같은 질의를 보내 현재 프로파일의 recall/지연 시간 측정
+
+        [상세 고려사항]
+        - 3의 recall은 근사 탐색(HNSW) 오차를 제외한 "표현 손실"만 반영 -> 실제 인덱스 값은 --live로 확인
+        - int8 양자화는 ES int8_hnsw와 같은 방식(전체 값의 분위수 구간을 0~127로 선형 매핑)으로 근사
+        """
+        k = options['k']
+
+        # 1. 원본 로드
+        rows = list(
+            Course.objects.canonical()
+            .filter(embedding__isnull=False)
+            .order_by('id')
+            .values_list('id', 'embedding')
+        )
+        if len(rows) <= k:
+            raise CommandError(f'임베딩이 있는 대표 강좌가 k({k})개보다 많아야 합니다. (현재 {len(rows)}개)')
+
+        ids = np.asarray([row[0] for row in rows], dtype=np.int64)
+        base = truncate_vector(np.asarray([row[1] for row in rows], dtype=np.float32), FULL_DIMENSIONS)
+        base /= np.maximum(np.linalg.norm(base, axis=1, keepdims=True), 1e-12)
+
+        # 2. 질의 표본 + 기준 정답
+        rng = np.random.default_rng(options['seed'])
+        query_rows = rng.choice(len(rows), size=min(options['queries'], len(rows)), replace=False)
+        baseline = self._top_k(base, base[query_rows], query_rows, k)
+        self.stdout.write(
+            f'강좌 {len(rows)}개, 질의 {len(query_rows)}개, recall@{k} 기준: 1536차원 float32 전수 탐색\n'
+        )
+
+        # 3. 프로파일별 측정
+        header = f"{'dims':>5} {'precision':>9} {'recall@' + str(k):>10} {'scan p50 ms':>12} {'scan p95 ms':>12} {'bytes/vec':>10} {'total MB':>9}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for dims in sorted(SUPPORTED_DIMENSIONS, reverse=True):
+            truncated = truncate_vector(base, dims)
+            queries = truncated[query_rows]
+            for precision in PRECISIONS:
+                stored = self._quantize(truncated, precision)
+                results = self._top_k(stored, queries, query_rows, k)
+                recall = self._recall(results, baseline)
+                p50, p95 = self._scan_latency(stored, queries, k)
+                bytes_per_vector = dims * BYTES_PER_VALUE[precision]
+                self.stdout.write(
+                    f'{dims:>5} {precision:>9} {recall:>10.4f} {p50:>12.2f} {p95:>12.2f} '
+                    f'{bytes_per_vector:>10} {bytes_per_vector * len(rows) / (1024 * 1024):>9.1f}'
+                )
+
+        # 4. 실제 백엔드
+        if options['live']:
+            self._benchmark_live(ids, base, query_rows, baseline, k)
+
+    # ---- 프로파일 시뮬레이션 ----
+
+    def _quantize(self, matrix, precision):
+        """정밀도 변환 후 float32로 복원한 행렬 (양자화 오차가 반영된 값)"""
+        if precision == 'float16':
+            return matrix.astype(np.float16).astype(np.float32)
+        if precision == 'int8':
+            # 전체 값 분포의 양 끝(1/(dims+1))을 잘라낸 구간을 0~127로 선형 매핑 (ES int8_hnsw 기본 신뢰 구간)
+            tail = 1.0 / (matrix.shape[1] + 1)
+            low, high = np.quantile(matrix, [tail, 1.0 - tail])
+            scale = (high - low) / 127.0
+            codes = np.rint((np.clip(matrix, low, high) - low) / scale).astype(np.int8)
+            return codes.astype(np.float32) * scale + low
+        return matrix
+
+    def _top_k(self, matrix, queries, query_rows, k):
+        """질의별 전수 탐색 top-k 행 번호 (자기 자신 제외)"""
+        scores = queries @ matrix.T
+        scores[np.arange(len(query_rows)), query_rows] = -np.inf
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        return [set(row) for row in top]
+
+    def _recall(self, results, baseline):
+        return float(np.mean([len(result & truth) / len(truth) for result, truth in zip(results, baseline)]))
+
+    def _scan_latency(self, matrix, queries, k):
+        """질의 1개당 전수 탐색(행렬-벡터 곱 + top-k) 시간 p50/p95 (ms)"""
+        timings = []
+        for query in queries:
+            started = time.perf_counter()
+            scores = matrix @ query
+            np.argpartition(-scores, k - 1)[:k]
+            timings.append((time.perf_counter() - started) * 1000)
+        return float(np.percentile(timings, 50)), float(np.percentile(timings, 95))
+
+    # ---- 실제 백엔드 ----
+
+    def _benchmark_live(self, ids, base, query_rows, baseline, k):
+        backend = settings.VECTOR_SEARCH_BACKEND
+        self.stdout.write(
+            f'\n[live] backend={backend}, EMBEDDING_DIMENSIONS={serving_dimensions()}, '
+            f'ES_VECTOR_INDEX_TYPE={es_vector_index_type()}, PGVECTOR_HALFVEC={settings.PGVECTOR_HALFVEC}'
+        )
+        row_by_id = {int(course_id): row for row, course_id in enumerate(ids)}
+        es = get_es_client() if backend not in ('pgvector', 'mmap') else None
+        if backend == 'mmap' and course_vector_index.version is None:
+            raise CommandError('mmap 벡터 인덱스가 없습니다. export_vector_index를 먼저 실행하세요.')
+
+        results, timings, failed = [], [], 0
+        for row, truth in zip(query_rows, baseline):
+            vector = base[row]
+            started = time.perf_counter()
+            try:
+                hit_ids = self._live_search(backend, es, vector, k + 1)
+            except Exception as e:
+                failed += 1
+                self.stdout.write(self.style.ERROR(f'질의 실패 (course_id: {ids[row]}): {e}'))
+                continue
+            timings.append((time.perf_counter() - started) * 1000)
+            hit_rows = [row_by_id[course_id] for course_id in hit_ids if course_id in row_by_id and course_id != ids[row]]
+            results.append((set(hit_rows[:k]), truth))
+
+        if not results:
+            raise CommandError('성공한 live 질의가 없습니다.')
+        recall = float(np.mean([len(result & truth) / len(truth) for result, truth in results]))
+        self.stdout.write(self.style.SUCCESS(
+            f'[live] recall@{k} {recall:.4f}, latency p50 {np.percentile(timings, 50):.2f}ms / '
+            f'p95 {np.percentile(timings, 95):.2f}ms' + (f', 실패 {failed}개' if failed else '')
+        ))
+
+    def _live_search(self, backend, es, vector, size):
+        """뷰와 같은 경로로 kNN 질의 -> 강좌 id 목록 (유사도 순)"""
+        if backend == 'pgvector':
+            return [course.id for course in Course.objects.canonical().knn(vector, size)]
+        if backend == 'mmap':
+            return [course_id for course_id, _ in course_vector_index.search(vector, k=size)]
+        res = es.search(
+            index=ES_INDEX,
+            knn={
+                "field": "embedding",
+                "query_vector": to_serving_vector(vector).tolist(),
+                "k": size,
+                "num_candidates": 500,
+                "filter": [{"term": {"is_canonical": True}}],
+            },
+            size=size,
+            source=["id"],
+        )
+        return [int(hit["_source"]["id"]) for hit in res["hits"]["hits"]]
@@ -0,0 +1,109 @@
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from apps.courses.models import Course, CourseNeighbor
+
+
+class Command(BaseCommand):
+    help = '강좌 임베딩으로 강좌별 유사 강좌 top-K를 계산하여 CourseNeighbor 테이블에 저장합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=10,
+            help='강좌별로 저장할 유사 강좌 수 (default: 10)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1024,
+            help='한 번의 행렬 곱으로 처리할 기준 강좌 수 (default: 1024)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        [설계 의도]
+        - 모든 강좌의 유사 강좌를 NumPy 행렬 곱으로 한 번에 계산 (요청 시점 kNN 제거)
+
+        [처리 흐름]
+        1. 임베딩이 있는 전체 강좌(기준)와 대표 강좌(후보)를 각각 행렬로 로드 후 L2 정규화
+        2. batch_size개 기준 강좌씩 (기준 x 후보) 코사인 유사도 행렬 계산
+        3. 같은 시리즈(series_key) 후보는 -inf로 마스킹 (자기 자신/다른 기수 제외)
+        4. argpartition으로 top-K 추출 후 정렬
+        5. 기존 테이블을 한 트랜잭션 안에서 교체 (조회 중인 요청은 커밋 전까지 기존 결과 사용)
+        """
+        top_k = options['top_k']
+        batch_size = options['batch_size']
+
+        # 1. 임베딩 로드
+        rows = list(
+            Course.objects.filter(embedding__isnull=False)
+            .order_by('id')
+            .values_list('id', 'series_key', 'is_canonical', 'embedding')
+        )
+        if not rows:
+            self.stdout.write(self.style.WARNING('임베딩이 있는 강좌가 없습니다.'))
+            return
+
+        source_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        source_series = np.array([row[1] for row in rows], dtype=object)
+        source_matrix = self._normalize(np.asarray([row[3] for row in rows], dtype=np.float32))
+
+        candidate_mask = np.array([row[2] for row in rows], dtype=bool)
+        candidate_ids = source_ids[candidate_mask]
+        candidate_series = source_series[candidate_mask]
+        candidate_matrix = source_matrix[candidate_mask]
+
+        k = min(top_k, len(candidate_ids))
+        if k == 0:
+            self.stdout.write(self.style.WARNING('대표 강좌(is_canonical) 중 임베딩이 있는 강좌가 없습니다.'))
+            return
+
+        self.stdout.write(
+            f'기준 강좌 {len(source_ids)}개 x 후보(대표 강좌) {len(candidate_ids)}개, top-{k} 계산 시작...'
+        )
+
+        # 2~4. 배치 단위 유사도 계산 및 top-K 추출
+        neighbors = []
+        for start in range(0, len(source_ids), batch_size):
+            end = start + batch_size
+            scores = source_matrix[start:end] @ candidate_matrix.T
+
+            # 같은 시리즈 후보 제외
+            same_series = source_series[start:end, None] == candidate_series[None, :]
+            scores[same_series] = -np.inf
+
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            for row_idx, course_id in enumerate(source_ids[start:end]):
+                rank = 0
+                for candidate_idx, score in zip(top[row_idx], top_scores[row_idx]):
+                    if not np.isfinite(score):
+                        break  # 후보가 모두 같은 시리즈인 경우
+                    rank += 1
+                    neighbors.append(CourseNeighbor(
+                        course_id=int(course_id),
+                        neighbor_id=int(candidate_ids[candidate_idx]),
+                        rank=rank,
+                        score=float(score),
+                    ))
+
+            self.stdout.write(f'  계산 완료: {min(end, len(source_ids))} / {len(source_ids)}')
+
+        # 5. 테이블 교체
+        with transaction.atomic():
+            CourseNeighbor.objects.all().delete()
+            CourseNeighbor.objects.bulk_create(neighbors, batch_size=5000)
+
+        self.stdout.write(self.style.SUCCESS(f'총 {len(neighbors)}개의 유사 강좌를 저장했습니다.'))
+
+    @staticmethod
+    def _normalize(matrix):
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
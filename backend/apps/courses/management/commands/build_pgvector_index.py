@@ -0,0 +1,82 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from apps.courses.embedding_profile import (
+    PGVECTOR_HALFVEC_INDEX_PREFIX, pgvector_halfvec_index_name, pgvector_halfvec_sql, serving_dimensions,
+)
+from apps.courses.models import Course
+
+HALFVEC_MIN_VERSION = (0, 7)    # halfvec / subvector 지원 pgvector 버전
+
+
+class Command(BaseCommand):
+    help = 'pgvector halfvec(float16) 표현식 HNSW 인덱스를 현재 임베딩 프로파일 차원으로 생성합니다. (PGVECTOR_HALFVEC)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='halfvec 인덱스를 모두 삭제하고 종료 (PGVECTOR_HALFVEC=false로 되돌릴 때)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        [설계 의도]
+        - Course.embedding(vector(1536)) 컬럼은 그대로 두고 (subvector(embedding, 1, N))::halfvec(N) 식으로 HNSW 인덱스 생성
+          -> 인덱스 크기 1/2 (float16), 차원 축소 시 추가로 N/1536
+        - 차원이 설정에 따라 바뀌므로 마이그레이션이 아닌 커맨드로 관리 (migrations의 idx_course_embedding_hnsw는 유지)
+
+        [처리 흐름]
+        1. pgvector 확장 버전 확인 (halfvec은 0.7 이상)
+        2. CREATE INDEX CONCURRENTLY로 현재 차원 인덱스 생성 (테이블 쓰기 잠금 없음, 이미 있으면 생략)
+        3. 다른 차원으로 만들어 둔 이전 halfvec 인덱스 삭제
+        """
+        table = Course._meta.db_table
+        existing = self._halfvec_indexes(table)
+
+        if options['drop']:
+            for name in existing:
+                self._drop(name)
+            self.stdout.write(self.style.SUCCESS(f'halfvec 인덱스 {len(existing)}개 삭제 완료'))
+            return
+
+        # 1. 버전 확인
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            row = cursor.fetchone()
+        version = tuple(int(part) for part in row[0].split('.')[:2]) if row else None
+        if version is None or version < HALFVEC_MIN_VERSION:
+            raise CommandError(
+                f"halfvec 인덱스는 pgvector {'.'.join(map(str, HALFVEC_MIN_VERSION))} 이상이 필요합니다. "
+                f"(현재: {row[0] if row else '미설치'})"
+            )
+
+        # 2. 현재 차원 인덱스 생성
+        dims = serving_dimensions()
+        index_name = pgvector_halfvec_index_name(dims)
+        self.stdout.write(f'{index_name} 생성 중... (대표 강좌 대상, 강좌 수에 따라 수 분 소요)')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{index_name}" ON "{table}" '
+                f'USING hnsw (({pgvector_halfvec_sql(dims)}) halfvec_cosine_ops) '
+                f'WITH (m = 16, ef_construction = 64) WHERE is_canonical'
+            )
+
+        # 3. 이전 차원 인덱스 정리
+        for name in existing:
+            if name != index_name:
+                self._drop(name)
+                self.stdout.write(f'이전 인덱스 삭제: {name}')
+
+        self.stdout.write(self.style.SUCCESS(f'완료: {index_name} (PGVECTOR_HALFVEC=true로 설정하면 kNN에 사용)'))
+
+    def _halfvec_indexes(self, table):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE tablename = %s AND indexname LIKE %s",
+                [table, PGVECTOR_HALFVEC_INDEX_PREFIX.replace('_', '\\_') + '%'],
+            )
+            return [name for name, in cursor.fetchall()]
+
+    def _drop(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
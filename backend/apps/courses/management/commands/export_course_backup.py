@@ -0,0 +1,105 @@
+import json
+import os
+import shutil
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from apps.courses.importers import (
+    BACKUP_EMBEDDING_IDS_FILE, BACKUP_EMBEDDINGS_FILE, BACKUP_FORMAT, BACKUP_MANIFEST_FILE,
+    BACKUP_METADATA_FILE, COURSE_METADATA_FIELDS, sha256_file,
+)
+from apps.courses.models import Course
+
+
+class Command(BaseCommand):
+    help = '강좌 메타데이터(NDJSON)와 임베딩(.npy 행렬)을 바이너리 백업으로 내보냅니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--name',
+            type=str,
+            default='courses_backup',
+            help='백업 디렉토리 이름 (data/backups/<name>/, default: courses_backup)'
+        )
+        parser.add_argument(
+            '--dtype',
+            choices=['float32', 'float16'],
+            default='float32',
+            help='임베딩 저장 정밀도 (default: float32, float16은 크기 절반)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        [설계 의도]
+        - JSON 백업(courses_backup.json)은 임베딩을 10진수 문자열로 저장하여 크기가 크고 파싱이 느림
+          -> 메타데이터와 임베딩을 분리하여 임베딩은 원시 float 행렬(.npy) 하나로 저장
+
+        [디렉토리 구조] data/backups/<name>/
+            manifest.json        # 형식, 개수, 차원, dtype, 파일별 sha256
+            courses.ndjson       # 강좌 1개 = 1줄 (kmooc_id + 메타데이터, 임베딩 제외)
+            embeddings.npy       # (임베딩 수, 1536) float32/float16, 메모리 매핑 가능
+            embedding_ids.npy    # (임베딩 수,) kmooc_id 문자열, embeddings.npy 행 순서와 동일
+
+        [처리 흐름]
+        1. 메타데이터를 iterator로 한 건씩 NDJSON에 기록
+        2. 임베딩은 open_memmap으로 디스크의 .npy에 바로 채움 (전체 행렬을 메모리에 만들지 않음)
+        3. 파일별 sha256을 manifest에 기록 (임시 디렉토리에 쓴 뒤 교체하여 덮어쓰기 중 손상 방지)
+        """
+        backup_dir = os.path.join(settings.BASE_DIR.parent, 'data', 'backups', options['name'])
+        tmp_dir = f'{backup_dir}.tmp'
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        # 1. 메타데이터 (NDJSON)
+        course_count = 0
+        with open(os.path.join(tmp_dir, BACKUP_METADATA_FILE), 'w', encoding='utf-8') as f:
+            rows = Course.objects.order_by('id').values('kmooc_id', *COURSE_METADATA_FIELDS)
+            for row in rows.iterator(chunk_size=2000):
+                f.write(json.dumps(row, ensure_ascii=False, cls=DjangoJSONEncoder))
+                f.write('\n')
+                course_count += 1
+        self.stdout.write(f'메타데이터 {course_count}개 기록 완료')
+
+        # 2. 임베딩 (.npy)
+        embedded = Course.objects.filter(embedding__isnull=False).order_by('id')
+        embedding_count = embedded.count()
+        dim = Course._meta.get_field('embedding').dimensions
+        matrix = np.lib.format.open_memmap(
+            os.path.join(tmp_dir, BACKUP_EMBEDDINGS_FILE), mode='w+',
+            dtype=np.dtype(options['dtype']), shape=(embedding_count, dim),
+        )
+        kmooc_ids = []
+        for row_idx, (kmooc_id, embedding) in enumerate(
+            embedded.values_list('kmooc_id', 'embedding')[:embedding_count].iterator(chunk_size=2000)
+        ):
+            matrix[row_idx] = embedding
+            kmooc_ids.append(kmooc_id)
+        matrix.flush()
+        del matrix
+        if len(kmooc_ids) != embedding_count:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise CommandError('내보내는 중 임베딩이 삭제되었습니다. 다시 실행하세요.')
+        np.save(os.path.join(tmp_dir, BACKUP_EMBEDDING_IDS_FILE), np.asarray(kmooc_ids, dtype=str))
+        self.stdout.write(f'임베딩 {embedding_count}개 x {dim}차원 ({options["dtype"]}) 기록 완료')
+
+        # 3. manifest + 교체
+        files = [BACKUP_METADATA_FILE, BACKUP_EMBEDDINGS_FILE, BACKUP_EMBEDDING_IDS_FILE]
+        manifest = {
+            'format': BACKUP_FORMAT,
+            'created_at': timezone.now().isoformat(),
+            'course_count': course_count,
+            'embedding_count': embedding_count,
+            'dim': dim,
+            'dtype': options['dtype'],
+            'sha256': {name: sha256_file(os.path.join(tmp_dir, name)) for name in files},
+        }
+        with open(os.path.join(tmp_dir, BACKUP_MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        shutil.rmtree(backup_dir, ignore_errors=True)
+        os.replace(tmp_dir, backup_dir)
+
+        size_mb = sum(os.path.getsize(os.path.join(backup_dir, name)) for name in files) / (1024 * 1024)
+        self.stdout.write(self.style.SUCCESS(f'백업 완료: {backup_dir} ({size_mb:.1f}MB)'))
@@ -0,0 +1,110 @@
+import json
+import os
+import shutil
+import uuid
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from apps.courses.embedding_profile import serving_dimensions, truncate_vector
+from apps.courses.models import Course
+from apps.courses.vector_index import CURRENT_FILE, MANIFEST_FILE, NO_CODE, read_current_version
+
+
+class Command(BaseCommand):
+    help = '대표 강좌 임베딩을 메모리 매핑용 벡터 인덱스(.npy)로 내보냅니다. (VECTOR_SEARCH_BACKEND=mmap)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output-dir',
+            type=str,
+            default=None,
+            help='인덱스 디렉토리 (default: settings.VECTOR_INDEX_DIR)'
+        )
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=2,
+            help='보관할 이전 버전 수 (현재 버전 포함, default: 2)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        [처리 흐름]
+        1. 임베딩이 있는 대표 강좌(is_canonical) 로드 -> float32 행렬 (EMBEDDING_DIMENSIONS로 자름) + L2 정규화
+        2. 대분류/중분류를 정수 코드로 변환 (분류 필터 마스크용)
+        3. 임시 디렉토리에 .npy/manifest 저장 후 버전 디렉토리로 rename (원자적, 저장 중인 디렉토리는 버전 목록에 보이지 않음)
+        4. CURRENT 파일을 원자적으로 교체 -> 실행 중인 워커가 다음 확인 주기에 새 버전 로드
+        5. 오래된 버전 정리 (교체 직후 읽고 있는 워커를 위해 keep개 보관)
+        """
+        index_dir = options['output_dir'] or settings.VECTOR_INDEX_DIR
+        os.makedirs(index_dir, exist_ok=True)
+
+        # 1. 임베딩 로드
+        rows = list(
+            Course.objects.canonical()
+            .filter(embedding__isnull=False)
+            .order_by('id')
+            .values_list('id', 'classfy_name', 'middle_classfy_name', 'embedding')
+        )
+        if not rows:
+            self.stdout.write(self.style.WARNING('임베딩이 있는 대표 강좌가 없습니다.'))
+            return
+
+        # 임베딩 저장 프로파일 차원으로 자름 (Matryoshka, 1536이면 그대로)
+        embeddings = truncate_vector(np.asarray([row[3] for row in rows], dtype=np.float32), serving_dimensions())
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embeddings /= norms
+
+        # 2. 분류 코드화
+        classfy_vocab = sorted({row[1] for row in rows if row[1]})
+        middle_vocab = sorted({row[2] for row in rows if row[2]})
+        classfy_codes = {name: code for code, name in enumerate(classfy_vocab)}
+        middle_codes = {name: code for code, name in enumerate(middle_vocab)}
+
+        # 3. 새 버전 저장
+        # - 버전 이름: 마이크로초 시각 + 무작위 접미사 (cron과 수동 실행이 같은 초에 겹쳐도 충돌하지 않음, 이름순 = 생성순)
+        version = f"{timezone.now().strftime('v%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:6]}"
+        version_dir = os.path.join(index_dir, version)
+        tmp_dir = os.path.join(index_dir, f'.tmp-{version}')
+        os.makedirs(tmp_dir)
+
+        np.save(os.path.join(tmp_dir, 'embeddings.npy'), embeddings)
+        np.save(os.path.join(tmp_dir, 'ids.npy'), np.asarray([row[0] for row in rows], dtype=np.int64))
+        np.save(os.path.join(tmp_dir, 'classfy.npy'),
+                np.asarray([classfy_codes.get(row[1], NO_CODE) for row in rows], dtype=np.int16))
+        np.save(os.path.join(tmp_dir, 'middle.npy'),
+                np.asarray([middle_codes.get(row[2], NO_CODE) for row in rows], dtype=np.int16))
+
+        manifest = {
+            'version': version,
+            'count': len(rows),
+            'dim': int(embeddings.shape[1]),
+            'created_at': timezone.now().isoformat(),
+            'classfy_vocab': classfy_vocab,
+            'middle_vocab': middle_vocab,
+        }
+        with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.rename(tmp_dir, version_dir)
+
+        # 4. CURRENT 원자적 교체 (임시 파일도 버전별 이름 -> 동시 실행 시 서로 덮어쓰지 않음)
+        previous = read_current_version(index_dir)
+        tmp_path = os.path.join(index_dir, f'{CURRENT_FILE}.{version}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(version)
+        os.replace(tmp_path, os.path.join(index_dir, CURRENT_FILE))
+
+        # 5. 오래된 버전 정리
+        versions = sorted(name for name in os.listdir(index_dir) if name.startswith('v'))
+        for old_version in versions[:-options['keep']] if options['keep'] > 0 else []:
+            if old_version != version:
+                shutil.rmtree(os.path.join(index_dir, old_version), ignore_errors=True)
+
+        size_mb = embeddings.nbytes / (1024 * 1024)
+        self.stdout.write(self.style.SUCCESS(
+            f'벡터 인덱스 {version} 생성 완료: {len(rows)}개 x {embeddings.shape[1]}차원 ({size_mb:.1f}MB)'
+            + (f' (이전 버전: {previous})' if previous else '')
+        ))
@@ -0,0 +1,158 @@
+import json
+import os
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from apps.courses.caches import (
+    invalidate_course_detail,
+    invalidate_course_facets,
+    invalidate_course_list,
+    invalidate_course_suggest,
+)
+from apps.courses.importers import (
+    BACKUP_EMBEDDING_IDS_FILE, BACKUP_EMBEDDINGS_FILE, BACKUP_FORMAT, BACKUP_MANIFEST_FILE,
+    BACKUP_METADATA_FILE, COURSE_DATE_FIELDS, COURSE_METADATA_FIELDS, IMPORT_CHUNK_SIZE,
+    sha256_file, upsert_courses,
+)
+from apps.courses.models import Course, CourseSyncOutbox
+
+
+class Command(BaseCommand):
+    help = 'export_course_backup으로 만든 바이너리 백업(NDJSON + .npy)을 DB로 복원합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--name',
+            type=str,
+            default='courses_backup',
+            help='백업 디렉토리 이름 (data/backups/<name>/, default: courses_backup)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help=f'upsert/bulk_update 1회당 강좌 수 (default: {IMPORT_CHUNK_SIZE})'
+        )
+        parser.add_argument(
+            '--embeddings-only',
+            action='store_true',
+            help='메타데이터는 건너뛰고 임베딩만 복원 (이미 있는 강좌 대상)'
+        )
+        parser.add_argument(
+            '--skip-verify',
+            action='store_true',
+            help='sha256 검증 생략'
+        )
+
+    def handle(self, *args, **options):
+        """
+        [처리 흐름]
+        1. manifest 확인 + 파일별 sha256 검증 (손상된 백업으로 DB를 덮어쓰지 않도록 가장 먼저 수행)
+        2. 메타데이터: NDJSON을 한 줄씩 읽어 chunk 단위 upsert (importers.upsert_courses)
+        3. 임베딩: .npy 행렬을 mmap으로 한 번에 로드 -> kmooc_id로 Course.id 매핑(쿼리 1번)
+           -> chunk 단위 bulk_update(['embedding', 'updated_at']) + ES 동기화 outbox 기록
+        4. 대표 강좌 갱신 + 목록 캐시 무효화
+        """
+        backup_dir = os.path.join(settings.BASE_DIR.parent, 'data', 'backups', options['name'])
+        manifest_path = os.path.join(backup_dir, BACKUP_MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            raise CommandError(f'백업을 찾을 수 없습니다: {manifest_path}')
+
+        # 1. manifest / 체크섬 검증
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format') != BACKUP_FORMAT:
+            raise CommandError(f"지원하지 않는 백업 형식입니다: {manifest.get('format')}")
+
+        if not options['skip_verify']:
+            for name, expected in manifest['sha256'].items():
+                if sha256_file(os.path.join(backup_dir, name)) != expected:
+                    raise CommandError(f'체크섬 불일치: {name} (백업 파일이 손상되었습니다)')
+            self.stdout.write('체크섬 검증 완료')
+
+        # 2. 메타데이터
+        if not options['embeddings_only']:
+            self._import_metadata(os.path.join(backup_dir, BACKUP_METADATA_FILE), options['chunk_size'])
+
+        # 3. 임베딩
+        self._import_embeddings(backup_dir, manifest, options['chunk_size'])
+
+        # 4. 후처리
+        promoted, demoted = Course.objects.refresh_canonical()
+        invalidate_course_list()
+        invalidate_course_detail()
+        invalidate_course_facets()
+        invalidate_course_suggest()
+        self.stdout.write(self.style.SUCCESS(f'복원 완료 (대표 강좌 갱신 +{promoted}, -{demoted})'))
+
+    def _import_metadata(self, path, chunk_size):
+        created_count = updated_count = failed_count = 0
+        chunk = []
+
+        def flush(chunk):
+            nonlocal created_count, updated_count, failed_count
+            created, updated, errors = upsert_courses(chunk, COURSE_METADATA_FIELDS)
+            created_count += created
+            updated_count += updated
+            failed_count += len(errors)
+            for kmooc_id, error in errors:
+                self.stdout.write(self.style.ERROR(f'메타데이터 복원 실패 (kmooc_id: {kmooc_id}): {error}'))
+            self.stdout.write(
+                f'메타데이터 {created_count + updated_count}개 처리... '
+                f'(chunk: 생성 {created}, 수정 {updated}, 실패 {len(errors)})'
+            )
+
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                for field in COURSE_DATE_FIELDS:
+                    row[field] = parse_date(row[field]) if row.get(field) else None
+                chunk.append(Course(kmooc_id=row['kmooc_id'], **{field: row.get(field) for field in COURSE_METADATA_FIELDS}))
+                if len(chunk) >= chunk_size:
+                    flush(chunk)
+                    chunk = []
+        if chunk:
+            flush(chunk)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'메타데이터 복원: 생성 {created_count}, 수정 {updated_count}' + (f', 실패 {failed_count}' if failed_count else '')
+        ))
+
+    def _import_embeddings(self, backup_dir, manifest, chunk_size):
+        matrix = np.load(os.path.join(backup_dir, BACKUP_EMBEDDINGS_FILE), mmap_mode='r')
+        kmooc_ids = np.load(os.path.join(backup_dir, BACKUP_EMBEDDING_IDS_FILE))
+        if matrix.shape != (manifest['embedding_count'], manifest['dim']) or len(kmooc_ids) != matrix.shape[0]:
+            raise CommandError('임베딩 행렬과 manifest/kmooc_id 목록의 크기가 일치하지 않습니다.')
+
+        id_map = dict(Course.objects.filter(kmooc_id__in=kmooc_ids.tolist()).values_list('kmooc_id', 'id'))
+        rows = [(row_idx, id_map[kmooc_id]) for row_idx, kmooc_id in enumerate(kmooc_ids.tolist()) if kmooc_id in id_map]
+        missing = len(kmooc_ids) - len(rows)
+
+        restored = 0
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            # float16 백업도 float32로 변환하여 저장 (chunk 단위 벡터화 변환)
+            vectors = np.asarray(matrix[[row_idx for row_idx, _ in chunk]], dtype=np.float32)
+            now = timezone.now()
+            with transaction.atomic():
+                Course.objects.bulk_update(
+                    [
+                        Course(id=course_id, embedding=vector, updated_at=now)
+                        for (_, course_id), vector in zip(chunk, vectors)
+                    ],
+                    ['embedding', 'updated_at'],
+                )
+                CourseSyncOutbox.enqueue([course_id for _, course_id in chunk])
+            restored += len(chunk)
+            self.stdout.write(f'임베딩 {restored} / {len(rows)} 복원...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'임베딩 복원: {restored}개 ({manifest["dtype"]})'
+            + (f', DB에 없는 강좌 {missing}개 제외' if missing else '')
+        ))
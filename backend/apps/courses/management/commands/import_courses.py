@@ -1,9 +1,16 @@
-import json
 import os
-import ast
 from datetime import datetime
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from apps.courses.caches import (
+    invalidate_course_detail,
+    invalidate_course_facets,
+    invalidate_course_list,
+    invalidate_course_suggest,
+)
+from apps.courses.importers import (
+    COURSE_METADATA_FIELDS, IMPORT_CHUNK_SIZE, iter_json_array, parse_embedding, upsert_courses,
+)
 from apps.courses.models import Course
 
 
@@ -22,6 +29,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing courses before import (WARNING: deletes all existing data)'
         )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help=f'Number of courses per bulk upsert (default: {IMPORT_CHUNK_SIZE})'
+        )
 
     def handle(self, *args, **options):
         input_filename = options['input']
@@ -54,12 +67,8 @@ class Command(BaseCommand):
                     self.stdout.write(self.style.ERROR('Import cancelled.'))
                     return
 
-        # JSON 파일 읽기
-        with open(input_path, 'r', encoding='utf-8') as f:
-            import_data = json.load(f)
-
-        total_count = len(import_data)
-        self.stdout.write(f'Found {total_count} courses in backup file...')
+        # JSON 파일을 한 건씩 읽으며 chunk 단위 upsert (전체를 메모리에 올리지 않음)
+        self.stdout.write(f'Streaming courses from backup file (chunk size: {options["chunk_size"]})...')
 
         # 날짜/시간 파싱 헬퍼 함수
         def parse_date(date_str):
@@ -74,12 +83,26 @@ class Command(BaseCommand):
         created_count = 0
         updated_count = 0
         skipped_count = 0
-
-        for idx, course_data in enumerate(import_data, 1):
+        chunk = []
+
+        def flush(chunk):
+            nonlocal created_count, updated_count, skipped_count
+            created, updated, errors = upsert_courses(chunk, COURSE_METADATA_FIELDS + ['embedding'])
+            created_count += created
+            updated_count += updated
+            skipped_count += len(errors)
+            for kmooc_id, error in errors:
+                self.stdout.write(self.style.ERROR(f'Error processing course (kmooc_id: {kmooc_id}): {error}'))
+            self.stdout.write(
+                f'Processed {created_count + updated_count} courses... '
+                f'(chunk: created {created}, updated {updated}, failed {len(errors)})'
+            )
+
+        for idx, course_data in enumerate(iter_json_array(input_path), 1):
             try:
                 # Django dumpdata 형식은 실제 데이터가 'fields' 키 안에 있음
                 fields = course_data.get('fields', {})
-                
+
                 # kmooc_id 추출
                 kmooc_id = fields.get('kmooc_id')
                 if not kmooc_id:
@@ -89,59 +112,42 @@ class Command(BaseCommand):
                     skipped_count += 1
                     continue
 
-                # 임베딩 처리 (문자열 형태 "[...]"인 경우 리스트로 변환)
-                embedding = fields.get('embedding')
-                if isinstance(embedding, str):
-                    try:
-                        embedding = ast.literal_eval(embedding)
-                    except (ValueError, SyntaxError):
-                        self.stdout.write(self.style.ERROR(f'Failed to parse embedding for {kmooc_id}'))
-                        embedding = None
+                # 임베딩 처리 (문자열 형태 "[...]"는 json으로 파싱 -> float32 배열)
+                try:
+                    embedding = parse_embedding(fields.get('embedding'))
+                except (ValueError, TypeError):
+                    self.stdout.write(self.style.ERROR(f'Failed to parse embedding for {kmooc_id}'))
+                    embedding = None
 
-                if embedding and isinstance(embedding, list) and len(embedding) != 1536:
+                if embedding is not None and embedding.shape != (1536,):
                     self.stdout.write(
                         self.style.WARNING(
-                            f'Warning: Course {kmooc_id} has embedding with {len(embedding)} dimensions'
+                            f'Warning: Course {kmooc_id} has embedding with {embedding.size} dimensions'
                         )
                     )
 
                 # Course 데이터 매핑 (fields에서 데이터 추출)
-                course_fields = {
-                    'name': fields.get('name', ''),
-                    'content_key': fields.get('content_key'),
-                    'professor': fields.get('professor'),
-                    'org_name': fields.get('org_name'),
-                    'certificate_yn': fields.get('certificate_yn'),
-                    'classfy_name': fields.get('classfy_name'),
-                    'middle_classfy_name': fields.get('middle_classfy_name'),
-                    'summary': fields.get('summary'),
-                    'raw_summary': fields.get('raw_summary'), # 추가됨
-                    'url': fields.get('url'),
-                    'course_image': fields.get('course_image'),
-                    'enrollment_start': parse_date(fields.get('enrollment_start')),
-                    'enrollment_end': parse_date(fields.get('enrollment_end')),
-                    'study_start': parse_date(fields.get('study_start')),
-                    'study_end': parse_date(fields.get('study_end')),
-                    'week': fields.get('week'),
-                    'course_playtime': fields.get('course_playtime'),
-                    'embedding': embedding,
-                }
-
-                # kmooc_id 기준으로 업데이트 또는 생성
-                obj, created = Course.objects.update_or_create(
+                chunk.append(Course(
                     kmooc_id=kmooc_id,
-                    defaults=course_fields
-                )
-
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-
-                if (created_count + updated_count) % 100 == 0:
-                    self.stdout.write(
-                        f'Processed {created_count + updated_count}/{total_count} courses...'
-                    )
+                    name=fields.get('name', ''),
+                    content_key=fields.get('content_key'),
+                    professor=fields.get('professor'),
+                    org_name=fields.get('org_name'),
+                    certificate_yn=fields.get('certificate_yn'),
+                    classfy_name=fields.get('classfy_name'),
+                    middle_classfy_name=fields.get('middle_classfy_name'),
+                    summary=fields.get('summary'),
+                    raw_summary=fields.get('raw_summary'),
+                    url=fields.get('url'),
+                    course_image=fields.get('course_image'),
+                    enrollment_start=parse_date(fields.get('enrollment_start')),
+                    enrollment_end=parse_date(fields.get('enrollment_end')),
+                    study_start=parse_date(fields.get('study_start')),
+                    study_end=parse_date(fields.get('study_end')),
+                    week=fields.get('week'),
+                    course_playtime=fields.get('course_playtime'),
+                    embedding=embedding,
+                ))
 
             except Exception as e:
                 skipped_count += 1
@@ -150,9 +156,26 @@ class Command(BaseCommand):
                         f'Error processing entry {idx} (kmooc_id: {course_data.get("fields", {}).get("kmooc_id")}): {e}'
                     )
                 )
+                continue
+
+            if len(chunk) >= options['chunk_size']:
+                flush(chunk)
+                chunk = []
+
+        if chunk:
+            flush(chunk)
+
+        # 같은 강좌(이름+교수)의 여러 기수 중 최신 강좌를 대표 강좌로 표시 (목록/검색 중복 제거용)
+        promoted, demoted = Course.objects.refresh_canonical()
+        # bulk upsert는 signal을 발생시키지 않으므로 목록/상세 캐시를 직접 무효화
+        invalidate_course_list()
+        invalidate_course_detail()
+        invalidate_course_facets()
+        invalidate_course_suggest()
 
         self.stdout.write(self.style.SUCCESS(f'\nImport completed!'))
         self.stdout.write(self.style.SUCCESS(f'Created: {created_count}'))
         self.stdout.write(self.style.SUCCESS(f'Updated: {updated_count}'))
+        self.stdout.write(self.style.SUCCESS(f'Canonical courses refreshed (+{promoted}, -{demoted})'))
         if skipped_count > 0:
             self.stdout.write(self.style.WARNING(f'Skipped: {skipped_count}'))
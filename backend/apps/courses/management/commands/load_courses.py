@@ -4,15 +4,52 @@ import sys
 from datetime import datetime
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from apps.courses.caches import (
+    invalidate_course_detail,
+    invalidate_course_facets,
+    invalidate_course_list,
+    invalidate_course_suggest,
+)
+from apps.courses.importers import IMPORT_CHUNK_SIZE, upsert_courses
 from apps.courses.models import Course
 
 # CSV 필드 크기 제한 해제 (raw_summary 등 긴 텍스트 처리용)
 csv.field_size_limit(sys.maxsize)
 
+
+def parse_date(date_str):
+    # 날짜 파싱 헬퍼 함수
+    if not date_str or date_str.strip() == '':
+        return None
+    try:
+        # 다양한 날짜 형식 대응 가능하도록 수정 가능 (현재 YYYY-MM-DD 가정)
+        return datetime.strptime(date_str, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def parse_float(num_str):
+    # 숫자 파싱 헬퍼 함수
+    if not num_str or num_str.strip() == '':
+        return None
+    try:
+        return float(num_str)
+    except ValueError:
+        return None
+
+
 class Command(BaseCommand):
     help = 'Import KMOOC courses from CSV file'
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help=f'Number of CSV rows per bulk upsert (default: {IMPORT_CHUNK_SIZE})'
+        )
+
+    def handle(self, *args, **options):
         # CSV 파일 경로 (프로젝트 루트 기준 data/backups/kmooc_processed_data.csv)
         base_dir = settings.BASE_DIR  # backend/
         project_root = base_dir.parent # project-moduway/
@@ -24,73 +61,75 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS(f'Reading CSV from: {csv_path}'))
 
+        # 행 단위로 읽으며 chunk 단위 upsert
+        # - 새 강좌는 생성, 이미 있는 강좌는 raw_summary가 비어있는 경우에만 raw_summary 업데이트 (기존 정책 유지)
         with open(csv_path, 'r', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f)
-            count = 0
-            created_count = 0
-            updated_count = 0
-            
+            self.count = 0
+            self.created_count = 0
+            self.updated_count = 0
+            chunk = []
+
             for row in reader:
                 try:
-                    # 날짜 파싱 헬퍼 함수
-                    def parse_date(date_str):
-                        if not date_str or date_str.strip() == '':
-                            return None
-                        try:
-                            # 다양한 날짜 형식 대응 가능하도록 수정 가능 (현재 YYYY-MM-DD 가정)
-                            return datetime.strptime(date_str, '%Y-%m-%d').date()
-                        except ValueError:
-                            return None
-
-                    # 숫자 파싱 헬퍼 함수
-                    def parse_float(num_str):
-                        if not num_str or num_str.strip() == '':
-                            return None
-                        try:
-                            return float(num_str)
-                        except ValueError:
-                            return None
-
-                    course_data = {
-                        'name': row['name'],
-                        'content_key': row.get('content_key'),
-                        'professor': row.get('professor'),
-                        'org_name': row.get('org_name'),
-                        'classfy_name': row.get('classfy_name'),
-                        'middle_classfy_name': row.get('middle_classfy_name'),
-                        'summary': row.get('summary'),
-                        'raw_summary': row.get('raw_summary'), # 추가됨
-                        'url': row.get('url'),
-                        'course_image': row.get('course_image'),
-                        'enrollment_start': parse_date(row.get('enrollment_start')),
-                        'enrollment_end': parse_date(row.get('enrollment_end')),
-                        'study_start': parse_date(row.get('study_start')),
-                        'study_end': parse_date(row.get('study_end')),
-                        'week': parse_float(row.get('week')),
-                        'course_playtime': parse_float(row.get('course_playtime')),
-                    }
-
-                    # kmooc_id로 기존 객체 확인
-                    kmooc_id = row['id']
-                    course = Course.objects.filter(kmooc_id=kmooc_id).first()
-
-                    if course:
-                        # 이미 존재하면 raw_summary가 비어있는 경우에만 업데이트
-                        if not course.raw_summary:
-                            course.raw_summary = row.get('raw_summary')
-                            course.save(update_fields=['raw_summary'])
-                            updated_count += 1
-                    else:
-                        # 없으면 새로 생성
-                        Course.objects.create(kmooc_id=kmooc_id, **course_data)
-                        created_count += 1
-                    
-                    count += 1
-                    if count % 100 == 0:
-                        self.stdout.write(f'Processed {count} courses...')
-
+                    chunk.append(Course(
+                        kmooc_id=row['id'],
+                        name=row['name'],
+                        content_key=row.get('content_key'),
+                        professor=row.get('professor'),
+                        org_name=row.get('org_name'),
+                        classfy_name=row.get('classfy_name'),
+                        middle_classfy_name=row.get('middle_classfy_name'),
+                        summary=row.get('summary'),
+                        raw_summary=row.get('raw_summary'), # 추가됨
+                        url=row.get('url'),
+                        course_image=row.get('course_image'),
+                        enrollment_start=parse_date(row.get('enrollment_start')),
+                        enrollment_end=parse_date(row.get('enrollment_end')),
+                        study_start=parse_date(row.get('study_start')),
+                        study_end=parse_date(row.get('study_end')),
+                        week=parse_float(row.get('week')),
+                        course_playtime=parse_float(row.get('course_playtime')),
+                    ))
                 except Exception as e:
                     self.stdout.write(self.style.ERROR(f"Error processing row ID {row.get('id')}: {str(e)}"))
+                    continue
+
+                if len(chunk) >= options['chunk_size']:
+                    self._flush(chunk)
+                    chunk = []
+
+            if chunk:
+                self._flush(chunk)
+
+            self.stdout.write(self.style.SUCCESS(f'Successfully processed {self.count} courses.'))
+            self.stdout.write(self.style.SUCCESS(f'Created: {self.created_count}, Updated: {self.updated_count}'))
+
+        # 같은 강좌(이름+교수)의 여러 기수 중 최신 강좌를 대표 강좌로 표시 (목록/검색 중복 제거용)
+        promoted, demoted = Course.objects.refresh_canonical()
+        # bulk upsert는 signal을 발생시키지 않으므로 목록/상세 캐시를 직접 무효화
+        invalidate_course_list()
+        invalidate_course_detail()
+        invalidate_course_facets()
+        invalidate_course_suggest()
+        self.stdout.write(self.style.SUCCESS(f'Canonical courses refreshed (+{promoted}, -{demoted})'))
+
+    def _flush(self, chunk):
+        # raw_summary가 이미 채워진 기존 강좌는 변경하지 않음
+        filled = set(
+            Course.objects.filter(kmooc_id__in=[course.kmooc_id for course in chunk])
+            .exclude(raw_summary__isnull=True).exclude(raw_summary='')
+            .values_list('kmooc_id', flat=True)
+        )
+        targets = [course for course in chunk if course.kmooc_id not in filled]
+
+        created, updated, errors = upsert_courses(targets, ['raw_summary']) if targets else (0, 0, [])
+        for kmooc_id, error in errors:
+            self.stdout.write(self.style.ERROR(f"Error processing row ID {kmooc_id}: {str(error)}"))
 
-            self.stdout.write(self.style.SUCCESS(f'Successfully processed {count} courses.'))
-            self.stdout.write(self.style.SUCCESS(f'Created: {created_count}, Updated: {updated_count}'))
+        self.count += len(chunk) - len(errors)
+        self.created_count += created
+        self.updated_count += updated
+        self.stdout.write(
+            f'Processed {self.count} courses... (chunk: created {created}, updated {updated}, failed {len(errors)})'
+        )
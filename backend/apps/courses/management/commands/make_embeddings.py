@@ -1,106 +1,296 @@
 import os
-import requests
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from django.conf import settings
 from django.core.management.base import BaseCommand
-from apps.courses.models import Course
+from django.db import transaction
+from django.utils import timezone
+from apps.courses.models import Course, CourseSyncOutbox
+from apps.core.utils.http_client import gms_client
+
+try:
+    import tiktoken
+    _ENCODING = tiktoken.get_encoding("cl100k_base")  # text-embedding-3-small 토크나이저
+except ImportError:  # 미설치 시 문자 수 기반 보수적 추정 사용
+    _ENCODING = None
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+MAX_INPUT_TOKENS = 8000          # 입력 1개당 토큰 상한 (API 한도 8191)
+DEFAULT_BATCH_TOKENS = 100000    # 요청 1건당 토큰 합계 상한 (API 한도 300,000 이내로 여유 있게)
+DEFAULT_BATCH_INPUTS = 256       # 요청 1건당 입력 개수 상한 (API 한도 2048)
+CHECKPOINT_FILENAME = 'make_embeddings.checkpoint.json'
+
+STOPWORDS = ['주차', '학교', 'email', '이메일', '수강신청', '이수증', '석사', '박사', '저서',
+             '출판사', '학지사', '퀴즈', '공개', '일시', '주요경력', '전)', '현)', '주제']
+
+
+def count_tokens(text):
+    """
+    토큰 수 계산
+    - tiktoken 설치 시 실제 토크나이저 사용
+    - 미설치 시 한글 등 비ASCII 문자 2토큰, ASCII 문자 0.3토큰으로 보수적으로 추정
+      (기존 기준: 한글 3,000자 ≈ 4,500~5,000 토큰)
+    """
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return int(non_ascii * 2 + (len(text) - non_ascii) * 0.3) + 1
+
+
+def truncate_to_tokens(text, max_tokens):
+    if count_tokens(text) <= max_tokens:
+        return text
+    if _ENCODING is not None:
+        return _ENCODING.decode(_ENCODING.encode(text)[:max_tokens])
+    # 추정치 기준으로 잘라냄 (이진 탐색)
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if count_tokens(text[:mid]) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+def build_embedding_text(course):
+    """강좌 1개의 임베딩 입력 텍스트 생성 (불용어 제거 + Title Boosting)"""
+    name = course.name or ""
+    summary = course.summary or ""
+    category = f"{course.classfy_name or ''} {course.middle_classfy_name or ''}"
+
+    # (1) 불용어 및 노이즈 제거
+    text = f"{category} {summary}"
+    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', text) # 이메일 제거
+    text = re.sub(r'\d{4}[-./]\d{1,2}[-./]\d{1,2}', '', text) # 날짜 제거
+
+    for word in STOPWORDS:
+        text = text.replace(word, '')
+
+    # 특수문자 제거 및 공백 정규화
+    text = re.sub(r'[^\w\s가-힣]', ' ', text)
+    text = " ".join(text.split())
+
+    # (2) 제목 반복 (Title Boosting)
+    boosted_name = (name + " ") * 3
+    combined_text = f"{boosted_name} {text}".strip()
+
+    # (3) 입력 1개당 토큰 한도 보장
+    return truncate_to_tokens(combined_text, MAX_INPUT_TOKENS)
+
 
 class Command(BaseCommand):
     help = "강의 데이터를 전처리 후 배치 방식으로 임베딩을 생성하여 저장합니다."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='임베딩이 있는 강좌까지 전체 재생성 (기본: 임베딩이 없는 강좌만)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='동시 API 요청 수 (default: 4, 공용 HTTP 클라이언트의 batch_embedding 동시성 상한 이내)'
+        )
+        parser.add_argument(
+            '--batch-tokens',
+            type=int,
+            default=DEFAULT_BATCH_TOKENS,
+            help=f'요청 1건당 토큰 합계 상한 (default: {DEFAULT_BATCH_TOKENS})'
+        )
+        parser.add_argument(
+            '--batch-inputs',
+            type=int,
+            default=DEFAULT_BATCH_INPUTS,
+            help=f'요청 1건당 강좌 수 상한 (default: {DEFAULT_BATCH_INPUTS})'
+        )
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='체크포인트를 무시하고 처음부터 실행'
+        )
+
     def handle(self, *args, **options):
+        """
+        [설계 의도]
+        - 전체 카탈로그 재임베딩도 수 분 내에 끝나도록 배치 크기/동시성/DB 쓰기를 최적화
+        - 중단되더라도 체크포인트부터 이어서 실행
+
+        [처리 흐름]
+        1. 대상 강좌를 id 순으로 스트리밍 조회 (iterator, 필요한 컬럼만)
+        2. 토큰 합계/입력 개수 상한까지 채워 배치 구성
+        3. workers개까지 동시에 API 호출 (429/5xx 재시도와 Retry-After 처리는 공용 HTTP 클라이언트가 담당)
+        4. 완료된 배치는 bulk_update(['embedding', 'updated_at'])로 한 번에 저장
+        5. 앞에서부터 연속으로 완료된 배치의 마지막 id를 체크포인트로 기록 (워터마크)
+           -> 재실행 시 체크포인트 이후부터 조회, 실패한 배치는 워터마크를 넘지 못하므로 다시 처리됨
+        """
         # 1. 설정 및 환경 변수
-        GMS_URL = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/embeddings"
+        # - URL/타임아웃/재시도는 공용 HTTP 클라이언트의 batch_embedding 엔드포인트 설정 사용
         GMS_KEY = os.environ.get("GMS_KEY")
-        BATCH_SIZE = 2
 
         if not GMS_KEY:
             self.stdout.write(self.style.ERROR("GMS_KEY가 설정되지 않았습니다."))
             return
 
-        # 2. 임베딩이 필요한 데이터 추출 (embedding이 없는 것만)
-        courses = list(Course.objects.filter(embedding__isnull=True))
-        total_count = len(courses)
+        self.headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {GMS_KEY}"
+        }
+
+        mode = 'all' if options['all'] else 'missing'
+        checkpoint_path = os.path.join(settings.BASE_DIR.parent, 'data', 'backups', CHECKPOINT_FILENAME)
+        last_id = 0 if options['reset'] else self._load_checkpoint(checkpoint_path, mode)
+
+        # 2. 임베딩이 필요한 데이터 조회 (스트리밍)
+        courses = Course.objects.filter(id__gt=last_id)
+        if mode == 'missing':
+            courses = courses.filter(embedding__isnull=True)
+        total_count = courses.count()
 
         if total_count == 0:
             self.stdout.write(self.style.SUCCESS("임베딩할 새로운 데이터가 없습니다."))
+            self._clear_checkpoint(checkpoint_path)
             return
 
-        self.stdout.write(f"총 {total_count}개의 강의 처리를 시작합니다. (Batch Size: {BATCH_SIZE})")
+        courses = courses.order_by('id').only(
+            'id', 'name', 'summary', 'classfy_name', 'middle_classfy_name'
+        ).iterator(chunk_size=2000)
 
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {GMS_KEY}"
-        }
+        resume_note = f", 체크포인트 id {last_id} 이후부터" if last_id else ""
+        self.stdout.write(
+            f"총 {total_count}개의 강의 처리를 시작합니다. "
+            f"(workers={options['workers']}, batch ≤ {options['batch_tokens']} tokens / {options['batch_inputs']}개{resume_note})"
+        )
+
+        # 3~5. 배치 생성 -> 동시 호출 -> 저장 -> 체크포인트
+        batches = self._iter_batches(courses, options['batch_tokens'], options['batch_inputs'])
+        max_in_flight = options['workers'] * 2
+        in_flight = {}          # future -> (seq, batch)
+        finished = {}           # seq -> (batch 마지막 id, 성공 여부)
+        next_seq_to_commit = 0  # 워터마크 계산용 (연속 완료된 배치 seq)
+        watermark = last_id
+        done_count = 0
+        failed_count = 0
+
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            seq = 0
+            exhausted = False
+            while in_flight or not exhausted:
+                # 동시 요청 수 유지 (메모리에 올라가는 배치 수 제한)
+                while not exhausted and len(in_flight) < max_in_flight:
+                    batch = next(batches, None)
+                    if batch is None:
+                        exhausted = True
+                        break
+                    future = executor.submit(self._request_embeddings, [text for _, text in batch])
+                    in_flight[future] = (seq, batch)
+                    seq += 1
+
+                if not in_flight:
+                    break
+
+                completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    batch_seq, batch = in_flight.pop(future)
+                    embeddings, error = future.result()
+                    if embeddings is not None:
+                        # bulk_update는 auto_now/signal을 적용하지 않으므로
+                        # updated_at(push_to_es --since 대상)과 ES 동기화 outbox 기록을 같은 트랜잭션에서 직접 처리
+                        now = timezone.now()
+                        with transaction.atomic():
+                            Course.objects.bulk_update(
+                                [
+                                    Course(id=course_id, embedding=vector, updated_at=now)
+                                    for (course_id, _), vector in zip(batch, embeddings)
+                                ],
+                                ['embedding', 'updated_at'],
+                            )
+                            CourseSyncOutbox.enqueue([course_id for course_id, _ in batch])
+                        done_count += len(batch)
+                        finished[batch_seq] = (batch[-1][0], True)
+                        self.stdout.write(self.style.SUCCESS(f"완료: {done_count} / {total_count}"))
+                    else:
+                        failed_count += len(batch)
+                        finished[batch_seq] = (batch[-1][0], False)
+                        self.stdout.write(self.style.ERROR(f"Batch 실패 (id {batch[0][0]}~{batch[-1][0]}): {error}"))
+
+                # 워터마크 전진: 앞에서부터 연속으로 성공한 배치까지만
+                while next_seq_to_commit in finished and finished[next_seq_to_commit][1]:
+                    watermark = finished.pop(next_seq_to_commit)[0]
+                    next_seq_to_commit += 1
+                self._save_checkpoint(checkpoint_path, mode, watermark)
 
-        # 3. 배치 단위 루프
-        for i in range(0, total_count, BATCH_SIZE):
-            batch_segment = courses[i : i + BATCH_SIZE]
-            processed_texts = []
-            valid_courses = []
-
-            for course in batch_segment:
-                # --- 전처리 로직 시작 ---
-                name = course.name or ""
-                summary = course.summary or ""
-                category = f"{course.classfy_name or ''} {course.middle_classfy_name or ''}"
-
-                # (1) 불용어 및 노이즈 제거
-                text = f"{category} {summary}"
-                text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', text) # 이메일 제거
-                text = re.sub(r'\d{4}[-./]\d{1,2}[-./]\d{1,2}', '', text) # 날짜 제거
-                
-                stopwords = ['주차', '학교', 'email', '이메일', '수강신청', '이수증', '석사', '박사', '저서', 
-                             '출판사', '학지사', '퀴즈', '공개', '일시', '주요경력', '전)', '현)', '주제']
-                for word in stopwords:
-                    text = text.replace(word, '')
-
-                # 특수문자 제거 및 공백 정규화
-                text = re.sub(r'[^\w\s가-힣]', ' ', text)
-                text = " ".join(text.split())
-
-                # (2) 제목 반복 (Title Boosting) 및 길이 제한
-                # 제목 3번 반복
-                boosted_name = (name + " ") * 3
-                combined_text = f"{boosted_name} {text}".strip()
-
-                # (3) [핵심 안전장치] 개별 텍스트 길이 제한
-                # 한글 기준 3,000자면 약 4,500~5,000 토큰입니다. 
-                # 배치 2개의 합이 8,192 토큰을 넘지 않도록 안전하게 3,000자로 제한합니다.
-                if len(combined_text) > 3000:
-                    combined_text = combined_text[:3000]
-
-                if combined_text:
-                    processed_texts.append(combined_text)
-                    valid_courses.append(course)
-
-            if not processed_texts:
+        if failed_count == 0:
+            self._clear_checkpoint(checkpoint_path)
+        else:
+            self.stdout.write(self.style.WARNING(
+                f"실패 {failed_count}개 - 다시 실행하면 체크포인트(id {watermark}) 이후부터 이어서 처리합니다."
+            ))
+
+        metrics = gms_client.metrics()['batch_embedding']
+        self.stdout.write(
+            f"API 호출: {metrics['calls']}회 (에러 {metrics['errors']}, 재시도 {metrics['retries']}) | "
+            f"지연 avg {metrics['latency_ms']['avg']}ms / p95 {metrics['latency_ms']['p95']}ms"
+        )
+        self.stdout.write(self.style.SUCCESS("모든 작업이 완료되었습니다."))
+
+    def _iter_batches(self, courses, max_tokens, max_inputs):
+        """토큰 합계/입력 개수 상한까지 채운 [(course_id, text), ...] 배치를 순서대로 생성"""
+        batch, batch_tokens = [], 0
+        for course in courses:
+            text = build_embedding_text(course)
+            if not text:
                 continue
+            tokens = count_tokens(text)
+            if batch and (batch_tokens + tokens > max_tokens or len(batch) >= max_inputs):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append((course.id, text))
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+    def _request_embeddings(self, texts):
+        """GMS(OpenAI) 배치 호출 -> (입력 순서대로 정렬된 임베딩 리스트, None) / (None, 에러 메시지)"""
+        data = {
+            "model": EMBEDDING_MODEL,
+            "input": texts
+        }
+        try:
+            response = gms_client.post('batch_embedding', json=data, headers=self.headers)
+        except Exception as e:
+            return None, str(e)
+
+        if response.status_code != 200:
+            return None, f"Status {response.status_code}: {response.text[:200]}"
+
+        result = sorted(response.json()['data'], key=lambda item: item['index'])
+        return [item['embedding'] for item in result], None
+
+    # ---- 체크포인트 ----
+
+    def _load_checkpoint(self, path, mode):
+        try:
+            with open(path, encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return 0
+        if checkpoint.get('mode') != mode:
+            return 0  # 다른 모드로 중단된 체크포인트는 사용하지 않음
+        return int(checkpoint.get('last_id', 0))
+
+    def _save_checkpoint(self, path, mode, last_id):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'mode': mode, 'last_id': last_id}, f)
+        os.replace(tmp_path, path)
 
-            # 4. GMS(OpenAI) 배치 호출
-            try:
-                data = {
-                    "model": "text-embedding-3-small",
-                    "input": processed_texts
-                }
-                
-                response = requests.post(GMS_URL, headers=headers, json=data, timeout=30)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    embeddings = result['data']
-                    
-                    # 5. DB 저장 (배치 성공 시 루프 돌며 저장)
-                    for idx, emb_data in enumerate(embeddings):
-                        target_course = valid_courses[idx]
-                        target_course.embedding = emb_data['embedding']
-                        target_course.save()
-                    
-                    self.stdout.write(self.style.SUCCESS(f"완료: {min(i + BATCH_SIZE, total_count)} / {total_count}"))
-                else:
-                    self.stdout.write(self.style.ERROR(f"Batch 실패 (Status: {response.status_code}): {response.text}"))
-
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"에러 발생: {e}"))
-
-        self.stdout.write(self.style.SUCCESS("모든 작업이 완료되었습니다."))
\ No newline at end of file
+    def _clear_checkpoint(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from apps.courses.models import QueryEmbedding
+
+
+class Command(BaseCommand):
+    help = '오래 사용되지 않은 질의 임베딩 캐시(QueryEmbedding)를 정리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=90,
+            help='마지막 사용 후 이 기간(일)이 지난 행 삭제 (default: 90)'
+        )
+        parser.add_argument(
+            '--max-rows',
+            type=int,
+            default=100000,
+            help='최근 사용순으로 남길 최대 행 수 (default: 100000)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('질의 임베딩 캐시 정리 시작...')
+        deleted = QueryEmbedding.prune(max_age_days=options['days'], max_rows=options['max_rows'])
+        remaining = QueryEmbedding.objects.count()
+        self.stdout.write(self.style.SUCCESS(f'{deleted}개 행을 삭제했습니다. (남은 행: {remaining}개)'))
@@ -1,76 +1,166 @@
+import datetime
 import json
-import requests
-from django.core.management.base import BaseCommand
+import os
+
 from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from elasticsearch import TransportError
+from elasticsearch.helpers import parallel_bulk
+from apps.courses.es_index import COURSE_DOC_FIELDS, ES_INDEX, build_course_document, get_es_client
 from apps.courses.models import Course
 
+STATE_FILENAME = 'push_to_es.state.json'  # 마지막 동기화 시각 (--since last)
+MAX_REPORTED_FAILURES = 20                # 출력할 실패 문서 수 상한
+
+
 class Command(BaseCommand):
     help = 'DB의 데이터를 Elasticsearch로 벌크 전송합니다.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            type=str,
+            default=None,
+            help="증분 동기화: 이 시각 이후 수정된(updated_at) 강좌만 전송 (ISO 날짜/시각 또는 'last' = 마지막 동기화 시각)"
+        )
+        parser.add_argument(
+            '--index',
+            type=str,
+            default=ES_INDEX,
+            help=f'전송 대상 인덱스 (default: alias {ES_INDEX}, reindex_es는 새 버전 인덱스를 지정)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='bulk 요청 1건당 문서 수 (default: 500)'
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help='동시에 보낼 bulk 요청 수 (default: 4)'
+        )
+
     def handle(self, *args, **options):
-        base_url = getattr(settings, 'ELASTICSEARCH_URL', 'http://elasticsearch:9200')
-        # 벌크 전송 엔드포인트는 /_bulk 입니다.
-        es_bulk_url = f"{base_url}/_bulk"
+        """
+        [설계 의도]
+        - 전체 재색인뿐 아니라 변경분만 보내는 야간 증분 동기화 지원
+        - 전체 강좌를 메모리에 올리지 않고 스트리밍으로 전송
+
+        [처리 흐름]
+        1. 대상 조회: 임베딩이 있는 강좌 (--since 지정 시 updated_at 이후 수정분만)
+        2. 제너레이터로 문서 생성 (iterator + only, 임베딩은 NumPy tolist()로 한 번에 float 변환)
+        3. parallel_bulk로 chunk 단위 병렬 전송
+        4. 문서 단위 결과 확인 -> 실패 문서 id/사유 출력
+           (ES 연결 실패/타임아웃 시 그때까지의 진행 상황을 출력하고 중단, 기준 시각은 갱신하지 않음)
+        5. 실패가 없으면 이번 동기화 시작 시각을 기록 (--since last 기준점)
+        """
+        state_path = os.path.join(settings.BASE_DIR.parent, 'data', 'backups', STATE_FILENAME)
+        started_at = timezone.now()
+        since = self._parse_since(options['since'], state_path)
 
-        # 임베딩이 있는 코스만 전송 (추천 기능을 위해 필수)
+        # 1. 대상 조회 (임베딩이 있는 코스만 전송 - 추천 기능을 위해 필수)
         courses = Course.objects.exclude(embedding__isnull=True)
-        total_courses = Course.objects.count()
-        skipped = total_courses - courses.count()
-
-        bulk_data = ""
-
-        self.stdout.write("ES 데이터 전송 시작...")
-        if skipped > 0:
-            self.stdout.write(self.style.WARNING(f"임베딩 없는 코스 {skipped}개는 제외됩니다."))
-
-        for i, course in enumerate(courses):
-            # 1. 메타데이터 줄
-            action = {"index": {"_index": "kmooc_courses", "_id": str(course.id)}}
-            bulk_data += json.dumps(action) + "\n"
-            
-            # 2. 데이터 임베딩 형변환 (numpy float32 해결 핵심)
-            safe_embedding = None
-            if course.embedding is not None:
-                # list()로 감싸는 것만으로는 내부 요소가 numpy 타입일 경우 해결되지 않으므로 
-                # 리스트 컴프리헨션으로 요소를 float으로 강제 변환합니다.
-                safe_embedding = [float(v) for v in course.embedding]
-            
-            # 3. 문서 데이터 구성
-            doc = {
-                "id": course.id,
-                "kmooc_id": course.kmooc_id,
-                "name": course.name,
-                "summary": course.summary,
-                "professor": course.professor,
-                "org_name": course.org_name,
-                "classfy_name": course.classfy_name,
-                "middle_classfy_name": course.middle_classfy_name,
-                "course_image": course.course_image,
-                "url": course.url,
-                "content_key": course.content_key,
-                "embedding": safe_embedding
-            }
-            bulk_data += json.dumps(doc) + "\n"
-            
-            # 500개마다 전송
-            if (i + 1) % 500 == 0:
-                response = requests.post(
-                    es_bulk_url, 
-                    data=bulk_data, 
-                    headers={"Content-Type": "application/x-ndjson"}
-                )
-                if response.status_code != 200:
-                    self.stdout.write(self.style.ERROR(f"에러 발생: {response.text}"))
-                
-                bulk_data = ""
-                self.stdout.write(f"{i+1}개 전송 완료...")
-
-        # 남은 데이터 전송
-        if bulk_data:
-            requests.post(
-                es_bulk_url, 
-                data=bulk_data, 
-                headers={"Content-Type": "application/x-ndjson"}
+        if since is not None:
+            courses = courses.filter(updated_at__gte=since)
+        total = courses.count()
+
+        if since is None:
+            skipped = Course.objects.count() - total
+            self.stdout.write("ES 데이터 전송 시작...")
+            if skipped > 0:
+                self.stdout.write(self.style.WARNING(f"임베딩 없는 코스 {skipped}개는 제외됩니다."))
+        else:
+            self.stdout.write(f"ES 증분 전송 시작... ({since.isoformat()} 이후 수정된 {total}개)")
+
+        if total == 0:
+            self.stdout.write(self.style.SUCCESS("전송할 데이터가 없습니다."))
+            self._save_state(state_path, started_at)
+            return
+
+        # 2~3. 스트리밍 + 병렬 전송
+        es = get_es_client()
+        actions = self._generate_actions(courses.order_by('id'), options['index'])
+        results = parallel_bulk(
+            es,
+            actions,
+            thread_count=options['threads'],
+            chunk_size=options['chunk_size'],
+            raise_on_error=False,      # 문서 단위 실패는 결과로 받아서 집계
+            raise_on_exception=False,  # ES 오류 응답(ApiError)은 해당 chunk 문서의 실패로 집계
+        )
+
+        # 4. 문서 단위 결과 집계
+        # (raise_on_exception은 연결 실패/타임아웃(TransportError)을 잡지 않음 -> 직접 처리)
+        succeeded = 0
+        failures = []
+        try:
+            for ok, item in results:
+                if ok:
+                    succeeded += 1
+                else:
+                    failures.append(item)
+                processed = succeeded + len(failures)
+                if processed % options['chunk_size'] == 0:
+                    self.stdout.write(f"{processed}개 전송 완료...")
+        except TransportError as e:
+            raise CommandError(
+                f"ES 연결 오류로 전송이 중단되었습니다. (전체 {total}개 중 성공 {succeeded}개, 실패 {len(failures)}개): {e}"
             )
-        
-        self.stdout.write(self.style.SUCCESS(f'총 {courses.count()}개 데이터 ES 전송 완료!'))
+
+        if failures:
+            self.stdout.write(self.style.ERROR(f"실패 {len(failures)}개:"))
+            for item in failures[:MAX_REPORTED_FAILURES]:
+                result = item.get('index', item)
+                self.stdout.write(self.style.ERROR(
+                    f"  - id {result.get('_id')}: {json.dumps(result.get('error', result), ensure_ascii=False)[:300]}"
+                ))
+            if len(failures) > MAX_REPORTED_FAILURES:
+                self.stdout.write(self.style.ERROR(f"  ... 외 {len(failures) - MAX_REPORTED_FAILURES}개"))
+            raise CommandError(f"ES 전송 중 {len(failures)}개 문서가 실패했습니다. (성공 {succeeded}개)")
+
+        # 5. 동기화 시각 기록
+        self._save_state(state_path, started_at)
+        self.stdout.write(self.style.SUCCESS(f'총 {succeeded}개 데이터 ES 전송 완료!'))
+
+    def _generate_actions(self, courses, index_name):
+        """bulk index 액션을 한 건씩 생성 (전체 queryset을 메모리에 올리지 않음)"""
+        for course in courses.with_embedding().only(*COURSE_DOC_FIELDS).iterator(chunk_size=2000):
+            yield {
+                "_index": index_name,
+                "_id": str(course.id),
+                "_source": build_course_document(course),
+            }
+
+    # ---- 증분 동기화 기준 시각 ----
+
+    def _parse_since(self, value, state_path):
+        if not value:
+            return None
+        if value == 'last':
+            try:
+                with open(state_path, encoding='utf-8') as f:
+                    value = json.load(f)['last_synced_at']
+            except (FileNotFoundError, json.JSONDecodeError, KeyError):
+                raise CommandError("마지막 동기화 기록이 없습니다. 먼저 --since 없이 전체 전송을 실행하세요.")
+
+        parsed = parse_datetime(value)
+        if parsed is None:
+            date = parse_date(value)
+            if date is None:
+                raise CommandError(f"--since 값을 해석할 수 없습니다: {value}")
+            parsed = datetime.datetime.combine(date, datetime.time.min)
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
+
+    def _save_state(self, state_path, started_at):
+        # 전송 도중 수정된 행도 다음 증분 동기화에 포함되도록 시작 시각을 기록
+        os.makedirs(os.path.dirname(state_path), exist_ok=True)
+        tmp_path = f"{state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'last_synced_at': started_at.isoformat()}, f)
+        os.replace(tmp_path, state_path)
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from apps.courses.models import CourseRatingStats
+
+
+class Command(BaseCommand):
+    help = '리뷰 테이블 기준으로 강좌 평점 통계(CourseRatingStats)를 전체 재계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 upsert할 강좌 수 (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('강좌 평점 통계 재계산 시작...')
+        total = CourseRatingStats.rebuild(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'총 {total}개 강좌의 평점 통계를 갱신했습니다.'))
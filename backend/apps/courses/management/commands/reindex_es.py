@@ -0,0 +1,96 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from apps.courses.es_index import (
+    ES_INDEX, alias_targets, create_versioned_index, delete_old_indices,
+    finalize_index, get_es_client, swap_alias,
+)
+from apps.courses.models import Course
+
+
+class Command(BaseCommand):
+    help = '새 버전 인덱스에 전체 재색인 후 alias를 교체합니다. (무중단)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--replicas',
+            type=int,
+            default=1,
+            help='색인 완료 후 적용할 레플리카 수 (default: 1, ES 기본값)'
+        )
+        parser.add_argument(
+            '--keep',
+            type=int,
+            default=0,
+            help='교체 후 롤백용으로 보관할 이전 버전 인덱스 수 (default: 0 = 모두 삭제)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='bulk 요청 1건당 문서 수 (default: 500)'
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help='동시에 보낼 bulk 요청 수 (default: 4)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        [설계 의도]
+        - 검색/추천이 계속 기존 인덱스(alias)를 읽는 동안 새 인덱스를 만들고, 완료 후 alias만 교체
+        - 업무 시간 중에도 재색인 가능
+
+        [처리 흐름]
+        1. 새 버전 인덱스 생성 (refresh_interval=-1, replicas=0)
+        2. push_to_es --index <새 인덱스>로 전체 문서 적재
+        3. 운영 설정 복구 + refresh + force-merge
+        4. 문서 수가 DB(임베딩 있는 강좌 수)와 일치하는지 확인 -> 불일치 시 교체하지 않고 새 인덱스 삭제
+        5. alias 원자적 교체
+        6. 이전 버전 인덱스 정리 (--keep개 보관)
+
+        [상세 고려사항]
+        - 재색인 중 수정된 강좌는 기존 인덱스(alias)에 반영되므로,
+          교체 후 push_to_es --since last를 실행하면 새 인덱스에도 반영됨 (push_to_es가 전송 시작 시각을 기록)
+        """
+        es = get_es_client()
+        previous = alias_targets(es)
+
+        # 1. 새 인덱스 생성
+        index_name = create_versioned_index(es, bulk=True)
+        self.stdout.write(f'새 인덱스 생성: {index_name} (현재 alias 대상: {", ".join(previous) or "없음"})')
+
+        try:
+            # 2. 전체 문서 적재
+            call_command(
+                'push_to_es',
+                index=index_name,
+                chunk_size=options['chunk_size'],
+                threads=options['threads'],
+                stdout=self.stdout,
+                stderr=self.stderr,
+            )
+
+            # 3. 운영 설정 복구 + force-merge
+            self.stdout.write('운영 설정 복구 및 force-merge 중...')
+            finalize_index(es, index_name, options['replicas'])
+
+            # 4. 문서 수 검증
+            indexed = es.count(index=index_name)['count']
+            expected = Course.objects.exclude(embedding__isnull=True).count()
+            if indexed != expected:
+                raise CommandError(f'문서 수 불일치: 인덱스 {indexed}개 / DB {expected}개')
+        except Exception:
+            es.indices.delete(index=index_name)
+            self.stdout.write(self.style.ERROR(f'재색인 실패 - {index_name} 삭제, alias는 기존 인덱스를 유지합니다.'))
+            raise
+
+        # 5. alias 교체
+        swap_alias(es, index_name)
+        self.stdout.write(self.style.SUCCESS(f'alias {ES_INDEX} -> {index_name} 교체 완료 ({indexed}개 문서)'))
+
+        # 6. 이전 버전 정리
+        deleted = delete_old_indices(es, keep=options['keep'])
+        if deleted:
+            self.stdout.write(f'이전 인덱스 삭제: {", ".join(deleted)}')
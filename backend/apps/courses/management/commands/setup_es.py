@@ -1,46 +1,25 @@
 from django.core.management.base import BaseCommand
-import requests
-from django.conf import settings
+from apps.courses.es_index import ES_INDEX, create_versioned_index, get_es_client, swap_alias
+
 
 class Command(BaseCommand):
     help = 'Elasticsearch 인덱스 및 Nori 분석기 설정을 생성합니다.'
 
     def handle(self, *args, **options):
-        base_url = getattr(settings, 'ELASTICSEARCH_URL', 'http://elasticsearch:9200')
-        es_url = f"{base_url}/kmooc_courses"
-        config = {
-            "settings": {
-                "analysis": {
-                    "analyzer": {
-                        "nori_analyzer": {
-                            "type": "custom",
-                            "tokenizer": "nori_tokenizer"
-                        }
-                    }
-                }
-            },
-            "mappings": {
-                "properties": {
-                    "id": {"type": "integer"},
-                    "kmooc_id": {"type": "keyword"},
-                    "name": {"type": "text", "analyzer": "nori_analyzer"},
-                    "summary": {"type": "text", "analyzer": "nori_analyzer"},
-                    "professor": {"type": "keyword"},
-                    "org_name": {"type": "keyword"},
-                    "classfy_name": {"type": "keyword"},
-                    "middle_classfy_name": {"type": "keyword"},
-                    "course_image": {"type": "keyword", "index": False},
-                    "url": {"type": "keyword", "index": False},
-                    "content_key": {"type": "keyword"},
-                    "embedding": {
-                        "type": "dense_vector",
-                        "dims": 1536,
-                        "index": True,
-                        "similarity": "cosine"
-                    }
-                }
-            }
-        }
-        requests.delete(es_url) # 초기화 코드이므로 운영시 주의
-        response = requests.put(es_url, json=config)
-        self.stdout.write(self.style.SUCCESS(f'Successfully created index: {response.text}'))
\ No newline at end of file
+        """
+        [처리 흐름]
+        - 최초 설정: 버전 인덱스(kmooc_courses_v1) 생성 후 alias(kmooc_courses) 연결
+        - 이미 alias/인덱스가 있으면 아무것도 삭제하지 않고 종료
+          (운영 중 전체 재색인은 reindex_es로 새 버전을 만든 뒤 alias 교체)
+        """
+        es = get_es_client()
+
+        if es.indices.exists(index=ES_INDEX):
+            self.stdout.write(self.style.WARNING(
+                f'{ES_INDEX} 인덱스가 이미 존재합니다. 전체 재색인은 `python manage.py reindex_es`를 사용하세요.'
+            ))
+            return
+
+        index_name = create_versioned_index(es)
+        swap_alias(es, index_name)
+        self.stdout.write(self.style.SUCCESS(f'Successfully created index: {index_name} (alias: {ES_INDEX})'))
@@ -0,0 +1,198 @@
+import datetime
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from elasticsearch import TransportError
+from elasticsearch.helpers import streaming_bulk
+from apps.courses.es_index import COURSE_DOC_FIELDS, ES_INDEX, build_course_document, get_es_client
+from apps.courses.models import Course, CourseSyncOutbox
+
+RETRY_BACKOFF_BASE = 2      # 재시도 대기 시간 = base^attempts 초
+RETRY_BACKOFF_MAX = 300     # 재시도 대기 시간 상한 (초)
+CLAIM_LEASE_SECONDS = 300   # 처리 중인 행의 점유 시간 (워커가 도중에 죽으면 이 시간 후 다른 워커가 다시 가져감)
+
+
+class Command(BaseCommand):
+    help = 'Course 변경 outbox를 배치로 읽어 Elasticsearch에 반영합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에 처리할 outbox 행 수 (default: 500)'
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=5,
+            help='dead letter로 옮기기 전 최대 시도 횟수 (default: 5)'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='대기열이 비어도 종료하지 않고 --interval마다 계속 확인 (상시 워커)'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='--loop 모드에서 대기열이 비었을 때 확인 주기 (초, default: 2.0)'
+        )
+        parser.add_argument(
+            '--requeue-dead',
+            action='store_true',
+            help='dead letter 행을 다시 대기 상태로 되돌리고 종료'
+        )
+
+    def handle(self, *args, **options):
+        """
+        [설계 의도]
+        - Course 저장/삭제 시 signal이 기록한 outbox를 읽어 ES에 준실시간으로 반영 (전체 재색인 불필요)
+
+        [처리 흐름]
+        1. 처리 가능한(pending, available_at <= now) 행을 batch_size개 점유
+           (짧은 트랜잭션에서 SKIP LOCKED로 잠근 뒤 available_at을 점유 만료 시각으로 미루고 바로 커밋
+            -> ES 요청 중에는 행 잠금을 잡지 않으며, 워커 여러 개 실행 가능)
+        2. 강좌 id 중복 제거 후 DB 상태 조회
+           - 강좌가 있고 임베딩이 있으면 index, 없으면 delete (이미 없는 문서의 404는 성공으로 간주)
+        3. streaming_bulk로 전송 후 문서 단위 결과 확인
+           - ES 연결 실패/타임아웃(TransportError)은 배치 전체를 실패로 처리
+        4. 성공한 강좌의 outbox 행 삭제
+           실패한 행은 attempts 증가 + 지수 백오프, max_attempts 도달 시 dead letter
+        5. 대기열이 빌 때까지 반복 (--loop면 interval마다 계속 확인, 예기치 않은 오류도 기록 후 계속)
+        """
+        if options['requeue_dead']:
+            count = CourseSyncOutbox.objects.filter(status=CourseSyncOutbox.STATUS_DEAD).update(
+                status=CourseSyncOutbox.STATUS_PENDING, attempts=0, available_at=timezone.now()
+            )
+            self.stdout.write(self.style.SUCCESS(f'dead letter {count}개를 대기열로 되돌렸습니다.'))
+            return
+
+        es = get_es_client()
+        totals = {'synced': 0, 'retried': 0, 'dead': 0}
+
+        try:
+            while True:
+                try:
+                    result = self._drain_batch(es, options['batch_size'], options['max_attempts'])
+                except Exception as e:
+                    # DB 일시 장애 등: 상시 워커는 종료하지 않고 잠시 후 다시 시도
+                    # (점유한 행은 CLAIM_LEASE_SECONDS 후 다시 처리 대상이 됨)
+                    if not options['loop']:
+                        raise
+                    self.stdout.write(self.style.ERROR(f'배치 처리 실패 - {options["interval"]}초 후 재시도: {e}'))
+                    time.sleep(options['interval'])
+                    continue
+                if result is None:
+                    if not options['loop']:
+                        break
+                    time.sleep(options['interval'])
+                    continue
+                for key, value in result.items():
+                    totals[key] += value
+                self.stdout.write(
+                    f"동기화 {result['synced']}개 / 재시도 예정 {result['retried']}개 / dead letter {result['dead']}개"
+                )
+        except KeyboardInterrupt:
+            self.stdout.write('중단 요청 - 종료합니다.')
+
+        dead_total = CourseSyncOutbox.objects.filter(status=CourseSyncOutbox.STATUS_DEAD).count()
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 동기화 {totals['synced']}개, 재시도 예정 {totals['retried']}개, dead letter {totals['dead']}개"
+        ))
+        if dead_total:
+            self.stdout.write(self.style.WARNING(
+                f'처리되지 않은 dead letter {dead_total}개 - 원인 확인 후 --requeue-dead로 재처리하세요.'
+            ))
+
+    def _drain_batch(self, es, batch_size, max_attempts):
+        """outbox 행 한 배치 처리 -> {'synced', 'retried', 'dead'} / 처리할 행이 없으면 None"""
+        # 1. 처리 대상 점유 (짧은 트랜잭션, ES 요청 전에 커밋)
+        rows = self._claim_rows(batch_size)
+        if not rows:
+            return None
+
+        # 2. DB 상태 기준으로 액션 구성
+        course_ids = {row.course_id for row in rows}
+        courses = (
+            Course.objects.with_embedding()
+            .filter(id__in=course_ids, embedding__isnull=False)
+            .only(*COURSE_DOC_FIELDS)
+        )
+        actions = [
+            {"_op_type": "index", "_index": ES_INDEX, "_id": str(course.id), "_source": build_course_document(course)}
+            for course in courses
+        ]
+        indexed_ids = {int(action["_id"]) for action in actions}
+        actions += [
+            {"_op_type": "delete", "_index": ES_INDEX, "_id": str(course_id)}
+            for course_id in course_ids - indexed_ids
+        ]
+
+        # 3. 전송
+        # - raise_on_exception=False는 ES가 돌려준 오류 응답(ApiError)만 문서 단위 실패로 바꿔줌
+        # - 연결 실패/타임아웃(TransportError)은 그대로 올라오므로 배치 전체 실패로 처리
+        errors = {}
+        try:
+            for ok, item in streaming_bulk(
+                es, actions, chunk_size=batch_size, raise_on_error=False, raise_on_exception=False
+            ):
+                (op_type, result), = item.items()
+                if ok or (op_type == 'delete' and result.get('status') == 404):
+                    continue
+                errors[int(result['_id'])] = json.dumps(result.get('error', result), ensure_ascii=False, default=str)[:1000]
+        except TransportError as e:
+            message = f'{type(e).__name__}: {e}'[:1000]
+            errors = {course_id: message for course_id in course_ids}
+            self.stdout.write(self.style.ERROR(f'ES 요청 실패 - 배치 {len(rows)}개 재시도 예정: {message}'))
+
+        # 4. 결과 반영
+        return self._record_results(rows, errors, max_attempts)
+
+    def _claim_rows(self, batch_size):
+        """
+        처리 가능한 행을 잠그고 available_at을 점유 만료 시각으로 미룬 뒤 커밋
+        - 다른 워커는 만료 전까지 같은 행을 가져가지 않음
+        - 이 워커가 결과를 기록하지 못하고 죽어도 만료 후 다시 처리 대상이 됨
+        """
+        with transaction.atomic():
+            rows = list(
+                CourseSyncOutbox.objects.select_for_update(skip_locked=True)
+                .filter(status=CourseSyncOutbox.STATUS_PENDING, available_at__lte=timezone.now())
+                .order_by('id')[:batch_size]
+            )
+            if rows:
+                CourseSyncOutbox.objects.filter(id__in=[row.id for row in rows]).update(
+                    available_at=timezone.now() + datetime.timedelta(seconds=CLAIM_LEASE_SECONDS)
+                )
+        return rows
+
+    def _record_results(self, rows, errors, max_attempts):
+        """성공한 행 삭제, 실패한 행은 attempts 증가 + 지수 백오프 (max_attempts 도달 시 dead letter)"""
+        now = timezone.now()
+        done_rows = [row for row in rows if row.course_id not in errors]
+        failed_rows = [row for row in rows if row.course_id in errors]
+        dead = 0
+        for row in failed_rows:
+            row.attempts += 1
+            row.last_error = errors[row.course_id]
+            if row.attempts >= max_attempts:
+                row.status = CourseSyncOutbox.STATUS_DEAD
+                dead += 1
+            else:
+                delay = min(RETRY_BACKOFF_BASE ** row.attempts, RETRY_BACKOFF_MAX)
+                row.available_at = now + datetime.timedelta(seconds=delay)
+
+        with transaction.atomic():
+            CourseSyncOutbox.objects.filter(id__in=[row.id for row in done_rows]).delete()
+            CourseSyncOutbox.objects.bulk_update(failed_rows, ['attempts', 'last_error', 'status', 'available_at'])
+
+        return {
+            'synced': len({row.course_id for row in done_rows}),
+            'retried': len(failed_rows) - dead,
+            'dead': dead,
+        }
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.9 on 2026-10-16 23:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# 기존 리뷰 데이터로 평점 통계 초기값 채우기 (이후 갱신은 signals / rebuild_rating_stats 커맨드가 담당)
+BACKFILL_SQL = """
+INSERT INTO course_rating_stats (
+    course_id, average_rating, review_count,
+    rating_1_count, rating_2_count, rating_3_count, rating_4_count, rating_5_count,
+    updated_at
+)
+SELECT
+    c.id,
+    COALESCE(AVG(r.rating), 0.0),
+    COUNT(r.id),
+    COUNT(r.id) FILTER (WHERE r.rating = 1),
+    COUNT(r.id) FILTER (WHERE r.rating = 2),
+    COUNT(r.id) FILTER (WHERE r.rating = 3),
+    COUNT(r.id) FILTER (WHERE r.rating = 4),
+    COUNT(r.id) FILTER (WHERE r.rating = 5),
+    NOW()
+FROM courses c
+LEFT JOIN course_review r ON r.course_id = c.id
+GROUP BY c.id
+ON CONFLICT (course_id) DO NOTHING;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_add_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseRatingStats',
+            fields=[
+                ('course', models.OneToOneField(help_text='통계 대상 강좌', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_stats', serialize=False, to='courses.course')),
+                ('average_rating', models.FloatField(default=0.0, help_text='평균 평점 (리뷰 없으면 0.0)')),
+                ('review_count', models.PositiveIntegerField(default=0, help_text='리뷰 개수')),
+                ('rating_1_count', models.PositiveIntegerField(default=0, help_text='1점 리뷰 수')),
+                ('rating_2_count', models.PositiveIntegerField(default=0, help_text='2점 리뷰 수')),
+                ('rating_3_count', models.PositiveIntegerField(default=0, help_text='3점 리뷰 수')),
+                ('rating_4_count', models.PositiveIntegerField(default=0, help_text='4점 리뷰 수')),
+                ('rating_5_count', models.PositiveIntegerField(default=0, help_text='5점 리뷰 수')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='통계 갱신 시각')),
+            ],
+            options={
+                'verbose_name': '강좌 평점 통계',
+                'verbose_name_plural': '강좌 평점 통계 목록',
+                'db_table': 'course_rating_stats',
+                'indexes': [models.Index(fields=['-average_rating'], name='idx_rating_stats_avg'), models.Index(fields=['-review_count'], name='idx_rating_stats_count')],
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
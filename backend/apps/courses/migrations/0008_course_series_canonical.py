@@ -0,0 +1,57 @@
+# Generated by Django 5.2.9 on 2026-10-16 23:57
+
+from django.db import migrations, models
+
+
+# 기존 강좌의 series_key / is_canonical 초기값 채우기
+# - Course.build_series_key()와 같은 정규화(공백 정리 + 소문자)
+# - 이후 갱신은 load_courses / import_courses 커맨드가 refresh_canonical()로 담당
+BACKFILL_SQL = """
+UPDATE courses
+SET series_key = lower(regexp_replace(btrim(name), '\\s+', ' ', 'g'))
+    || '|' || lower(regexp_replace(btrim(coalesce(professor, '')), '\\s+', ' ', 'g'));
+
+UPDATE courses c
+SET is_canonical = (ranked.row_num = 1)
+FROM (
+    SELECT id, ROW_NUMBER() OVER (
+        PARTITION BY series_key
+        ORDER BY study_start DESC NULLS LAST, id DESC
+    ) AS row_num
+    FROM courses
+) ranked
+WHERE c.id = ranked.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0007_course_rating_stats'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='course',
+            name='idx_course_dedup',
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='is_canonical',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='series_key',
+            field=models.CharField(blank=True, default='', max_length=1001),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['series_key', '-study_start'], name='idx_course_series'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(condition=models.Q(('is_canonical', True)), fields=['id'], name='idx_course_canonical'),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
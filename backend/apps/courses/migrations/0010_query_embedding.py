@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:05
+
+import pgvector.django.vector
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0009_course_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueryEmbedding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query_hash', models.CharField(help_text='sha256(모델명 + 정규화 질의문)', max_length=64, unique=True)),
+                ('model', models.CharField(help_text='임베딩 모델명', max_length=100)),
+                ('query_text', models.TextField(help_text='정규화된 질의문')),
+                ('embedding', pgvector.django.vector.VectorField(dimensions=1536)),
+                ('hit_count', models.PositiveIntegerField(default=0, help_text='캐시 재사용 횟수')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now_add=True, help_text='마지막 재사용 시각')),
+            ],
+            options={
+                'verbose_name': '질의 임베딩 캐시',
+                'verbose_name_plural': '질의 임베딩 캐시 목록',
+                'db_table': 'query_embedding',
+                'indexes': [models.Index(fields=['last_used_at'], name='idx_query_embedding_used')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:07
+
+import pgvector.django.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0010_query_embedding'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=pgvector.django.indexes.HnswIndex(condition=models.Q(('is_canonical', True)), ef_construction=64, fields=['embedding'], m=16, name='idx_course_embedding_hnsw', opclasses=['vector_cosine_ops']),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0011_course_embedding_hnsw'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseNeighbor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(help_text='유사도 순위 (1부터)')),
+                ('score', models.FloatField(help_text='코사인 유사도')),
+                ('course', models.ForeignKey(help_text='기준 강좌', on_delete=django.db.models.deletion.CASCADE, related_name='neighbors', to='courses.course')),
+                ('neighbor', models.ForeignKey(help_text='유사 강좌 (대표 강좌)', on_delete=django.db.models.deletion.CASCADE, related_name='recommended_in', to='courses.course')),
+            ],
+            options={
+                'verbose_name': '유사 강좌',
+                'verbose_name_plural': '유사 강좌 목록',
+                'db_table': 'course_neighbor',
+                'constraints': [models.UniqueConstraint(fields=('course', 'rank'), name='unique_course_neighbor_rank')],
+            },
+        ),
+    ]
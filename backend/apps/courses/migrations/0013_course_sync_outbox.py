@@ -0,0 +1,32 @@
+# Generated by Django 5.2.9 on 2026-10-17 00:18
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0012_course_neighbor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CourseSyncOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('course_id', models.BigIntegerField(help_text='변경된 강좌 id (삭제된 강좌 포함)')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('dead', '처리 실패(dead letter)')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0, help_text='ES 반영 시도 횟수')),
+                ('last_error', models.TextField(blank=True, default='', help_text='마지막 실패 사유')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, help_text='다음 처리 가능 시각 (재시도 백오프)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '강좌 ES 동기화 대기열',
+                'verbose_name_plural': '강좌 ES 동기화 대기열 목록',
+                'db_table': 'course_sync_outbox',
+                'indexes': [models.Index(fields=['status', 'available_at'], name='idx_course_outbox_pending')],
+            },
+        ),
+    ]
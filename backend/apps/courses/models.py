@@ -1,5 +1,200 @@
-from django.db import models
-from pgvector.django import VectorField 
+import datetime
+import re
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.db.models import Avg, Count, F, Q, Value, Window
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, Now, RowNumber, Upper
+from django.utils import timezone
+from pgvector import HalfVector
+from pgvector.django import CosineDistance, HalfVectorField, HnswIndex, VectorField 
+
+from .caches import invalidate_course_detail, invalidate_course_facets, invalidate_course_list, invalidate_course_suggest
+from .embedding_profile import pgvector_halfvec_sql, serving_dimensions, to_serving_vector
+
+# 전문 검색(tsvector) 설정
+# - 한국어 형태소 사전이 없는 PostgreSQL 기본 환경을 고려해 공백 단위 'simple' 설정 사용
+# - 조사가 붙은 단어("파이썬으로")도 찾을 수 있도록 검색 시 접두사 매칭(:*) 사용
+SEARCH_CONFIG = 'simple'
+# tsquery 문법에서 특수 의미를 갖는 문자 (사용자 입력에서 제거)
+TSQUERY_SPECIAL_CHARS = re.compile(r"[&|!():*<>'\"\\]")
+
+
+class CourseQuerySet(models.QuerySet):
+    """
+    [설계 의도]
+    - 강좌 목록/검색/상세에서 공통으로 쓰는 QuerySet 헬퍼 모음
+    """
+
+    def with_rating_stats(self):
+        """
+        [설계 의도]
+        - 평균 평점/리뷰 수를 리뷰 테이블 GROUP BY 없이 CourseRatingStats에서 바로 읽어옴
+
+        [상세 고려사항]
+        - 통계 행이 아직 없는 강좌(리뷰 0개)는 LEFT JOIN 결과가 NULL이므로 Coalesce로 0 처리
+        - 필드명(average_rating, review_count)은 기존 annotate 결과와 동일하게 유지 (Serializer 호환)
+        """
+        return self.annotate(
+            average_rating=Coalesce(F('rating_stats__average_rating'), 0.0),
+            review_count=Coalesce(F('rating_stats__review_count'), 0),
+        )
+
+    def full_text_search(self, text):
+        """
+        [설계 의도]
+        - 강좌명/교수자/요약을 대상으로 GIN 인덱스(search_vector)를 타는 전문 검색
+        - 일치도(relevance) annotate -> 목록 API의 관련도순 정렬에 사용
+
+        [상세 고려사항]
+        - 공백으로 나눈 키워드는 모두 포함되어야 함 (AND, 기존 icontains 검색과 동일한 의미)
+        - 각 키워드는 접두사 매칭 ('파이썬' -> '파이썬으로', '파이썬프로그래밍'도 일치)
+        - 가중치: 강좌명(A) > 교수자(B) > 요약(C)
+        """
+        keywords = TSQUERY_SPECIAL_CHARS.sub(' ', text).split()
+        if not keywords:
+            # 특수문자만 입력된 경우: 결과 없음 (관련도순 정렬이 깨지지 않도록 relevance는 유지)
+            return self.annotate(relevance=Value(0.0, output_field=models.FloatField())).none()
+
+        query = SearchQuery(
+            ' & '.join(f"{keyword}:*" for keyword in keywords),
+            search_type='raw',
+            config=SEARCH_CONFIG,
+        )
+        return self.filter(search_vector=query).annotate(
+            relevance=SearchRank(F('search_vector'), query)
+        )
+
+    def with_embedding(self):
+        """
+        기본 매니저(CourseManager)가 제외한 embedding 컬럼을 다시 포함 (ES 색인/실시간 추천 등 벡터 경로 전용)
+        - defer 상태에서 only()를 호출해도 embedding은 포함되지 않으므로 반드시 only()보다 먼저 호출
+        """
+        return self.defer(None)
+
+    def canonical(self):
+        """같은 강좌의 여러 기수 중 대표(최신) 강좌만 조회"""
+        return self.filter(is_canonical=True)
+
+    def canonical_from_hits(self, candidate_ids):
+        """
+        [설계 의도]
+        - ES 등 외부 검색 결과(id 목록)를 강좌 시리즈 단위로 묶어 대표 강좌 목록으로 변환
+        - 검색 결과 순서(유사도/스코어 순)를 그대로 유지
+
+        [상세 고려사항]
+        - 후보 id -> series_key 조회 1번, series_key -> 대표 강좌 조회 1번 (둘 다 인덱스 사용)
+        - 이전 기수만 검색에 걸려도 해당 시리즈의 대표 강좌로 치환되어 노출됨
+        - self에 걸린 필터/annotate는 대표 강좌 조회에 그대로 적용됨
+        """
+        series_by_id = dict(
+            Course.objects.filter(id__in=candidate_ids).values_list('id', 'series_key')
+        )
+        ordered_keys = list(dict.fromkeys(
+            series_by_id[course_id] for course_id in candidate_ids if course_id in series_by_id
+        ))
+        canonical_map = {
+            course.series_key: course
+            for course in self.canonical().filter(series_key__in=ordered_keys)
+        }
+        return [canonical_map[key] for key in ordered_keys if key in canonical_map]
+
+    def knn(self, vector, limit):
+        """
+        [설계 의도]
+        - pgvector 코사인 거리 기준 최근접 강좌 limit개 조회 (VECTOR_SEARCH_BACKEND='pgvector'에서 사용)
+        - 호출 전에 걸어 둔 필터(canonical/분류/기관 등)와 kNN이 SQL 한 번으로 처리됨
+
+        [상세 고려사항]
+        - 대표 강좌(is_canonical)만 담은 부분 HNSW 인덱스(idx_course_embedding_hnsw)를 타도록
+          canonical()과 함께 사용하는 것을 전제로 함
+        - 필터가 있으면 HNSW 탐색 후보(ef_search) 중 조건에 맞는 행만 남으므로
+          PGVECTOR_EF_SEARCH를 limit보다 넉넉하게 설정 (SET LOCAL: 현재 트랜잭션에만 적용)
+        - 반환 값은 평가된 리스트 (ef_search 설정과 같은 트랜잭션에서 실행해야 하므로)
+        - 거리는 distance 속성으로 annotate (0 = 동일, 2 = 정반대)
+        - PGVECTOR_HALFVEC: halfvec 표현식 인덱스(build_pgvector_index)와 같은 식으로 정렬
+          (질의 벡터도 EMBEDDING_DIMENSIONS로 잘라 halfvec으로 전달)
+        """
+        if settings.PGVECTOR_HALFVEC:
+            dims = serving_dimensions()
+            column = f'"{self.model._meta.db_table}"."embedding"'
+            distance = CosineDistance(
+                RawSQL(pgvector_halfvec_sql(dims, column), [], output_field=HalfVectorField(dimensions=dims)),
+                HalfVector(to_serving_vector(vector)),
+            )
+        else:
+            distance = CosineDistance('embedding', vector)
+
+        queryset = (
+            self.filter(embedding__isnull=False)
+            .defer('embedding')
+            .annotate(distance=distance)
+            .order_by('distance')[:limit]
+        )
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL hnsw.ef_search = %s", [max(settings.PGVECTOR_EF_SEARCH, limit)])
+            return list(queryset)
+
+    def refresh_canonical(self):
+        """
+        [설계 의도]
+        - 강좌 시리즈(series_key)별로 수강 시작일이 가장 최신인 강좌 1개만 is_canonical=True로 표시
+        - 요청마다 Window Function을 돌리지 않도록 적재(import) 시점에 한 번만 계산
+
+        [상세 고려사항]
+        - study_start NULL은 가장 오래된 것으로 취급, 동률이면 id가 큰(나중에 적재된) 강좌 선택
+        - 값이 바뀌는 행만 update()
+          (update()는 auto_now를 적용하지 않으므로 updated_at을 직접 갱신 -> push_to_es --since 증분 동기화 대상에 포함)
+        - self로 범위를 좁히면 해당 시리즈들만 재계산 (예: filter(series_key__in=...))
+        - update()는 signal을 발생시키지 않으므로 변경이 있으면 목록/패싯 캐시 무효화 + ES 동기화 outbox 기록을 직접 수행
+        """
+        series_keys = self.values('series_key')
+        ranked = Course.objects.filter(series_key__in=series_keys).annotate(
+            row_num=Window(
+                expression=RowNumber(),
+                partition_by=[F('series_key')],
+                order_by=[F('study_start').desc(nulls_last=True), F('id').desc()],
+            )
+        ).values_list('id', 'row_num')
+
+        canonical_ids = [course_id for course_id, row_num in ranked if row_num == 1]
+        scope = Course.objects.filter(series_key__in=series_keys)
+        demoted_ids = list(
+            scope.filter(is_canonical=True).exclude(id__in=canonical_ids).values_list('id', flat=True)
+        )
+        promoted_ids = list(
+            scope.filter(id__in=canonical_ids, is_canonical=False).values_list('id', flat=True)
+        )
+        demoted = Course.objects.filter(id__in=demoted_ids).update(is_canonical=False, updated_at=Now())
+        promoted = Course.objects.filter(id__in=promoted_ids).update(is_canonical=True, updated_at=Now())
+        if promoted or demoted:
+            invalidate_course_list()
+            invalidate_course_facets()
+            invalidate_course_suggest()
+            CourseSyncOutbox.enqueue(demoted_ids + promoted_ids)
+        return promoted, demoted
+
+
+class CourseManager(models.Manager.from_queryset(CourseQuerySet)):
+    """
+    [설계 의도]
+    - Course 기본 매니저: 1536차원 embedding 컬럼(행당 약 6KB)을 기본 조회에서 제외
+      (목록/검색/상세/마이페이지/비교 어떤 응답에도 쓰지 않는데 전송량과 NumPy 변환 비용만 발생)
+
+    [상세 고려사항]
+    - 벡터 경로는 with_embedding()으로 명시적으로 포함 (push_to_es, sync_es_outbox, 실시간 추천)
+    - values()/values_list('embedding')는 defer와 관계없이 지정한 컬럼을 조회 (행렬 계산/내보내기 커맨드)
+    - 다른 모델에서 select_related('course')로 JOIN하면 이 매니저를 거치지 않으므로 defer('course__embedding') 함께 지정
+    - 지연 로딩된 인스턴스를 save()하면 로드된 필드만 UPDATE -> 임베딩이 덮어써지지 않음
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().defer('embedding')
+
 
 class Course(models.Model):
     # K-MOOC 원본 데이터의 식별자 (CSV의 id 컬럼)
@@ -38,19 +233,51 @@ class Course(models.Model):
     # 1536차원 벡터 필드 (임베딩 저장용, openai text-embedding-3-small 모델 사용 예정)
     embedding = VectorField(dimensions=1536, blank=True, null=True)
 
+    # 강좌 시리즈 식별자 (정규화된 강좌명 + 교수자) - 같은 강좌의 여러 기수를 하나로 묶는 키
+    series_key = models.CharField(max_length=1001, blank=True, default='')
+    # 시리즈 대표 강좌 여부 (최신 기수만 True) - CourseQuerySet.refresh_canonical()로 적재 시 갱신
+    is_canonical = models.BooleanField(default=False)
+
+    # 전문 검색용 tsvector (강좌명 A, 교수자 B, 요약 C 가중치)
+    # - DB 생성 컬럼(STORED)이므로 save/update/bulk_create 등 모든 쓰기 경로에서 DB가 자동 갱신
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('name', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('professor', weight='B', config=SEARCH_CONFIG)
+            + SearchVector('summary', weight='C', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
+    objects = CourseManager()
 
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def build_series_key(name, professor):
+        """강좌명/교수자의 앞뒤 공백, 연속 공백, 대소문자 차이를 무시한 시리즈 키 생성"""
+        def normalize(value):
+            return " ".join((value or "").split()).lower()
+        return f"{normalize(name)}|{normalize(professor)}"
+
+    def save(self, *args, **kwargs):
+        self.series_key = self.build_series_key(self.name, self.professor)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'name', 'professor'} & set(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'series_key'}
+        super().save(*args, **kwargs)
+
     class Meta:
         db_table = 'courses'
         ordering = ['-created_at']
         indexes = [
-            # 중복 제거용 복합 인덱스 (가장 중요!)
-            # - views.py의 Subquery 중복 제거 로직에서 사용
-            # - (name, professor) 조합으로 그룹핑 후 study_start 내림차순 정렬
-            models.Index(fields=['name', 'professor', '-study_start'], name='idx_course_dedup'),
+            # 중복 제거용 복합 인덱스
+            # - refresh_canonical()의 Window Function(series_key 그룹핑 후 study_start 내림차순)에서 사용
+            models.Index(fields=['series_key', '-study_start'], name='idx_course_series'),
+            # 목록/검색/추천에서 대표 강좌만 조회 (is_canonical=True 부분 인덱스)
+            models.Index(fields=['id'], condition=Q(is_canonical=True), name='idx_course_canonical'),
 
             # 필터링용 인덱스
             models.Index(fields=['classfy_name'], name='idx_classfy'),
@@ -61,8 +288,26 @@ class Course(models.Model):
             models.Index(fields=['org_name'], name='idx_org_name'),
             models.Index(fields=['professor'], name='idx_professor'),
 
+            # 전문 검색 / 부분 일치 검색용 GIN 인덱스
+            # - search_vector: full_text_search()의 tsvector @@ tsquery 조회
+            # - 트라이그램: name__icontains / professor__icontains (UPPER(col) LIKE '%...%')를
+            #   순차 스캔 없이 인덱스로 처리 (pg_trgm 확장 필요)
+            GinIndex(fields=['search_vector'], name='idx_course_search_vector'),
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='idx_course_name_trgm'),
+            GinIndex(OpClass(Upper('professor'), name='gin_trgm_ops'), name='idx_course_professor_trgm'),
+
             # 벡터 검색 최적화를 위한 인덱스 (임베딩)
-            # models.Index(fields=['embedding'], name='idx_embedding'),
+            # - VECTOR_SEARCH_BACKEND='pgvector'일 때 knn()의 코사인 거리 정렬을 HNSW 근사 탐색으로 처리
+            # - 추천/시맨틱 검색은 대표 강좌만 대상으로 하므로 is_canonical 부분 인덱스로 크기를 줄임
+            # - IVFFlat과 달리 학습(lists) 단계가 없어 적재 직후/증분 추가에도 재구축 불필요
+            HnswIndex(
+                name='idx_course_embedding_hnsw',
+                fields=['embedding'],
+                m=16,
+                ef_construction=64,
+                opclasses=['vector_cosine_ops'],
+                condition=Q(is_canonical=True),
+            ),
         ]
 
 
@@ -273,3 +518,286 @@ class CourseReview(models.Model):
 
     def __str__(self):
         return f"{self.user} reviews {self.course} ({self.rating})"
+
+
+
+class CourseRatingStats(models.Model):
+    """
+    [설계의도]
+    - 강좌별 평점 통계(평균, 리뷰 수, 점수 분포)를 미리 계산해 두는 비정규화 테이블
+    - 목록/검색/상세 API가 요청마다 리뷰 테이블을 JOIN + GROUP BY 하지 않도록 함
+
+    [상세고려사항]
+    - Course와 1:1 (course를 PK로 사용) -> course.rating_stats 로 접근
+    - CourseReview 생성/수정/삭제 시 signals.py에서 refresh_for_course() 호출로 갱신
+    - bulk_create 등 signal을 우회한 쓰기 이후에는 rebuild_rating_stats 커맨드로 전체 재계산
+    - average_rating/review_count에 인덱스를 두어 평점순/리뷰순 정렬을 인덱스 스캔으로 처리
+    """
+
+    course = models.OneToOneField(
+        "courses.Course",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rating_stats",
+        help_text="통계 대상 강좌"
+    )
+
+    average_rating = models.FloatField(default=0.0, help_text="평균 평점 (리뷰 없으면 0.0)")
+    review_count = models.PositiveIntegerField(default=0, help_text="리뷰 개수")
+
+    # 점수 분포 (1~5점 각각의 리뷰 수)
+    rating_1_count = models.PositiveIntegerField(default=0, help_text="1점 리뷰 수")
+    rating_2_count = models.PositiveIntegerField(default=0, help_text="2점 리뷰 수")
+    rating_3_count = models.PositiveIntegerField(default=0, help_text="3점 리뷰 수")
+    rating_4_count = models.PositiveIntegerField(default=0, help_text="4점 리뷰 수")
+    rating_5_count = models.PositiveIntegerField(default=0, help_text="5점 리뷰 수")
+
+    updated_at = models.DateTimeField(auto_now=True, help_text="통계 갱신 시각")
+
+    RATING_SCORES = (1, 2, 3, 4, 5)
+
+    class Meta:
+        db_table = "course_rating_stats"
+        verbose_name = "강좌 평점 통계"
+        verbose_name_plural = "강좌 평점 통계 목록"
+        indexes = [
+            models.Index(fields=["-average_rating"], name="idx_rating_stats_avg"),
+            models.Index(fields=["-review_count"], name="idx_rating_stats_count"),
+        ]
+
+    def __str__(self):
+        return f"{self.course_id} ({self.average_rating}, {self.review_count})"
+
+    @property
+    def rating_distribution(self):
+        """점수별 리뷰 수 ({"1": n, ..., "5": n})"""
+        return {str(score): getattr(self, f"rating_{score}_count") for score in self.RATING_SCORES}
+
+    @classmethod
+    def aggregate_expressions(cls, prefix=""):
+        """
+        [설계 의도]
+        - 단건 갱신(refresh_for_course)과 전체 재계산(rebuild)이 같은 집계식을 쓰도록 공통화
+        - prefix: Course 기준 집계 시 'reviews__' 를 붙여 사용
+        """
+        expressions = {
+            "average_rating": Coalesce(Avg(f"{prefix}rating"), 0.0),
+            "review_count": Count(f"{prefix}id"),
+        }
+        for score in cls.RATING_SCORES:
+            expressions[f"rating_{score}_count"] = Count(
+                f"{prefix}id", filter=Q(**{f"{prefix}rating": score})
+            )
+        return expressions
+
+    @classmethod
+    def refresh_for_course(cls, course_id):
+        """
+        [설계 의도]
+        - 특정 강좌의 통계를 리뷰 테이블 기준으로 다시 계산하여 저장
+
+        [상세 고려사항]
+        - 통계 행을 select_for_update()로 잠근 뒤 집계하므로,
+          동시에 리뷰가 작성되어도 나중에 커밋된 쪽이 최신 값을 반영함
+        - 행이 없으면 ignore_conflicts로 먼저 생성 (동시 생성 경합 시 IntegrityError 방지)
+        """
+        with transaction.atomic():
+            cls.objects.bulk_create([cls(course_id=course_id)], ignore_conflicts=True)
+            stats = cls.objects.select_for_update().get(course_id=course_id)
+
+            values = CourseReview.objects.filter(course_id=course_id).aggregate(
+                **cls.aggregate_expressions()
+            )
+            for field, value in values.items():
+                setattr(stats, field, value)
+            stats.save()
+        return stats
+
+    @classmethod
+    def rebuild(cls, batch_size=1000):
+        """
+        [설계 의도]
+        - 전체 강좌의 통계를 리뷰 테이블 기준으로 재계산 (rebuild_rating_stats 커맨드에서 사용)
+
+        [상세 고려사항]
+        - 강좌 단위 GROUP BY 한 번으로 집계 후 batch_size 단위 upsert
+        - 리뷰가 없는 강좌도 0으로 채운 행을 생성하여 목록 정렬 시 NULL이 생기지 않도록 함
+        - bulk_create는 signal을 발생시키지 않으므로 완료 후 목록/상세 캐시, 자동완성 인덱스 세대를 직접 무효화
+        """
+        fields = list(cls.aggregate_expressions().keys())
+        rows = (
+            Course.objects.order_by()
+            .annotate(**cls.aggregate_expressions(prefix="reviews__"))
+            .values("id", *fields)
+        )
+
+        total = 0
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append(cls(course_id=row["id"], **{field: row[field] for field in fields}))
+            if len(batch) >= batch_size:
+                total += cls._upsert(batch, fields)
+                batch = []
+        if batch:
+            total += cls._upsert(batch, fields)
+        invalidate_course_list()
+        invalidate_course_detail()
+        invalidate_course_suggest()
+        return total
+
+    @classmethod
+    def _upsert(cls, batch, fields):
+        cls.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=["course"],
+            update_fields=fields + ["updated_at"],
+        )
+        return len(batch)
+
+
+class QueryEmbedding(models.Model):
+    """
+    [설계 의도]
+    - 시맨틱 검색 질의문 임베딩의 영구 캐시 테이블
+    - 자주 반복되는 검색어는 임베딩 API를 다시 호출하지 않고 저장된 벡터를 재사용
+
+    [상세고려사항]
+    - (모델명, 정규화된 질의문)의 해시를 유일 키로 사용 -> 모델이 바뀌면 자동으로 다른 키
+    - 프로세스 내 LRU(embedding_cache.py) 미스 시에만 조회되므로 DB 부하는 작음
+    - hit_count/last_used_at으로 인기 검색어 확인 및 오래된 행 정리
+      (LRU/DB 적중을 프로세스별로 모아 주기적으로 일괄 반영 -> 실시간 값은 아님)
+    - 검색어 종류만큼 계속 늘어나므로 prune_query_embeddings 커맨드(prune())로 주기적으로 정리
+    """
+
+    query_hash = models.CharField(max_length=64, unique=True, help_text="sha256(모델명 + 정규화 질의문)")
+    model = models.CharField(max_length=100, help_text="임베딩 모델명")
+    query_text = models.TextField(help_text="정규화된 질의문")
+    embedding = VectorField(dimensions=1536)
+
+    hit_count = models.PositiveIntegerField(default=0, help_text="캐시 재사용 횟수")
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now_add=True, help_text="마지막 재사용 시각")
+
+    class Meta:
+        db_table = "query_embedding"
+        verbose_name = "질의 임베딩 캐시"
+        verbose_name_plural = "질의 임베딩 캐시 목록"
+        indexes = [
+            models.Index(fields=["last_used_at"], name="idx_query_embedding_used"),
+        ]
+
+    def __str__(self):
+        return f"[{self.model}] {self.query_text[:50]}"
+
+    @classmethod
+    def prune(cls, max_age_days=None, max_rows=None):
+        """
+        [처리 흐름]
+        1. max_age_days: 마지막 사용이 그보다 오래된 행 삭제
+        2. max_rows: 최근 사용순으로 max_rows개만 남기고 삭제 (last_used_at 인덱스로 기준 시각 1건만 조회)
+
+        Returns:
+            삭제된 행 수
+        """
+        deleted = 0
+        if max_age_days is not None:
+            cutoff = timezone.now() - datetime.timedelta(days=max_age_days)
+            deleted += cls.objects.filter(last_used_at__lt=cutoff).delete()[0]
+
+        if max_rows is not None:
+            cutoff = (
+                cls.objects.order_by('-last_used_at', '-id')
+                .values_list('last_used_at', 'id')[max_rows:max_rows + 1]
+                .first()
+            )
+            if cutoff is not None:
+                last_used_at, row_id = cutoff
+                deleted += cls.objects.filter(
+                    Q(last_used_at__lt=last_used_at) | Q(last_used_at=last_used_at, id__lte=row_id)
+                ).delete()[0]
+        return deleted
+
+
+class CourseNeighbor(models.Model):
+    """
+    [설계 의도]
+    - 강좌별 유사 강좌(top-K)를 미리 계산해 두는 추천 테이블 (build_course_neighbors 커맨드로 생성)
+    - 추천 API가 요청마다 임베딩 조회 + kNN + 중복 제거를 하지 않고 (course, rank) 인덱스 조회 한 번으로 응답
+
+    [상세고려사항]
+    - neighbor는 대표 강좌(is_canonical)만, 같은 시리즈(series_key)는 제외된 상태로 저장 (중복 제거 완료)
+    - 임베딩은 적재(import) 시에만 바뀌므로 적재/임베딩 생성 후 커맨드를 다시 실행하면 됨
+    - 강좌 삭제 시 양쪽 FK 모두 CASCADE로 정리
+    """
+
+    course = models.ForeignKey(
+        "courses.Course",
+        on_delete=models.CASCADE,
+        related_name="neighbors",
+        help_text="기준 강좌"
+    )
+    neighbor = models.ForeignKey(
+        "courses.Course",
+        on_delete=models.CASCADE,
+        related_name="recommended_in",
+        help_text="유사 강좌 (대표 강좌)"
+    )
+    rank = models.PositiveSmallIntegerField(help_text="유사도 순위 (1부터)")
+    score = models.FloatField(help_text="코사인 유사도")
+
+    class Meta:
+        db_table = "course_neighbor"
+        verbose_name = "유사 강좌"
+        verbose_name_plural = "유사 강좌 목록"
+        constraints = [
+            models.UniqueConstraint(fields=["course", "rank"], name="unique_course_neighbor_rank"),
+        ]
+
+    def __str__(self):
+        return f"{self.course_id} -> {self.neighbor_id} (#{self.rank})"
+
+
+class CourseSyncOutbox(models.Model):
+    """
+    [설계 의도]
+    - Course 변경을 Elasticsearch에 반영하기 위한 transactional outbox
+    - 강좌 저장/삭제와 같은 트랜잭션에서 변경된 강좌 id만 기록 -> sync_es_outbox 워커가 배치로 ES에 반영
+      (트랜잭션이 롤백되면 outbox 행도 함께 사라지므로 DB와 ES가 어긋나지 않음)
+
+    [상세고려사항]
+    - 삭제된 강좌도 기록해야 하므로 FK가 아닌 id 값으로 저장
+    - 작업 종류(색인/삭제)는 기록하지 않고 처리 시점의 DB 상태로 결정 (같은 강좌의 중복 행도 한 번만 반영)
+      - 강좌가 있고 임베딩이 있으면 색인, 없으면 ES 문서 삭제
+    - 실패 시 attempts 증가 + available_at 백오프, max_attempts 초과 시 status='dead' (dead letter)
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_DEAD = "dead"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_DEAD, "처리 실패(dead letter)"),
+    ]
+
+    course_id = models.BigIntegerField(help_text="변경된 강좌 id (삭제된 강좌 포함)")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0, help_text="ES 반영 시도 횟수")
+    last_error = models.TextField(blank=True, default="", help_text="마지막 실패 사유")
+    available_at = models.DateTimeField(default=timezone.now, help_text="다음 처리 가능 시각 (재시도 백오프)")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "course_sync_outbox"
+        verbose_name = "강좌 ES 동기화 대기열"
+        verbose_name_plural = "강좌 ES 동기화 대기열 목록"
+        indexes = [
+            models.Index(fields=["status", "available_at"], name="idx_course_outbox_pending"),
+        ]
+
+    def __str__(self):
+        return f"course {self.course_id} ({self.status}, {self.attempts}회)"
+
+    @classmethod
+    def enqueue(cls, course_ids):
+        """변경된 강좌 id 기록 (호출한 쪽의 트랜잭션에 포함)"""
+        cls.objects.bulk_create([cls(course_id=course_id) for course_id in course_ids])
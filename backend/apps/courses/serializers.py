@@ -1,6 +1,5 @@
 from rest_framework import serializers
-from django.db.models import Avg
-from apps.courses.models import Course, Wishlist, CourseReview
+from apps.courses.models import Course, Wishlist, CourseReview, CourseRatingStats
 
 # 개요
 """
@@ -14,12 +13,12 @@ class CourseListSerializer(serializers.ModelSerializer):
     """
     [설계 의도]
     - 강좌 목록 조회용 간단한 Serializer
-    - average_rating, review_count는 annotate로 계산된 값 사용 # 최적화
+    - average_rating, review_count는 annotate로 읽어온 값 사용 # 최적화
 
     [상세 고려사항]
     - CourseDetailSerializer보다 간소화 (summary 제외)
-    - average_rating: View에서 annotate(Avg('reviews__rating'))
-    - review_count: View에서 annotate(Count('reviews'))
+    - average_rating: View에서 Course.objects.with_rating_stats()로 annotate (CourseRatingStats 값)
+    - review_count: View에서 Course.objects.with_rating_stats()로 annotate (CourseRatingStats 값)
     - SerializerMethodField 대신 annotated 필드 직접 사용 (성능 최적화)
     """
 
@@ -73,11 +72,19 @@ class CourseDetailSerializer(serializers.ModelSerializer):
     1. is_wished: 현재 로그인한 유저의 찜 여부 (True/False)
     2. rating: 해당 강좌의 평균 별점 (리뷰 기반)
     3. review_count: 해당 강좌에 달린 전체 수강평 개수
+    4. rating_distribution: 점수(1~5)별 수강평 개수
+
+    [상세 고려사항]
+    - rating, review_count, rating_distribution은 CourseRatingStats에 미리 계산된 값을 사용
+      (View에서 with_rating_stats() + select_related('rating_stats')로 함께 조회)
+    - ai_summary는 View에서 select_related('ai_review')로 함께 조회 (추가 쿼리 없음)
+    - CourseDetailView는 request 없이 직렬화한 결과를 강좌별로 캐시하고 is_wished만 요청마다 계산
     """
     
     is_wished = serializers.SerializerMethodField()
     rating = serializers.SerializerMethodField()
     review_count = serializers.SerializerMethodField()
+    rating_distribution = serializers.SerializerMethodField()
     ai_summary = serializers.SerializerMethodField()
 
     class Meta:
@@ -86,7 +93,7 @@ class CourseDetailSerializer(serializers.ModelSerializer):
             'id', 'kmooc_id', 'name', 'org_name', 'professor',
             'classfy_name', 'middle_classfy_name', 'summary', 'raw_summary',
             'course_image', 'url', 'week', 'course_playtime',
-            'certificate_yn', 'is_wished', 'rating', 'review_count',
+            'certificate_yn', 'is_wished', 'rating', 'review_count', 'rating_distribution',
             'enrollment_start', 'enrollment_end', 'study_start', 'study_end',
             'ai_summary'
         ]
@@ -105,23 +112,35 @@ class CourseDetailSerializer(serializers.ModelSerializer):
     def get_rating(self, obj):
         """
         [로직] 
-        - CourseReview 모델에서 해당 강좌의 rating 평균값 계산
+        - with_rating_stats()로 annotate된 평균 평점 사용
         - 리뷰가 없을 경우 기본값 0.0 반환
         """
-        avg_rating = CourseReview.objects.filter(course=obj).aggregate(Avg('rating'))['rating__avg']
+        avg_rating = getattr(obj, 'average_rating', None)
         return round(avg_rating, 1) if avg_rating else 0.0
 
     def get_review_count(self, obj):
         """
         [로직] 
-        - 해당 강좌에 달린 수강평의 총 개수 반환
+        - with_rating_stats()로 annotate된 수강평 개수 반환
+        """
+        return getattr(obj, 'review_count', None) or 0
+
+    def get_rating_distribution(self, obj):
+        """
+        [로직]
+        - CourseRatingStats의 점수별 리뷰 수 반환
+        - 통계 행이 아직 없으면(리뷰 0개) 모두 0으로 반환
         """
-        return CourseReview.objects.filter(course=obj).count()
+        try:
+            return obj.rating_stats.rating_distribution
+        except CourseRatingStats.DoesNotExist:
+            return {str(score): 0 for score in CourseRatingStats.RATING_SCORES}
 
     def get_ai_summary(self, obj):
         """
         [로직]
         - CourseAIReview 모델에서 생성된 강좌 요약 반환
+        - select_related('ai_review')로 조회한 경우 AI 평가가 없어도 추가 쿼리 없이 None
         """
         if hasattr(obj, 'ai_review'):
             return obj.ai_review.course_summary
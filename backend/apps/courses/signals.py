@@ -0,0 +1,77 @@
+# backend/apps/courses/signals.py
+
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caches import invalidate_course_detail, invalidate_course_facets, invalidate_course_list, invalidate_course_suggest
+from .models import Course, CourseRatingStats, CourseReview, CourseSyncOutbox
+
+
+def _is_course_cascade(origin):
+    """Course 삭제에 의한 CASCADE 삭제인지 판별 (삭제될 강좌의 통계를 다시 만들지 않기 위함)"""
+    if isinstance(origin, Course):
+        return True
+    return isinstance(origin, QuerySet) and origin.model is Course
+
+
+@receiver(post_save, sender=CourseReview)
+def refresh_rating_stats_on_save(sender, instance, **kwargs):
+    # 리뷰 작성/수정 -> 해당 강좌 평점 통계 재계산
+    CourseRatingStats.refresh_for_course(instance.course_id)
+    invalidate_course_list()
+    invalidate_course_detail(instance.course_id)
+    invalidate_course_suggest()
+
+
+@receiver(post_delete, sender=CourseReview)
+def refresh_rating_stats_on_delete(sender, instance, origin=None, **kwargs):
+    # 리뷰 삭제 -> 해당 강좌 평점 통계 재계산 (강좌 자체가 삭제되는 경우는 제외)
+    if _is_course_cascade(origin):
+        return
+    CourseRatingStats.refresh_for_course(instance.course_id)
+    invalidate_course_list()
+    invalidate_course_detail(instance.course_id)
+    invalidate_course_suggest()
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_course_list_on_course_change(sender, **kwargs):
+    # 강좌 추가/수정/삭제 -> 강좌 목록 캐시 전체 무효화 (세대 번호 증가)
+    invalidate_course_list()
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_course_detail_on_course_change(sender, instance, **kwargs):
+    # 강좌 수정/삭제 -> 해당 강좌 상세 캐시 삭제
+    invalidate_course_detail(instance.pk)
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_course_facets_on_course_change(sender, **kwargs):
+    # 강좌 추가/수정/삭제 -> 분류/운영기관별 강좌 수가 바뀔 수 있으므로 패싯 캐시 전체 무효화
+    invalidate_course_facets()
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_course_suggest_on_course_change(sender, **kwargs):
+    # 강좌 추가/수정/삭제 -> 자동완성 대상(대표 강좌명/교수명)이 바뀔 수 있으므로 인덱스 세대 증가
+    invalidate_course_suggest()
+
+
+@receiver(post_save, sender='comparisons.CourseAIReview')
+@receiver(post_delete, sender='comparisons.CourseAIReview')
+def invalidate_course_detail_on_ai_review_change(sender, instance, **kwargs):
+    # AI 평가 생성/재생성/삭제 -> 상세 응답의 ai_summary가 바뀌므로 해당 강좌 상세 캐시 삭제
+    invalidate_course_detail(instance.course_id)
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def enqueue_es_sync_on_course_change(sender, instance, **kwargs):
+    # 강좌 추가/수정/삭제 -> 같은 트랜잭션에서 ES 동기화 outbox에 기록 (sync_es_outbox 워커가 반영)
+    CourseSyncOutbox.enqueue([instance.pk])
@@ -0,0 +1,175 @@
+# backend/apps/courses/suggest_index.py
+
+"""
+[설계 의도]
+- 검색창 자동완성(search-as-you-type)용 프로세스 내 접두사 인덱스
+- 대표 강좌의 (id, 강좌명, 교수명)만 정렬된 키 목록으로 메모리에 보관
+  -> 키 입력마다 ES 퍼지 검색 + DB hydration을 거치지 않고 이진 탐색 한 번으로 응답 (수십 µs ~ 수 ms)
+
+[상세 고려사항]
+- 키: 정규화된 강좌명(NFKC + 소문자 + 공백 정리, 질의 임베딩 캐시와 같은 규칙)과
+  강좌명의 각 단어부터 시작하는 뒷부분 (예: "파이썬 데이터 분석" -> "데이터 분석", "분석")
+  -> 강좌명 중간 단어로 입력해도 일치
+- 순위: 강좌명 시작 일치 > 단어 시작 일치, 같은 순위면 리뷰 수 많은 순, 강좌명 순
+- 갱신: 자동완성 전용 세대(course_suggest_cache) 사용
+  강좌 추가/수정/삭제, 대표 강좌 갱신, 대량 적재, 리뷰 작성/삭제(순위의 리뷰 수), 평점 통계 재계산 시 증가
+- 1~2글자 입력은 일치 구간이 가장 넓으므로 접두사별 상위 MAX_LIMIT개를 구축 시점에 미리 계산 (탐색 없이 조회)
+  3글자 이상은 일치 구간 전체를 순위 비교 (구간이 좁으므로 상한 없이도 빠름, 항상 정확한 상위 N개)
+- 구축/재구축은 워커별 백그라운드 스레드에서만 수행 (강좌 수천 건 기준 쿼리 1번 + 수십 ms)
+  - 워커 시작 시 config/wsgi.py, asgi.py에서 start() -> 첫 요청 전에 구축 시작
+  - VERSION_CHECK_INTERVAL초마다 세대 번호 확인 -> 바뀌었으면 새 인덱스를 만든 뒤 참조만 교체
+  - 요청은 self._loaded를 읽기만 함 (락 대기, 공유 캐시 조회, DB 조회 없음)
+  - 구축 실패 시 기존 인덱스 유지, 최초 구축 전 요청은 빈 목록
+"""
+
+import bisect
+import heapq
+import logging
+import threading
+import time
+
+from django.db import connection
+
+from .caches import course_suggest_cache
+from .embedding_cache import normalize_query
+from .models import Course
+
+VERSION_CHECK_INTERVAL = 5  # 강좌 변경 확인 주기 (초)
+PRECOMPUTED_PREFIX_LEN = 2  # 이 길이 이하 접두사는 결과를 미리 계산
+MAX_LIMIT = 20              # 결과 수 상한 (짧은 접두사 결과를 이 개수만큼 미리 계산)
+MATCH_NAME_PREFIX = 0       # 강좌명 시작 일치
+MATCH_WORD_PREFIX = 1       # 강좌명 중간 단어 시작 일치
+
+logger = logging.getLogger(__name__)
+
+
+class CourseSuggestIndex:
+    """
+    [사용 예]
+        results = course_suggest_index.suggest('파이', limit=10)
+        -> [{'id': 1, 'name': '파이썬 기초', 'professor': '홍길동'}, ...] (순위순)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = None        # 현재 로드된 인덱스 (dict, 재구축 시 참조만 교체)
+        self._thread = None
+
+    @property
+    def version(self):
+        loaded = self._loaded
+        return loaded['version'] if loaded else None
+
+    def suggest(self, text, limit):
+        """
+        [처리 흐름]
+        1. 입력 정규화 (빈 문자열이면 빈 목록)
+           PRECOMPUTED_PREFIX_LEN글자 이하면 미리 계산한 결과 반환
+        2. 정렬된 키 목록에서 bisect로 접두사 일치 구간 탐색
+        3. 일치하는 키를 따라가며 강좌별 최고 순위만 남김 (같은 강좌가 여러 키로 일치해도 1번만)
+        4. 순위 상위 limit개 반환
+        """
+        prefix = normalize_query(text)
+        loaded = self._loaded
+        if loaded is None and self._thread is None:
+            # 워커 시작 시 start()가 호출되지 않은 실행 환경 대비 (구축은 백그라운드에서만)
+            self.start()
+        if not prefix or loaded is None:
+            return []
+        limit = min(limit, MAX_LIMIT)
+
+        if len(prefix) <= PRECOMPUTED_PREFIX_LEN:
+            return [loaded['courses'][course_index] for course_index in loaded['prefix_top'].get(prefix, [])[:limit]]
+
+        keys, postings = loaded['keys'], loaded['postings']
+        start = bisect.bisect_left(keys, prefix)
+        # 접두사로 시작하는 키는 [prefix, prefix + U+10FFFF) 구간에 모두 있음
+        end = bisect.bisect_left(keys, prefix + '\U0010ffff', start)
+        best = {}
+        for position in range(start, end):
+            rank, course_index = postings[position]
+            if course_index not in best or rank < best[course_index]:
+                best[course_index] = rank
+
+        top = heapq.nsmallest(limit, best.items(), key=lambda item: item[1])
+        return [loaded['courses'][course_index] for course_index, _ in top]
+
+    # ---- 버전 관리 ----
+
+    def start(self):
+        """백그라운드 갱신 스레드 시작 (워커당 1번, 중복 호출 무시)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name='course-suggest-index', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self.refresh()
+            time.sleep(VERSION_CHECK_INTERVAL)
+
+    def refresh(self):
+        """
+        [처리 흐름]
+        1. 세대 번호 조회 (구축보다 먼저 읽음 -> 구축 중 변경이 생기면 다음 확인 때 다시 구축)
+        2. 로드된 인덱스와 세대가 다르면 새 인덱스 구축 후 참조 교체 (요청은 교체 전까지 기존 인덱스 사용)
+        3. 스레드 전용 DB 연결 정리 (다음 확인까지 연결을 붙잡지 않도록)
+        """
+        try:
+            version = course_suggest_cache.get_generation()
+            if self._loaded is None or self._loaded['version'] != version:
+                self._loaded = self._build(version)
+        except Exception as e:
+            logger.warning("자동완성 인덱스 구축 실패: %s", e)
+            # 기존에 로드된 인덱스가 있으면 계속 사용
+        finally:
+            if threading.current_thread() is self._thread:
+                connection.close()
+
+    def _build(self, version):
+        rows = (
+            Course.objects.canonical()
+            .order_by()
+            .values_list('id', 'name', 'professor', 'rating_stats__review_count')
+        )
+
+        courses = []
+        entries = []
+        for course_id, name, professor, review_count in rows:
+            normalized = normalize_query(name or '')
+            if not normalized:
+                continue
+            course_index = len(courses)
+            courses.append({'id': course_id, 'name': name, 'professor': professor})
+
+            words = normalized.split(' ')
+            for word_index in range(len(words)):
+                match = MATCH_NAME_PREFIX if word_index == 0 else MATCH_WORD_PREFIX
+                rank = (match, -(review_count or 0), normalized, course_id)
+                entries.append((' '.join(words[word_index:]), rank, course_index))
+
+        entries.sort(key=lambda entry: entry[0])
+
+        # 짧은 접두사(1 ~ PRECOMPUTED_PREFIX_LEN글자)별 강좌 최고 순위 -> 상위 MAX_LIMIT개
+        prefix_best = {}
+        for key, rank, course_index in entries:
+            for length in range(1, min(len(key), PRECOMPUTED_PREFIX_LEN) + 1):
+                best = prefix_best.setdefault(key[:length], {})
+                if course_index not in best or rank < best[course_index]:
+                    best[course_index] = rank
+        prefix_top = {
+            prefix: [course_index for course_index, _ in heapq.nsmallest(MAX_LIMIT, best.items(), key=lambda item: item[1])]
+            for prefix, best in prefix_best.items()
+        }
+
+        return {
+            'version': version,
+            'keys': [key for key, _, _ in entries],
+            'postings': [(rank, course_index) for _, rank, course_index in entries],
+            'courses': courses,
+            'prefix_top': prefix_top,
+        }
+
+
+course_suggest_index = CourseSuggestIndex()
@@ -1,3 +1,1243 @@
-from django.test import TestCase
+import base64
+import datetime
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils import timezone
+from elasticsearch import ConnectionError as ESConnectionError
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from .embedding_cache import QueryEmbeddingCache, normalize_query
+from .embedding_profile import pgvector_halfvec_sql, to_serving_vector, truncate_vector
+from .importers import BACKUP_METADATA_FILE, iter_json_array, parse_embedding, sha256_file, upsert_courses
+from .management.commands import make_embeddings, sync_es_outbox
+from .models import Course, CourseNeighbor, CourseRatingStats, CourseReview, CourseSyncOutbox, QueryEmbedding
+from .suggest_index import MAX_LIMIT, CourseSuggestIndex, course_suggest_index
+from .vector_index import CURRENT_FILE, MmapVectorIndex, read_current_version
+from .views import CourseCursorPagination, build_course_filters
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'courses-tests',
+    }
+}
+
+_kmooc_ids = itertools.count(1)
+
+
+def make_course(name, professor='교수', is_canonical=True, **fields):
+    """테스트용 강좌 생성 (기본: 대표 강좌)"""
+    return Course.objects.create(
+        kmooc_id=f'test-{next(_kmooc_ids)}',
+        name=name,
+        professor=professor,
+        is_canonical=is_canonical,
+        **fields,
+    )
+
+
+def embedding(*components):
+    """앞쪽 차원에 components 값을 넣은 1536차원 벡터"""
+    vector = np.zeros(1536, dtype=np.float32)
+    vector[:len(components)] = components
+    return vector
+
+
+def make_user(username='tester'):
+    return get_user_model().objects.create_user(username=username, email=f'{username}@example.com', password='pw-12345')
+
+
+@override_settings(CACHES=LOCMEM_CACHES, ALLOWED_HOSTS=['*'], HTTP_CACHE_SHARED_MAX_AGE=60)
+class CourseAPITestCase(APITestCase):
+    """캐시를 비운 상태에서 시작하는 API 테스트 공통 설정"""
+
+    def setUp(self):
+        cache.clear()
+
+
+# ========================
+# 1. 조건부 GET (ETag / 304)
+# ========================
+
+class ConditionalGetAPITests(CourseAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.course = make_course('파이썬 기초')
+
+    def test_course_list_304_on_matching_etag(self):
+        url = reverse('course-list')
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(second.content, b'')
+
+    def test_course_list_etag_changes_after_course_update(self):
+        url = reverse('course-list')
+        first = self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.course.name = '파이썬 심화'
+            self.course.save()
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second['ETag'], first['ETag'])
+
+    def test_course_detail_304_and_private_when_logged_in(self):
+        url = reverse('course-detail', args=[self.course.pk])
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('public', first['Cache-Control'])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        self.client.force_authenticate(make_user())
+        logged_in = self.client.get(url)
+
+        self.assertIn('private', logged_in['Cache-Control'])
+
+
+# ========================
+# 2. 커서(keyset) 페이지네이션
+# ========================
+
+def encode_cursor_payload(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+
+
+class CursorView:
+    """paginate_queryset()에 넘길 View 대역 (확정된 정렬 키만 필요)"""
+
+    def __init__(self, ordering_key):
+        self.ordering_key = ordering_key
+
+
+class CourseCursorPaginationTests(TestCase):
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def paginate(self, ordering, params):
+        paginator = CourseCursorPagination()
+        request = Request(self.factory.get('/api/v1/courses/', params))
+        page = paginator.paginate_queryset(
+            Course.objects.canonical().with_rating_stats(), request, view=CursorView(ordering)
+        )
+        return paginator, page
+
+    def cursor_from(self, link):
+        return Request(self.factory.get(link)).query_params['cursor']
+
+    def test_cursor_round_trip(self):
+        courses = [make_course(f'강좌 {index}') for index in range(5)]
+
+        paginator, first_page = self.paginate('name', {'page_size': 2})
+        next_cursor = self.cursor_from(paginator.get_next_link())
+        decoded = json.loads(base64.urlsafe_b64decode(next_cursor))
+        _, second_page = self.paginate('name', {'page_size': 2, 'cursor': next_cursor})
+
+        self.assertEqual(decoded, {'f': 'name', 'v': '강좌 1', 'id': courses[1].id, 'r': False})
+        self.assertEqual([course.id for course in first_page], [courses[0].id, courses[1].id])
+        self.assertEqual([course.id for course in second_page], [courses[2].id, courses[3].id])
+
+    def test_ordering_mismatch_is_rejected(self):
+        cursor = encode_cursor_payload({'f': 'name', 'v': '강좌', 'id': 1, 'r': False})
+
+        with self.assertRaises(NotFound):
+            self.paginate('-average_rating', {'cursor': cursor})
+
+    def test_malformed_cursor_is_rejected(self):
+        with self.assertRaises(NotFound):
+            self.paginate('name', {'cursor': 'not-base64!'})
+
+    def test_null_ordering_values_are_not_skipped(self):
+        # study_start NULL 강좌는 date.min으로 치환되어 맨 뒤(내림차순)에서도 누락/중복 없이 순회
+        dated = [make_course(f'강좌 {index}', study_start=datetime.date(2024, 1, index + 1)) for index in range(2)]
+        undated = [make_course(f'미정 {index}') for index in range(3)]
+
+        seen = []
+        params = {'page_size': 2}
+        while True:
+            paginator, page = self.paginate('-study_start', params)
+            seen += [course.id for course in page]
+            next_link = paginator.get_next_link()
+            if not next_link:
+                break
+            params = {'page_size': 2, 'cursor': self.cursor_from(next_link)}
+
+        expected = [dated[1].id, dated[0].id] + sorted((course.id for course in undated), reverse=True)
+        self.assertEqual(seen, expected)
+
+
+class CourseCursorPaginationAPITests(CourseAPITestCase):
+
+    def test_next_and_previous_links_round_trip(self):
+        # 평점이 모두 같음(0.0) -> id 타이브레이커로 순서 고정
+        ids = [make_course(f'강좌 {index}').id for index in range(7)]
+        url = reverse('course-list') + '?pagination=cursor&page_size=3'
+
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            pages.append([course['id'] for course in response.data['results']])
+            previous, url = response.data['previous'], response.data['next']
+
+        self.assertEqual(sum(pages, []), sorted(ids, reverse=True))
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+
+        # 마지막 페이지의 previous -> 바로 앞 페이지
+        response = self.client.get(previous)
+        self.assertEqual([course['id'] for course in response.data['results']], pages[1])
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(reverse('course-list'), {'pagination': 'cursor', 'cursor': 'broken'})
+
+        self.assertEqual(response.status_code, 404)
+
+
+# ========================
+# 3. 목록/상세 캐시 무효화
+# ========================
+
+class CourseCacheInvalidationAPITests(CourseAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.course = make_course('파이썬 기초')
+        self.user = make_user()
+
+    def test_review_save_refreshes_cached_list_and_detail(self):
+        list_url = reverse('course-list')
+        detail_url = reverse('course-detail', args=[self.course.pk])
+        self.assertEqual(self.client.get(list_url).data['results'][0]['review_count'], 0)
+        self.assertEqual(self.client.get(detail_url).data['review_count'], 0)
+
+        # 캐시 히트 확인 (두 번째 요청은 쿼리 없음)
+        with self.assertNumQueries(0):
+            self.client.get(list_url)
+
+        # 무효화는 커밋 이후에 반영되므로 on_commit 콜백 실행
+        with self.captureOnCommitCallbacks(execute=True):
+            CourseReview.objects.create(user=self.user, course=self.course, rating=4, review_text='좋아요')
+
+        course_data = self.client.get(list_url).data['results'][0]
+        self.assertEqual(course_data['review_count'], 1)
+        self.assertEqual(course_data['average_rating'], 4.0)
+        self.assertEqual(self.client.get(detail_url).data['review_count'], 1)
+
+    def test_uncommitted_change_does_not_invalidate(self):
+        list_url = reverse('course-list')
+        self.client.get(list_url)
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            CourseReview.objects.create(user=self.user, course=self.course, rating=5, review_text='최고')
+
+        self.assertTrue(callbacks)
+        self.assertEqual(self.client.get(list_url).data['results'][0]['review_count'], 0)
+
+
+# ========================
+# 4. 질의 임베딩 캐시 (LRU + DB)
+# ========================
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QueryEmbeddingCacheTests(TestCase):
+
+    def setUp(self):
+        self.cache = QueryEmbeddingCache(max_size=2)
+        self.fetched = []
+
+    def fetch(self, text):
+        self.fetched.append(text)
+        return [float(len(self.fetched))] * 1536
+
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query('  Python\u3000  Basics '), 'python basics')
+        self.assertEqual(normalize_query('ＡＢＣ'), 'abc')
+
+    def test_api_receives_original_text_and_variants_share_key(self):
+        first = self.cache.get_or_fetch('  Python  Basics ', 'model', self.fetch)
+        second = self.cache.get_or_fetch('python basics', 'model', self.fetch)
+
+        self.assertEqual(self.fetched, ['Python  Basics'])
+        self.assertIs(first, second)
+        self.assertEqual(QueryEmbedding.objects.get().query_text, 'python basics')
+
+    def test_db_hit_after_lru_clear_without_writes(self):
+        self.cache.get_or_fetch('파이썬', 'model', self.fetch)
+        self.cache.clear()
+
+        with self.assertNumQueries(1):  # 조회 1번, 사용 기록 UPDATE 없음
+            vector = self.cache.get_or_fetch('파이썬', 'model', self.fetch)
+
+        self.assertEqual(vector.shape, (1536,))
+        self.assertEqual(len(self.fetched), 1)
+        self.assertEqual(self.cache.local_stats(), {'lru_hits': 0, 'db_hits': 1, 'api_calls': 1, 'size': 1})
+
+    def test_vectors_are_read_only_float32_arrays(self):
+        # float 리스트 대신 float32 배열로 보관 (LRU 항목당 약 6KB)
+        vector = self.cache.get_or_fetch('파이썬', 'model', self.fetch)
+        self.cache.clear()
+        from_db = self.cache.get_or_fetch('파이썬', 'model', self.fetch)
+
+        for array in (vector, from_db):
+            self.assertEqual(array.dtype, np.float32)
+            self.assertFalse(array.flags.writeable)
+        np.testing.assert_array_equal(vector, from_db)
+
+    def test_lru_evicts_least_recently_used(self):
+        for text in ('a', 'b', 'c'):
+            self.cache.get_or_fetch(text, 'model', self.fetch)
+
+        self.assertEqual(self.cache.local_stats()['size'], 2)
+        with self.assertNumQueries(1):  # 'a'는 LRU에서 밀려나 DB 조회
+            self.cache.get_or_fetch('a', 'model', self.fetch)
+        with self.assertNumQueries(0):
+            self.cache.get_or_fetch('c', 'model', self.fetch)
+
+    def test_model_is_part_of_key(self):
+        self.cache.get_or_fetch('파이썬', 'model-a', self.fetch)
+        self.cache.get_or_fetch('파이썬', 'model-b', self.fetch)
+
+        self.assertEqual(len(self.fetched), 2)
+
+    def test_failed_fetch_is_not_cached(self):
+        self.assertIsNone(self.cache.get_or_fetch('파이썬', 'model', lambda text: None))
+        self.assertIsNone(self.cache.get_or_fetch('   ', 'model', self.fetch))
+
+        self.assertFalse(QueryEmbedding.objects.exists())
+        self.assertEqual(self.fetched, [])
+
+    def test_flush_hits_batches_usage(self):
+        self.cache.get_or_fetch('파이썬', 'model', self.fetch)
+        self.cache.get_or_fetch('파이썬', 'model', self.fetch)
+        self.cache.get_or_fetch('PYTHON', 'model', self.fetch)
+        self.cache.get_or_fetch('python', 'model', self.fetch)
+
+        self.assertEqual(QueryEmbedding.objects.get(query_text='파이썬').hit_count, 0)
+        self.cache.flush_hits()
+
+        hits = dict(QueryEmbedding.objects.values_list('query_text', 'hit_count'))
+        self.assertEqual(hits, {'파이썬': 1, 'python': 1})
+
+
+class QueryEmbeddingPruneTests(TestCase):
+
+    def make_rows(self, *days_ago):
+        now = timezone.now()
+        for index, days in enumerate(days_ago):
+            row = QueryEmbedding.objects.create(
+                query_hash=f'{index:064d}', model='model', query_text=f'질의{index}', embedding=embedding(1.0)
+            )
+            QueryEmbedding.objects.filter(pk=row.pk).update(last_used_at=now - datetime.timedelta(days=days))
+
+    def remaining(self):
+        return sorted(QueryEmbedding.objects.values_list('query_text', flat=True))
+
+    def test_prune_by_age(self):
+        self.make_rows(1, 10, 100)
+
+        self.assertEqual(QueryEmbedding.prune(max_age_days=30), 1)
+        self.assertEqual(self.remaining(), ['질의0', '질의1'])
+
+    def test_prune_keeps_most_recently_used_rows(self):
+        self.make_rows(5, 1, 3, 1)
+
+        self.assertEqual(QueryEmbedding.prune(max_rows=2), 2)
+        self.assertEqual(self.remaining(), ['질의1', '질의3'])
+        self.assertEqual(QueryEmbedding.prune(max_rows=2), 0)
+
+    def test_command(self):
+        self.make_rows(1, 200)
+        out = StringIO()
+
+        call_command('prune_query_embeddings', '--days', '90', stdout=out)
+
+        self.assertEqual(self.remaining(), ['질의0'])
+        self.assertIn('1개 행을 삭제', out.getvalue())
+
+
+# ========================
+# 5. 유사 강좌 사전 계산 (build_course_neighbors)
+# ========================
+
+class BuildCourseNeighborsTests(TestCase):
+
+    def build(self, top_k):
+        call_command('build_course_neighbors', top_k=top_k, stdout=StringIO())
+        return {
+            course_id: list(
+                CourseNeighbor.objects.filter(course_id=course_id).order_by('rank').values_list('neighbor_id', flat=True)
+            )
+            for course_id in Course.objects.values_list('id', flat=True)
+        }
+
+    def test_same_series_candidates_are_masked(self):
+        # 같은 시리즈의 이전 기수(old)는 후보가 아니고, 자기 자신/같은 시리즈도 결과에서 제외
+        old = make_course('파이썬', professor='김교수', is_canonical=False, embedding=embedding(1, 0, 0))
+        latest = make_course('파이썬', professor='김교수', embedding=embedding(1, 0.01, 0))
+        near = make_course('데이터 분석', embedding=embedding(1, 0.5, 0))
+        far = make_course('미술사', embedding=embedding(0, 0, 1))
+
+        neighbors = self.build(top_k=3)
+
+        self.assertEqual(neighbors[latest.id], [near.id, far.id])
+        self.assertEqual(neighbors[old.id], [near.id, far.id])
+        self.assertEqual(neighbors[near.id], [latest.id, far.id])
+        self.assertNotIn(old.id, sum(neighbors.values(), []))
+
+    def test_scores_are_cosine_and_ranks_are_sequential(self):
+        first = make_course('A', embedding=embedding(1, 0))
+        second = make_course('B', embedding=embedding(1, 1))
+        make_course('C', embedding=embedding(0, 1))
+
+        self.build(top_k=2)
+
+        rows = list(CourseNeighbor.objects.filter(course_id=first.id).order_by('rank').values_list('neighbor_id', 'rank', 'score'))
+        self.assertEqual([row[:2] for row in rows], [(second.id, 1), (rows[1][0], 2)])
+        self.assertAlmostEqual(rows[0][2], 1 / np.sqrt(2), places=5)
+        self.assertAlmostEqual(rows[1][2], 0.0, places=5)
+
+    def test_rebuild_replaces_previous_rows(self):
+        make_course('A', embedding=embedding(1, 0))
+        make_course('B', embedding=embedding(0, 1))
+        self.build(top_k=5)
+        self.build(top_k=5)
+
+        self.assertEqual(CourseNeighbor.objects.count(), 2)
+
+
+# ========================
+# 6. 키워드 검색 (대표 강좌 필터 / search_after 페이지 구성)
+# ========================
+
+class FakeES:
+    """ES_CLIENT 대역: 요청 인자를 기록하고 준비된 hits를 정렬 순서대로 돌려줌 (대표 강좌 필터는 DB 값으로 적용)"""
+
+    def __init__(self, hits):
+        self.hits = hits                # [(score, course_id), ...] 점수 내림차순
+        self.requests = []
+
+    def search(self, **kwargs):
+        self.requests.append(kwargs)
+        hits = self.hits
+        if {'term': {'is_canonical': True}} in kwargs['query']['bool'].get('filter', []):
+            canonical_ids = set(Course.objects.canonical().values_list('id', flat=True))
+            hits = [hit for hit in hits if hit[1] in canonical_ids]
+        total = len(hits)
+        if kwargs.get('search_after'):
+            hits = [hit for hit in hits if (-hit[0], hit[1]) > (-kwargs['search_after'][0], kwargs['search_after'][1])]
+        start = kwargs.get('from_', 0)
+        page = hits[start:start + kwargs['size']]
+        response = {'hits': {'hits': [{'_source': {'id': course_id}, 'sort': [score, course_id]} for score, course_id in page]}}
+        if kwargs.get('track_total_hits'):
+            response['hits']['total'] = {'value': total, 'relation': 'eq'}
+        return response
+
+
+class KeywordSearchAPITests(CourseAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.old = make_course('파이썬 기초', professor='김교수', is_canonical=False)
+        self.latest = make_course('파이썬 기초', professor='김교수')
+        self.other = make_course('파이썬 심화')
+        self.third = make_course('파이썬 데이터')
+        self.url = reverse('course-keyword-search')
+
+    def search(self, fake, **params):
+        with mock.patch('apps.courses.views.ES_CLIENT', fake):
+            return self.client.get(self.url, {'search': '파이썬', **params})
+
+    def ids(self, response):
+        return [course['id'] for course in response.data['results']]
+
+    def test_numbered_page_filters_canonical(self):
+        # 이전 기수가 대표 강좌보다 점수가 높아도 시리즈 대표는 대표 강좌 점수 위치에 1번만 노출
+        fake = FakeES([(3.0, self.old.id), (2.5, self.other.id), (2.0, self.latest.id), (1.0, self.third.id)])
+
+        response = self.search(fake, page=1, page_size=2)
+
+        request = fake.requests[0]
+        self.assertNotIn('collapse', request)
+        self.assertIn({'term': {'is_canonical': True}}, request['query']['bool']['filter'])
+        self.assertEqual(request['sort'], [{'_score': 'desc'}, {'id': 'asc'}])
+        self.assertEqual((request['from_'], request['size']), (0, 2))
+        self.assertEqual(self.ids(response), [self.other.id, self.latest.id])
+        self.assertEqual(response.data['count'], 3)
+
+    def test_numbered_and_cursor_modes_return_same_courses(self):
+        hits = [(3.0, self.old.id), (2.5, self.other.id), (2.0, self.latest.id), (1.0, self.third.id)]
+
+        numbered = []
+        for page in (1, 2):
+            response = self.search(FakeES(hits), page=page, page_size=2)
+            numbered += self.ids(response)
+            self.assertEqual(response.data['count'], 3)
+
+        fake = FakeES(hits)
+        first = self.search(fake, pagination='cursor', page_size=2)
+        with mock.patch('apps.courses.views.ES_CLIENT', fake):
+            second = self.client.get(first.data['next'])
+
+        self.assertEqual(numbered, [self.other.id, self.latest.id, self.third.id])
+        self.assertEqual(self.ids(first) + self.ids(second), numbered)
+        self.assertEqual((first.data['count'], second.data['count']), (3, 3))
+
+    def test_numbered_page_offset_and_window_limit(self):
+        fake = FakeES([(3.0, self.latest.id), (2.0, self.other.id), (1.0, self.third.id)])
+
+        response = self.search(fake, page=2, page_size=2)
+        self.assertEqual(fake.requests[0]['from_'], 2)
+        self.assertEqual(self.ids(response), [self.third.id])
+
+        # max_result_window를 넘는 페이지는 ES를 호출하지 않음
+        response = self.search(fake, page=10000, page_size=2)
+        self.assertEqual(len(fake.requests), 1)
+        self.assertEqual(response.data, {'results': [], 'count': 0})
+
+    def test_cursor_pages_follow_search_after(self):
+        fake = FakeES([(3.0, self.latest.id), (2.0, self.other.id), (2.0, self.third.id)])
+
+        first = self.search(fake, pagination='cursor', page_size=2)
+        self.assertEqual(self.ids(first), [self.latest.id, self.other.id])
+        self.assertEqual(first.data['count'], 3)
+        first_request = fake.requests[0]
+        self.assertEqual(first_request['sort'], [{'_score': 'desc'}, {'id': 'asc'}])
+        self.assertIn({'term': {'is_canonical': True}}, first_request['query']['bool']['filter'])
+        self.assertNotIn('pit', first_request)
+
+        with mock.patch('apps.courses.views.ES_CLIENT', fake):
+            second = self.client.get(first.data['next'])
+
+        second_request = fake.requests[1]
+        self.assertEqual(second_request['search_after'], [2.0, self.other.id])
+        self.assertFalse(second_request['track_total_hits'])  # 전체 개수는 cursor로 전달
+        self.assertEqual(self.ids(second), [self.third.id])
+        self.assertEqual(second.data['count'], 3)
+        self.assertIsNone(second.data['next'])
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.search(FakeES([]), pagination='cursor', cursor='broken')
+
+        self.assertEqual(response.status_code, 404)
+
+
+# ========================
+# 7. 임베딩 일괄 생성 체크포인트 (make_embeddings)
+# ========================
+
+class MakeEmbeddingsCheckpointTests(TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base_dir = Path(tmp.name) / 'backend'
+        self.checkpoint_path = os.path.join(tmp.name, 'data', 'backups', make_embeddings.CHECKPOINT_FILENAME)
+        self.command = make_embeddings.Command()
+
+    def test_checkpoint_round_trip_and_mode_mismatch(self):
+        self.assertEqual(self.command._load_checkpoint(self.checkpoint_path, 'missing'), 0)
+
+        self.command._save_checkpoint(self.checkpoint_path, 'missing', 42)
+        self.assertEqual(self.command._load_checkpoint(self.checkpoint_path, 'missing'), 42)
+        self.assertEqual(self.command._load_checkpoint(self.checkpoint_path, 'all'), 0)
+
+        self.command._clear_checkpoint(self.checkpoint_path)
+        self.command._clear_checkpoint(self.checkpoint_path)  # 없어도 오류 없음
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+    def test_corrupt_checkpoint_starts_over(self):
+        os.makedirs(os.path.dirname(self.checkpoint_path))
+        with open(self.checkpoint_path, 'w', encoding='utf-8') as f:
+            f.write('{broken')
+
+        self.assertEqual(self.command._load_checkpoint(self.checkpoint_path, 'missing'), 0)
+
+    def test_batches_respect_input_and_token_limits(self):
+        courses = [Course(id=index, name=f'강좌 {index}') for index in range(1, 6)]
+
+        by_inputs = list(self.command._iter_batches(courses, max_tokens=10 ** 6, max_inputs=2))
+        self.assertEqual([[course_id for course_id, _ in batch] for batch in by_inputs], [[1, 2], [3, 4], [5]])
+
+        one_text_tokens = make_embeddings.count_tokens(make_embeddings.build_embedding_text(courses[0]))
+        by_tokens = list(self.command._iter_batches(courses, max_tokens=one_text_tokens, max_inputs=100))
+        self.assertEqual(len(by_tokens), 5)
+
+    def run_command(self, failing_name=None):
+        def fake_request(command, texts):
+            if failing_name and any(failing_name in text for text in texts):
+                return None, 'Status 500'
+            return [embedding(1.0).tolist() for _ in texts], None
+
+        with override_settings(BASE_DIR=self.base_dir), \
+                mock.patch.dict(os.environ, {'GMS_KEY': 'test-key'}), \
+                mock.patch.object(make_embeddings.Command, '_request_embeddings', fake_request):
+            call_command('make_embeddings', workers=1, batch_inputs=1, stdout=StringIO())
+
+    def test_failed_batch_holds_watermark_and_resume_retries_it(self):
+        courses = [make_course(f'강좌{index}번') for index in range(1, 4)]
+
+        self.run_command(failing_name='강좌2번')
+
+        with_embedding = set(Course.objects.filter(embedding__isnull=False).values_list('id', flat=True))
+        self.assertEqual(with_embedding, {courses[0].id, courses[2].id})
+        # 실패한 배치 앞까지만 워터마크 전진
+        self.assertEqual(self.command._load_checkpoint(self.checkpoint_path, 'missing'), courses[0].id)
+
+        self.run_command()
+
+        self.assertFalse(Course.objects.filter(embedding__isnull=True).exists())
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+
+# ========================
+# 8. ES 동기화 outbox (sync_es_outbox)
+# ========================
+
+class FakeBulk:
+    """streaming_bulk 대역: 전송된 액션을 기록하고 failing_ids 문서는 실패, error가 있으면 요청 자체 실패"""
+
+    def __init__(self, failing_ids=(), missing_ids=(), error=None):
+        self.failing_ids = set(failing_ids)
+        self.missing_ids = set(missing_ids)
+        self.error = error
+        self.actions = []
+
+    def __call__(self, client, actions, **kwargs):
+        if self.error is not None:
+            raise self.error
+        for action in actions:
+            self.actions.append(action)
+            op_type, course_id = action['_op_type'], int(action['_id'])
+            if course_id in self.failing_ids:
+                yield False, {op_type: {'_id': action['_id'], 'status': 500, 'error': {'type': 'boom'}}}
+            elif course_id in self.missing_ids:
+                yield False, {op_type: {'_id': action['_id'], 'status': 404}}
+            else:
+                yield True, {op_type: {'_id': action['_id'], 'status': 200}}
+
+
+class SyncEsOutboxTests(TestCase):
+
+    def setUp(self):
+        self.indexed = make_course('파이썬', embedding=embedding(1.0))
+        self.no_embedding = make_course('통계')
+        CourseSyncOutbox.objects.all().delete()  # 강좌 생성 signal이 남긴 행 제거
+
+    def sync(self, bulk, **options):
+        with mock.patch.object(sync_es_outbox, 'streaming_bulk', bulk), \
+                mock.patch.object(sync_es_outbox, 'get_es_client', return_value=object()):
+            call_command('sync_es_outbox', stdout=StringIO(), **options)
+
+    def test_course_change_enqueues_row(self):
+        self.indexed.name = '파이썬 기초'
+        self.indexed.save()
+
+        self.assertEqual(list(CourseSyncOutbox.objects.values_list('course_id', flat=True)), [self.indexed.id])
+
+    def test_success_indexes_or_deletes_by_db_state(self):
+        CourseSyncOutbox.enqueue([self.indexed.id, self.indexed.id, self.no_embedding.id, 999999])
+        bulk = FakeBulk(missing_ids=[999999])
+
+        self.sync(bulk)
+
+        operations = sorted((action['_op_type'], int(action['_id'])) for action in bulk.actions)
+        # 같은 강좌의 중복 행은 한 번만 전송, 임베딩 없음/삭제된 강좌는 delete (이미 없는 문서의 404는 성공)
+        self.assertEqual(operations, sorted([
+            ('index', self.indexed.id), ('delete', self.no_embedding.id), ('delete', 999999),
+        ]))
+        self.assertFalse(CourseSyncOutbox.objects.exists())
+
+    def test_document_failure_backs_off(self):
+        CourseSyncOutbox.enqueue([self.indexed.id, self.no_embedding.id])
+        before = timezone.now()
+
+        self.sync(FakeBulk(failing_ids=[self.indexed.id]))
+
+        row = CourseSyncOutbox.objects.get()
+        self.assertEqual((row.course_id, row.status, row.attempts), (self.indexed.id, CourseSyncOutbox.STATUS_PENDING, 1))
+        self.assertIn('boom', row.last_error)
+        self.assertGreaterEqual(row.available_at, before + datetime.timedelta(seconds=sync_es_outbox.RETRY_BACKOFF_BASE))
+
+    def test_transport_error_marks_every_row_for_retry(self):
+        CourseSyncOutbox.enqueue([self.indexed.id, self.no_embedding.id])
+
+        self.sync(FakeBulk(error=ESConnectionError('connection refused')))
+
+        rows = CourseSyncOutbox.objects.order_by('course_id')
+        self.assertEqual([row.attempts for row in rows], [1, 1])
+        self.assertTrue(all(row.status == CourseSyncOutbox.STATUS_PENDING for row in rows))
+        self.assertTrue(all('ConnectionError' in row.last_error for row in rows))
+        self.assertTrue(all(row.available_at > timezone.now() for row in rows))
+
+    def test_max_attempts_moves_to_dead_letter_and_requeue(self):
+        CourseSyncOutbox.enqueue([self.indexed.id])
+        CourseSyncOutbox.objects.update(attempts=1)
+
+        self.sync(FakeBulk(failing_ids=[self.indexed.id]), max_attempts=2)
+        row = CourseSyncOutbox.objects.get()
+        self.assertEqual((row.status, row.attempts), (CourseSyncOutbox.STATUS_DEAD, 2))
+
+        # dead letter는 다시 처리하지 않음
+        bulk = FakeBulk()
+        self.sync(bulk)
+        self.assertEqual(bulk.actions, [])
+
+        self.sync(FakeBulk(), requeue_dead=True)
+        row.refresh_from_db()
+        self.assertEqual((row.status, row.attempts), (CourseSyncOutbox.STATUS_PENDING, 0))
+
+    def test_claim_leases_rows(self):
+        CourseSyncOutbox.enqueue([self.indexed.id, self.no_embedding.id])
+        command = sync_es_outbox.Command()
+
+        claimed = command._claim_rows(batch_size=1)
+        claimed_row = CourseSyncOutbox.objects.get(id=claimed[0].id)
+
+        self.assertEqual(len(claimed), 1)
+        self.assertGreater(claimed_row.available_at, timezone.now())
+        # 점유된 행은 만료 전까지 다시 가져가지 않음
+        self.assertEqual([row.id for row in command._claim_rows(batch_size=10)], [
+            row.id for row in CourseSyncOutbox.objects.exclude(id=claimed_row.id)
+        ])
+        self.assertEqual(command._claim_rows(batch_size=10), [])
+
+    def test_loop_survives_unexpected_errors(self):
+        stdout = StringIO()
+        with mock.patch.object(sync_es_outbox.Command, '_drain_batch', side_effect=RuntimeError('db down')), \
+                mock.patch.object(sync_es_outbox.time, 'sleep', side_effect=KeyboardInterrupt), \
+                mock.patch.object(sync_es_outbox, 'get_es_client', return_value=object()):
+            call_command('sync_es_outbox', loop=True, stdout=stdout)
+
+            with self.assertRaises(RuntimeError):
+                call_command('sync_es_outbox', stdout=StringIO())
+
+        self.assertIn('배치 처리 실패', stdout.getvalue())
+
+
+# ========================
+# 9. 스트리밍 적재 / upsert (importers, import_courses)
+# ========================
+
+class StreamingImporterTests(TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = tmp.name
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_iter_json_array_across_buffer_boundaries(self):
+        items = [{'pk': index, 'fields': {'name': f'강좌 {index}', 'tags': ['a, b', '[x]']}} for index in range(20)]
+        path = self.write('items.json', json.dumps(items, ensure_ascii=False, indent=2))
+
+        # 원소보다 작은 버퍼 -> 원소가 경계에서 잘려도 이어서 파싱
+        self.assertEqual(list(iter_json_array(path, read_size=7)), items)
+        self.assertEqual(list(iter_json_array(self.write('empty.json', ' [ ] '))), [])
+
+    def test_iter_json_array_rejects_invalid_files(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_array(self.write('object.json', '{"a": 1}')))
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(self.write('truncated.json', '[{"a": 1}, {"b": '), read_size=4))
+
+    def test_parse_embedding(self):
+        self.assertIsNone(parse_embedding(None))
+        self.assertIsNone(parse_embedding(''))
+        self.assertEqual(parse_embedding('[1, 2.5]').dtype, np.float32)
+        np.testing.assert_array_equal(parse_embedding([1, 2.5]), np.array([1, 2.5], dtype=np.float32))
+
+    def test_upsert_creates_then_updates(self):
+        existing = make_course('이전 이름', professor='김교수')
+        CourseSyncOutbox.objects.all().delete()
+
+        created, updated, errors = upsert_courses(
+            [
+                Course(kmooc_id=existing.kmooc_id, name='새 이름', professor='김교수'),
+                Course(kmooc_id='new-1', name='새 강좌', professor='이교수'),
+            ],
+            ['name', 'professor'],
+        )
+
+        self.assertEqual((created, updated, errors), (1, 1, []))
+        existing.refresh_from_db()
+        self.assertEqual(existing.name, '새 이름')
+        self.assertEqual(existing.series_key, Course.build_series_key('새 이름', '김교수'))
+        # bulk_create는 signal을 거치지 않으므로 outbox를 직접 기록
+        self.assertEqual(
+            set(CourseSyncOutbox.objects.values_list('course_id', flat=True)),
+            set(Course.objects.values_list('id', flat=True)),
+        )
+
+    def test_upsert_dedupes_kmooc_id_within_chunk(self):
+        # 같은 chunk에 같은 kmooc_id가 두 번 -> 마지막 항목으로 1번만 생성
+        with self.assertNumQueries(5):  # 기존 행 조회 + 트랜잭션 1번(upsert, outbox) -> 행 단위 재시도 없음
+            created, updated, errors = upsert_courses(
+                [
+                    Course(kmooc_id='dup', name='처음 값'),
+                    Course(kmooc_id='other', name='다른 강좌'),
+                    Course(kmooc_id='dup', name='마지막 값'),
+                ],
+                ['name'],
+            )
+
+        self.assertEqual((created, updated, errors), (2, 0, []))
+        self.assertEqual(Course.objects.get(kmooc_id='dup').name, '마지막 값')
+        self.assertEqual(Course.objects.count(), 2)
+
+    def test_upsert_falls_back_to_rows_when_chunk_fails(self):
+        created, updated, errors = upsert_courses(
+            [
+                Course(kmooc_id='ok-1', name='정상 1'),
+                Course(kmooc_id='bad', name='x' * 600),  # max_length 초과 -> chunk 전체 실패
+                Course(kmooc_id='ok-2', name='정상 2'),
+            ],
+            ['name'],
+        )
+
+        self.assertEqual((created, updated), (2, 0))
+        self.assertEqual([kmooc_id for kmooc_id, _ in errors], ['bad'])
+        self.assertEqual(set(Course.objects.values_list('kmooc_id', flat=True)), {'ok-1', 'ok-2'})
+
+    def test_import_courses_streams_backup_in_chunks(self):
+        rows = [
+            {'model': 'courses.course', 'pk': index, 'fields': {
+                'kmooc_id': f'k-{index}', 'name': f'강좌 {index}', 'professor': '김교수',
+                'study_start': '2024-03-0%d' % index, 'embedding': json.dumps([0.5] * 1536) if index == 1 else None,
+            }}
+            for index in range(1, 4)
+        ]
+        rows.append({'model': 'courses.course', 'pk': 9, 'fields': {'name': 'kmooc_id 없음'}})
+        self.write('data/backups/backup.json', json.dumps(rows))
+
+        stdout = StringIO()
+        with override_settings(BASE_DIR=Path(self.tmp_dir) / 'backend'):
+            call_command('import_courses', input='backup.json', chunk_size=2, stdout=stdout)
+
+        self.assertEqual(set(Course.objects.values_list('kmooc_id', flat=True)), {'k-1', 'k-2', 'k-3'})
+        self.assertEqual(Course.objects.filter(embedding__isnull=False).count(), 1)
+        self.assertEqual(Course.objects.get(kmooc_id='k-2').study_start, datetime.date(2024, 3, 2))
+        self.assertIn('missing kmooc_id', stdout.getvalue())
+
+
+# ========================
+# 10. 바이너리 백업 (export_course_backup / import_course_backup)
+# ========================
+
+class CourseBackupTests(TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = tmp.name
+        self.backup_dir = os.path.join(tmp.name, 'data', 'backups', 'courses_backup')
+        settings_override = override_settings(BASE_DIR=Path(tmp.name) / 'backend')
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_sha256_file_reads_in_blocks(self):
+        path = os.path.join(self.tmp_dir, 'blob.bin')
+        payload = os.urandom(10000)
+        with open(path, 'wb') as f:
+            f.write(payload)
+
+        self.assertEqual(sha256_file(path, block_size=1024), hashlib.sha256(payload).hexdigest())
+
+    def test_round_trip_restores_metadata_and_embeddings(self):
+        make_course('파이썬', study_start=datetime.date(2024, 3, 1), embedding=embedding(0.6, 0.8))
+        make_course('통계')
+        call_command('export_course_backup', dtype='float16', stdout=StringIO())
+        with open(os.path.join(self.backup_dir, 'manifest.json'), encoding='utf-8') as f:
+            manifest = json.load(f)
+        self.assertEqual((manifest['course_count'], manifest['embedding_count'], manifest['dtype']), (2, 1, 'float16'))
+
+        Course.objects.all().delete()
+        call_command('import_course_backup', stdout=StringIO())
+
+        restored = Course.objects.with_embedding().get(name='파이썬')
+        self.assertEqual(restored.study_start, datetime.date(2024, 3, 1))
+        np.testing.assert_allclose(restored.embedding[:2], [0.6, 0.8], atol=1e-3)
+        self.assertIsNone(Course.objects.with_embedding().get(name='통계').embedding)
+        self.assertTrue(Course.objects.get(name='파이썬').is_canonical)
+
+    def test_corrupt_backup_is_rejected_before_import(self):
+        make_course('파이썬')
+        call_command('export_course_backup', stdout=StringIO())
+        with open(os.path.join(self.backup_dir, BACKUP_METADATA_FILE), 'a', encoding='utf-8') as f:
+            f.write('\n')
+        Course.objects.all().delete()
+
+        with self.assertRaisesMessage(CommandError, '체크섬 불일치'):
+            call_command('import_course_backup', stdout=StringIO())
+        self.assertFalse(Course.objects.exists())
+
+        # 검증 생략 시에는 복원 (빈 줄은 건너뜀)
+        call_command('import_course_backup', skip_verify=True, stdout=StringIO())
+        self.assertTrue(Course.objects.filter(name='파이썬').exists())
+
+
+# ========================
+# 11. 임베딩 저장 프로파일 (embedding_profile)
+# ========================
+
+class EmbeddingProfileTests(SimpleTestCase):
+
+    def test_truncate_vector_renormalizes(self):
+        vector = np.array([3.0, 4.0, 12.0], dtype=np.float64)
+
+        truncated = truncate_vector(vector, 2)
+
+        self.assertEqual(truncated.dtype, np.float32)
+        np.testing.assert_allclose(truncated, [0.6, 0.8], rtol=1e-6)
+
+    def test_truncate_matrix_rows_independently(self):
+        matrix = np.array([[3.0, 4.0, 1.0], [0.0, 2.0, 5.0], [0.0, 0.0, 7.0]])
+
+        truncated = truncate_vector(matrix, 2)
+
+        np.testing.assert_allclose(truncated, [[0.6, 0.8], [0.0, 1.0], [0.0, 0.0]], rtol=1e-6)
+
+    def test_full_dimensions_are_kept_as_is(self):
+        vector = [0.5, 0.25, 0.25]
+
+        np.testing.assert_array_equal(truncate_vector(vector, 3), np.array(vector, dtype=np.float32))
+        np.testing.assert_array_equal(truncate_vector(vector, 1536), np.array(vector, dtype=np.float32))
+
+    def test_truncation_preserves_cosine_ranking_of_leading_dimensions(self):
+        query = embedding(1.0, 0.2)
+        near, far = embedding(1.0, 0.1, 0.9), embedding(0.1, 1.0)
+
+        query_512, near_512, far_512 = truncate_vector(np.stack([query, near, far]), 512)
+
+        self.assertGreater(query_512 @ near_512, query_512 @ far_512)
+        self.assertAlmostEqual(float(np.linalg.norm(near_512)), 1.0, places=6)
+
+    @override_settings(EMBEDDING_DIMENSIONS=768)
+    def test_serving_vector_uses_profile(self):
+        self.assertEqual(to_serving_vector(embedding(1.0)).shape, (768,))
+
+    @override_settings(EMBEDDING_DIMENSIONS=1000)
+    def test_unsupported_dimensions_are_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            to_serving_vector(embedding(1.0))
+
+    def test_halfvec_sql(self):
+        self.assertEqual(pgvector_halfvec_sql(512), '(subvector(embedding, 1, 512))::halfvec(512)')
+        self.assertEqual(pgvector_halfvec_sql(1536), '(embedding)::halfvec(1536)')
+
+
+# ========================
+# 12. 목록 필터 패싯
+# ========================
+
+class FacetTestMixin:
+
+    def make_catalog(self):
+        make_course('파이썬', classfy_name='공학', middle_classfy_name='컴퓨터', org_name='A대학')
+        make_course('자료구조', classfy_name='공학', middle_classfy_name='컴퓨터', org_name='B대학')
+        make_course('회로', classfy_name='공학', middle_classfy_name='전기', org_name='A대학')
+        make_course('철학', classfy_name='인문', middle_classfy_name='철학', org_name='A대학')
+        make_course('이전 기수', classfy_name='인문', middle_classfy_name='철학', org_name='A대학', is_canonical=False)
+
+
+class BuildCourseFiltersTests(FacetTestMixin, TestCase):
+
+    def filtered_names(self, query_string, exclude=None):
+        filters = build_course_filters(QueryDict(query_string), exclude=exclude)
+        return set(Course.objects.canonical().filter(filters).values_list('name', flat=True))
+
+    def test_filters_combine_with_and_and_multi_value_or(self):
+        self.make_catalog()
+
+        self.assertEqual(self.filtered_names('classfy_name=공학&org_name=a대'), {'파이썬', '회로'})
+        self.assertEqual(
+            self.filtered_names('middle_classfy_name=전기&middle_classfy_name=철학'), {'회로', '철학'}
+        )
+
+    def test_exclude_drops_only_that_filter(self):
+        self.make_catalog()
+
+        self.assertEqual(
+            self.filtered_names('classfy_name=공학&org_name=A대학', exclude='classfy_name'), {'파이썬', '회로', '철학'}
+        )
+        self.assertEqual(
+            self.filtered_names('classfy_name=공학&org_name=A대학', exclude='professor'), {'파이썬', '회로'}
+        )
+
+    def test_empty_values_are_ignored(self):
+        # normalize_query_params와 같은 규칙 (빈 값은 필터 없음, 단일 값은 마지막 비어 있지 않은 값)
+        self.make_catalog()
+
+        self.assertEqual(self.filtered_names('middle_classfy_name=&org_name='), {'파이썬', '자료구조', '회로', '철학'})
+        self.assertEqual(self.filtered_names('middle_classfy_name=전기&middle_classfy_name='), {'회로'})
+        self.assertEqual(self.filtered_names('classfy_name=인문&classfy_name='), {'철학'})
+
+
+class CourseFacetAPITests(FacetTestMixin, CourseAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.make_catalog()
+        self.url = reverse('course-facets')
+
+    def counts(self, data, field):
+        return {item['value']: item['count'] for item in data[field]}
+
+    def test_counts_exclude_own_filter(self):
+        response = self.client.get(self.url, {'classfy_name': '공학', 'org_name': 'A대학'})
+
+        self.assertEqual(response.status_code, 200)
+        # 대분류 패싯은 자기 필터(공학)를 빼고 운영기관 필터만 적용 -> 다른 대분류 개수도 보임
+        self.assertEqual(self.counts(response.data, 'classfy_name'), {'공학': 2, '인문': 1})
+        # 운영기관 패싯은 대분류 필터만 적용
+        self.assertEqual(self.counts(response.data, 'org_name'), {'A대학': 2, 'B대학': 1})
+        self.assertEqual(self.counts(response.data, 'middle_classfy_name'), {'컴퓨터': 1, '전기': 1})
+        self.assertEqual(response.data['total'], 2)
+
+    def test_empty_filter_matches_no_filter(self):
+        # 빈 값 필터와 필터 없음은 같은 캐시 키 -> 어느 쪽이 먼저 캐시를 채워도 같은 결과
+        for url in (self.url, reverse('course-list')):
+            empty = self.client.get(url, {'middle_classfy_name': ''})
+            unfiltered = self.client.get(url)
+
+            self.assertEqual(empty.status_code, 200)
+            self.assertEqual(empty.data, unfiltered.data)
+            self.assertEqual(empty['ETag'], unfiltered['ETag'])
+        self.assertEqual(empty.data['count'], 4)
+
+    def test_search_applies_to_every_facet(self):
+        response = self.client.get(self.url, {'search': '파이썬'})
+
+        self.assertEqual(self.counts(response.data, 'classfy_name'), {'공학': 1})
+        self.assertEqual(response.data['total'], 1)
+
+    def test_cached_counts_refresh_after_course_change_and_304(self):
+        first = self.client.get(self.url)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            make_course('윤리학', classfy_name='인문', middle_classfy_name='철학', org_name='C대학')
+
+        second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(self.counts(second.data, 'classfy_name'), {'공학': 3, '인문': 2})
+
+
+# ========================
+# 13. 강좌명 자동완성
+# ========================
+
+def make_rated_course(name, review_count, **fields):
+    course = make_course(name, **fields)
+    CourseRatingStats.objects.create(course=course, review_count=review_count, average_rating=4.0)
+    return course
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CourseSuggestIndexTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def build_index(self):
+        index = CourseSuggestIndex()
+        index.refresh()
+        return index
+
+    def names(self, index, text, limit=10):
+        return [course['name'] for course in index.suggest(text, limit)]
+
+    def test_name_prefix_beats_word_prefix_then_review_count(self):
+        make_rated_course('데이터 분석', review_count=100)
+        make_rated_course('분석 기초', review_count=1)
+        make_rated_course('분석 심화', review_count=5)
+        make_rated_course('통계 분석', review_count=50)
+
+        index = self.build_index()
+
+        self.assertEqual(self.names(index, '분석'), ['분석 심화', '분석 기초', '데이터 분석', '통계 분석'])
+        self.assertEqual(self.names(index, '분석', limit=2), ['분석 심화', '분석 기초'])
+
+    def test_query_is_normalized_and_course_listed_once(self):
+        make_rated_course('Python  Python 입문', review_count=0)
+        make_course('이전 기수 Python', is_canonical=False)
+
+        index = self.build_index()
+
+        self.assertEqual(self.names(index, '  PYTHON '), ['Python  Python 입문'])
+        self.assertEqual(index.suggest('', 10), [])
+        self.assertEqual(index.suggest('없는 강좌', 10), [])
+
+    def test_wide_prefix_returns_exact_top_n(self):
+        # 같은 접두사 강좌가 많아도(넓은 일치 구간) 리뷰 수 상위 강좌가 정확히 선택됨
+        for review_count in range(60):
+            make_rated_course(f'파이썬 {review_count:02d}', review_count=review_count)
+
+        index = self.build_index()
+
+        expected = [f'파이썬 {review_count:02d}' for review_count in range(59, 54, -1)]
+        for prefix in ('파', '파이', '파이썬', '파이썬 '):
+            self.assertEqual(self.names(index, prefix, limit=5), expected)
+        self.assertEqual(len(index.suggest('파', 100)), MAX_LIMIT)
+
+    def test_short_prefix_results_match_full_scan(self):
+        for position, name in enumerate(['가나다', '가나', '나가', '다 가나', '가다 나']):
+            make_rated_course(name, review_count=position)
+
+        index = self.build_index()
+        loaded = index._loaded
+
+        def full_scan(prefix):
+            best = {}
+            for key, (rank, course_index) in zip(loaded['keys'], loaded['postings']):
+                if key.startswith(prefix) and (course_index not in best or rank < best[course_index]):
+                    best[course_index] = rank
+            return [loaded['courses'][course_index]['name'] for course_index, _ in sorted(best.items(), key=lambda item: item[1])]
+
+        for prefix in ('가', '나', '다', '가나', '가다', '나가', '다 '):
+            self.assertEqual(self.names(index, prefix), full_scan(prefix)[:10], prefix)
+
+    def test_request_path_never_builds(self):
+        make_rated_course('파이썬', review_count=0)
+        index = CourseSuggestIndex()
+
+        with mock.patch.object(index, 'start') as start, mock.patch.object(index, '_build') as build:
+            self.assertEqual(index.suggest('파이썬', 10), [])
+
+        start.assert_called_once_with()
+        build.assert_not_called()
+
+    def test_course_change_swaps_index_on_refresh(self):
+        make_rated_course('파이썬', review_count=0)
+        index = self.build_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            make_rated_course('파스칼', review_count=0)
+
+        self.assertEqual(self.names(index, '파'), ['파이썬'])
+        index.refresh()
+        self.assertEqual(self.names(index, '파'), ['파스칼', '파이썬'])
+
+    def test_review_change_reranks_on_refresh(self):
+        # 순위의 리뷰 수가 바뀌므로 강좌 변경 없이 리뷰만 작성해도 재구축
+        make_course('파이썬 기초')
+        advanced = make_course('파이썬 심화')
+        index = self.build_index()
+        self.assertEqual(self.names(index, '파이썬'), ['파이썬 기초', '파이썬 심화'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CourseReview.objects.create(user=make_user(), course=advanced, rating=5, review_text='좋아요')
+        index.refresh()
+
+        self.assertEqual(self.names(index, '파이썬'), ['파이썬 심화', '파이썬 기초'])
+
+    def test_unchanged_generation_keeps_index(self):
+        make_rated_course('파이썬', review_count=0)
+        index = self.build_index()
+        loaded = index._loaded
+
+        index.refresh()
+
+        self.assertIs(index._loaded, loaded)
+
+
+class CourseSuggestAPITests(CourseAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(setattr, course_suggest_index, '_loaded', None)
+        make_rated_course('파이썬 기초', review_count=3, professor='김교수')
+        make_rated_course('파이썬 심화', review_count=10, professor='이교수')
+        make_rated_course('웹 파이썬', review_count=99)
+        course_suggest_index._loaded = None
+        course_suggest_index.refresh()
+        self.url = reverse('course-suggest')
+
+    def test_results_are_ranked(self):
+        response = self.client.get(self.url, {'q': '파이'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([course['name'] for course in response.data['results']], ['파이썬 심화', '파이썬 기초', '웹 파이썬'])
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name', 'professor'})
+
+    def test_limit_is_clamped(self):
+        self.assertEqual(len(self.client.get(self.url, {'q': '파이', 'limit': 1}).data['results']), 1)
+        self.assertEqual(len(self.client.get(self.url, {'q': '파이', 'limit': 'x'}).data['results']), 3)
+        self.assertEqual(len(self.client.get(self.url, {'q': '파이', 'limit': 0}).data['results']), 1)
+
+    def test_repeated_query_returns_304(self):
+        first = self.client.get(self.url, {'q': '파이'})
+
+        second = self.client.get(self.url, {'q': '파이'}, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, 304)
+
+
+# ========================
+# 14. 메모리 매핑 벡터 인덱스 내보내기
+# ========================
+
+class ExportVectorIndexTests(TestCase):
+
+    def setUp(self):
+        self.index_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.index_dir, ignore_errors=True)
+        self.course = make_course('파이썬', classfy_name='공학', embedding=embedding(1.0))
+        self.other = make_course('철학', classfy_name='인문', embedding=embedding(0.0, 1.0))
+
+    def export(self, keep=2):
+        call_command('export_vector_index', '--output-dir', self.index_dir, '--keep', str(keep), stdout=StringIO())
+
+    def test_exports_in_same_second_do_not_collide(self):
+        # cron과 수동 실행이 같은 시각에 겹쳐도 각자 다른 버전 디렉토리 사용
+        now = timezone.now()
+        with mock.patch('apps.courses.management.commands.export_vector_index.timezone.now', return_value=now):
+            self.export(keep=3)
+            self.export(keep=3)
+
+        entries = sorted(os.listdir(self.index_dir))
+        versions = [name for name in entries if name.startswith('v')]
+        self.assertEqual(len(versions), 2)
+        self.assertEqual(entries, sorted([CURRENT_FILE] + versions))  # 임시 디렉토리/파일이 남지 않음
+        self.assertIn(read_current_version(self.index_dir), versions)
+
+    def test_exported_index_is_searchable_and_old_versions_pruned(self):
+        for _ in range(3):
+            self.export(keep=2)
+
+        self.assertEqual(len([name for name in os.listdir(self.index_dir) if name.startswith('v')]), 2)
+        index = MmapVectorIndex(self.index_dir)
+        hits = index.search(embedding(1.0), k=1)
+        self.assertEqual([course_id for course_id, _ in hits], [self.course.id])
+        self.assertEqual(index.search(embedding(1.0), k=5, classfy_name='인문')[0][0], self.other.id)
+        self.assertEqual(index.version, read_current_version(self.index_dir))
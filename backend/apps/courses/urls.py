@@ -6,6 +6,8 @@ from .views import (
     CourseListView,
     CourseKeywordSearchView,
     CourseSemanticSearchView,
+    CourseFacetView,
+    CourseSuggestView,
 )
 
 # 개요
@@ -13,6 +15,8 @@ from .views import (
 ```
 /api/v1/courses/
 ├── /                               # 강좌 목록
+├── facets/                         # 목록 필터 패싯 (항목별 강좌 수)
+├── suggest/                        # 강좌명 자동완성
 ├── <int:pk>/                       # 강좌 상세
 ├── <int:course_id>/reviews/        # 리뷰 목록
 └── <int:course_id>/recommendations/ # 추천 강좌
@@ -23,6 +27,7 @@ from .views import (
 | 파라미터              | 타입   | 설명                         | 예시                          |
 | --------------------- | ------ | ---------------------------- | ----------------------------- |
 | `search`              | string | 강좌명/소개 검색 (icontains) | `?search=파이썬`              |
+| `search_mode`         | string | `name`(기본) / `fulltext`    | `?search_mode=fulltext`       |
 | `classfy_name`        | string | 대분류 필터링                | `?classfy_name=인문`          |
 | `middle_classfy_name` | string | 중분류 필터링                | `?middle_classfy_name=교육학` |
 | `org_name`            | string | 운영기관 필터링              | `?org_name=서울대학교`        |
@@ -30,6 +35,8 @@ from .views import (
 | `ordering`            | string | 정렬 기준                    | `?ordering=-average_rating`   |
 | `page`                | int    | 페이지 번호                  | `?page=2`                     |
 | `page_size`           | int    | 페이지 크기                  | `?page_size=20`               |
+| `pagination`          | string | `cursor`: 커서 페이지네이션  | `?pagination=cursor`          |
+| `cursor`              | string | 응답 next/previous의 커서    | (응답 URL 그대로 사용)        |
 
 2. Ordering 옵션
 
@@ -40,6 +47,18 @@ from .views import (
 - `name`: 이름 오름차순
 - `-name`: 이름 내림차순
 - `-review_count`: 리뷰 많은순
+- `relevance`: 관련도순 (`search_mode=fulltext`일 때만, 이때의 기본값)
+
+3. 커서 페이지네이션 (`pagination=cursor`)
+
+- 정렬 키(ordering) + id 기준 keyset 조회, OFFSET/COUNT 없음
+- 응답: `{"next": url, "previous": url, "results": [...]}` (count 없음)
+- 정렬 키를 바꾸면 기존 cursor는 사용할 수 없음 (404)
+
+4. Search 모드
+
+- `name`: 강좌명 부분 일치(AND), 트라이그램 GIN 인덱스 사용
+- `fulltext`: 강좌명/교수자/요약 전문 검색(접두사 일치, AND), tsvector GIN 인덱스 사용
 
 """
 
@@ -57,8 +76,17 @@ urlpatterns = [
     path('<int:course_id>/recommendations/', CourseRecommendationView.as_view(), name='course-recommendations'),
 
     # 4. 키워드 검색 (ES + Fuzzy): /api/v1/courses/search/keyword/?search=...
+    #    - &page=2&page_size=3 또는 &pagination=cursor (search_after), 두 방식 모두 대표 강좌만 검색
     path('search/keyword/', CourseKeywordSearchView.as_view(), name='course-keyword-search'),
 
     # 5. 의미 기반 검색: /api/v1/courses/search/semantic/?query=...
     path('search/semantic/', CourseSemanticSearchView.as_view(), name='course-semantic-search'),
+
+    # 6. 필터 패싯(항목별 강좌 수): /api/v1/courses/facets/?classfy_name=...&search=...
+    #    - 목록 API와 같은 검색/필터 파라미터, 대분류/중분류/운영기관별 강좌 수 + total
+    path('facets/', CourseFacetView.as_view(), name='course-facets'),
+
+    # 7. 강좌명 자동완성: /api/v1/courses/suggest/?q=파이&limit=10
+    #    - 프로세스 내 접두사 인덱스 (id, name, professor만 반환)
+    path('suggest/', CourseSuggestView.as_view(), name='course-suggest'),
 ]
@@ -0,0 +1,159 @@
+# backend/apps/courses/vector_index.py
+
+"""
+[설계 의도]
+- 시맨틱 검색용 프로세스 내 벡터 인덱스 (VECTOR_SEARCH_BACKEND='mmap')
+- export_vector_index 커맨드가 만든 float32 임베딩 행렬(.npy)을 np.load(mmap_mode='r')로 열어
+  모든 gunicorn 워커가 OS 페이지 캐시를 공유 (워커 수만큼 메모리를 쓰지 않음)
+- 수만 건 규모에서는 행렬-벡터 곱 한 번(수 ms)이 ES 왕복보다 빠름
+
+[디렉토리 구조] settings.VECTOR_INDEX_DIR
+    CURRENT              # 현재 버전 이름 (예: v20250101120000123456-1a2b3c) -> 원자적 교체(os.replace)
+    v20250101120000123456-1a2b3c/
+        manifest.json    # version, count, dim, 분류 어휘(classfy/middle_classfy)
+        embeddings.npy   # (count, dim) float32, L2 정규화 완료 -> 내적 = 코사인 유사도
+                         #   dim = EMBEDDING_DIMENSIONS (512/768이면 앞부분만 잘라 저장)
+        ids.npy          # (count,) int64, Course.id
+        classfy.npy      # (count,) int16, 대분류 코드 (-1 = 없음)
+        middle.npy       # (count,) int16, 중분류 코드 (-1 = 없음)
+
+[상세 고려사항]
+- 워커는 VERSION_CHECK_INTERVAL초마다 CURRENT를 확인하여 새 버전이 있으면 다시 로드 (재시작 불필요)
+- 대분류/중분류 필터는 코드 배열로 마스크를 만들어 유사도 계산 후 제외 (사전 필터)
+- 인덱스가 없거나 읽을 수 없으면 search()가 None 반환 -> 호출부에서 다른 백엔드로 대체
+"""
+
+import json
+import os
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+
+from .embedding_profile import truncate_vector
+
+CURRENT_FILE = 'CURRENT'
+MANIFEST_FILE = 'manifest.json'
+VERSION_CHECK_INTERVAL = 5  # 새 버전 확인 주기 (초)
+NO_CODE = -1                # 분류 값이 없는 강좌의 코드
+
+
+class MmapVectorIndex:
+    """
+    [사용 예]
+        hits = course_vector_index.search(query_vector, k=50, classfy_name='공학')
+        -> [(course_id, score), ...] (유사도 내림차순) / 인덱스 없음 -> None
+    """
+
+    def __init__(self, index_dir=None):
+        self._index_dir = index_dir
+        self._lock = threading.Lock()
+        self._loaded = None        # 현재 로드된 버전 데이터 (dict)
+        self._checked_at = 0.0
+
+    @property
+    def index_dir(self):
+        return self._index_dir or settings.VECTOR_INDEX_DIR
+
+    @property
+    def version(self):
+        loaded = self._get_loaded()
+        return loaded['manifest']['version'] if loaded else None
+
+    def search(self, vector, k, classfy_name=None, middle_classfy_names=None):
+        """
+        [처리 흐름]
+        1. 질의 벡터를 인덱스 차원으로 자른 뒤 정규화
+        2. 전체 행렬과 내적 -> 코사인 유사도
+        3. 분류 필터 마스크에 해당하지 않는 행은 -inf
+        4. argpartition으로 top-k 추출 후 정렬
+        """
+        loaded = self._get_loaded()
+        if loaded is None:
+            return None
+
+        # 인덱스가 차원 축소 프로파일로 만들어졌으면 질의 벡터도 같은 차원으로 자름
+        query = np.array(truncate_vector(vector, loaded['manifest']['dim']), dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0 or query.shape[0] != loaded['manifest']['dim']:
+            return []
+        query /= norm
+
+        scores = loaded['embeddings'] @ query
+
+        mask = self._build_mask(loaded, classfy_name, middle_classfy_names)
+        if mask is not None:
+            scores[~mask] = -np.inf
+
+        k = min(k, scores.shape[0])
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            (int(loaded['ids'][idx]), float(scores[idx]))
+            for idx in top
+            if np.isfinite(scores[idx])
+        ]
+
+    def _build_mask(self, loaded, classfy_name, middle_classfy_names):
+        """대분류(단일) AND 중분류(다중, OR) 마스크, 필터가 없으면 None"""
+        mask = None
+        if classfy_name:
+            code = loaded['classfy_vocab'].get(classfy_name)
+            if code is None:
+                return np.zeros(loaded['ids'].shape[0], dtype=bool)
+            mask = loaded['classfy'] == code
+        if middle_classfy_names:
+            codes = [loaded['middle_vocab'][name] for name in middle_classfy_names if name in loaded['middle_vocab']]
+            middle_mask = np.isin(loaded['middle'], codes)
+            mask = middle_mask if mask is None else mask & middle_mask
+        return mask
+
+    # ---- 버전 관리 ----
+
+    def _get_loaded(self):
+        now = time.monotonic()
+        if self._loaded is not None and now - self._checked_at < VERSION_CHECK_INTERVAL:
+            return self._loaded
+
+        with self._lock:
+            if self._loaded is not None and now - self._checked_at < VERSION_CHECK_INTERVAL:
+                return self._loaded
+            self._checked_at = now
+            version = read_current_version(self.index_dir)
+            if version is None:
+                self._loaded = None
+            elif self._loaded is None or self._loaded['manifest']['version'] != version:
+                try:
+                    self._loaded = self._load(version)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"⚠️ 벡터 인덱스 로드 실패 ({version}): {e}")
+                    # 기존에 로드된 버전이 있으면 계속 사용
+            return self._loaded
+
+    def _load(self, version):
+        version_dir = os.path.join(self.index_dir, version)
+        with open(os.path.join(version_dir, MANIFEST_FILE), encoding='utf-8') as f:
+            manifest = json.load(f)
+        return {
+            'manifest': manifest,
+            'embeddings': np.load(os.path.join(version_dir, 'embeddings.npy'), mmap_mode='r'),
+            'ids': np.load(os.path.join(version_dir, 'ids.npy'), mmap_mode='r'),
+            'classfy': np.load(os.path.join(version_dir, 'classfy.npy'), mmap_mode='r'),
+            'middle': np.load(os.path.join(version_dir, 'middle.npy'), mmap_mode='r'),
+            'classfy_vocab': {name: code for code, name in enumerate(manifest['classfy_vocab'])},
+            'middle_vocab': {name: code for code, name in enumerate(manifest['middle_vocab'])},
+        }
+
+
+def read_current_version(index_dir):
+    try:
+        with open(os.path.join(index_dir, CURRENT_FILE), encoding='utf-8') as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+course_vector_index = MmapVectorIndex()
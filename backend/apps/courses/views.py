@@ -1,10 +1,12 @@
 from django.shortcuts import render, get_object_or_404
 from django.conf import settings
-from django.core.cache import cache
-from django.db.models import Q, Count, Avg, Window, F
-from django.db.models.functions import Coalesce, RowNumber
+from django.db.models import Count, Q, F, Value
+from django.db.models.functions import Coalesce
+from django.utils.dateparse import parse_date, parse_datetime
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.filters import OrderingFilter
 from rest_framework import generics, status
 from rest_framework.views import APIView
@@ -12,19 +14,31 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 
 from elasticsearch import Elasticsearch
-import requests
+import base64
+import datetime
 import json
 import os
-
-from .models import Course, CourseReview
+from urllib.parse import urlencode
+
+from .models import Course, CourseRatingStats, CourseReview, Wishlist
+from .caches import course_detail_cache, course_facets_cache, course_list_cache
+from .embedding_cache import query_embedding_cache
+from .embedding_profile import to_serving_vector
+from .es_index import ES_INDEX
+from .suggest_index import MAX_LIMIT as SUGGEST_MAX_LIMIT, course_suggest_index
+from .vector_index import course_vector_index
+from apps.core.utils.conditional import conditional_response, make_etag
+from apps.core.utils.http_client import gms_client
 from .serializers import CourseDetailSerializer, CourseReviewSerializer, CourseListSerializer
 from apps.mypage.serializers import SimpleCourseSerializer
 
 # 개요
 """
-1.1 CourseListPagination | 강의 목록 조회 시 페이지네이션
-1.2 CourseListView       | 강의 목록 조회
-1.3 
+1.1 CourseListPagination   | 강의 목록 조회 시 페이지네이션
+1.2 CourseCursorPagination | 강의 목록 조회 시 커서(keyset) 페이지네이션 (opt-in)
+1.3 CourseListView         | 강의 목록 조회
+1.4 CourseFacetView        | 강의 목록 필터 패싯(항목별 강좌 수) 조회
+1.5 CourseSuggestView      | 강좌명 자동완성
 
 2.1 CourseDetailView         | 강의 상세 정보 조회
 2.2 CourseReviewListView     | 강의 리뷰 목록 조회
@@ -35,6 +49,163 @@ from apps.mypage.serializers import SimpleCourseSerializer
 PAGE_SIZE = 10          # 기본 페이지 크기
 MAX_PAGE_SIZE = 100     # 최대 페이지 크기
 
+# 커서 페이지네이션 opt-in 값 (?pagination=cursor)
+PAGINATION_CURSOR = 'cursor'
+
+# 목록 검색 모드 (search_mode 파라미터)
+SEARCH_MODE_NAME = 'name'          # 강좌명 부분 일치 (기본값)
+SEARCH_MODE_FULLTEXT = 'fulltext'  # 강좌명/교수자/요약 전문 검색 + 관련도순 정렬
+
+# 벡터 검색(kNN) 백엔드 값 (settings.VECTOR_SEARCH_BACKEND)
+VECTOR_BACKEND_PGVECTOR = 'pgvector'  # 추천/시맨틱 검색 모두 pgvector
+VECTOR_BACKEND_MMAP = 'mmap'          # 시맨틱 검색은 메모리 매핑 인덱스, 추천 실시간 kNN은 ES
+# 그 외 값은 Elasticsearch 사용
+
+# 시맨틱 검색 질의 임베딩 모델 (강좌 임베딩 생성 모델과 동일해야 함)
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# 목록 정렬 화이트리스트 (relevance는 전문 검색 모드에서만 추가로 허용)
+ALLOWED_ORDERING = [
+    'average_rating', '-average_rating',  # 평균 평점 오름/내림
+    'review_count', '-review_count',      # 리뷰 수 오름/내림
+    'created_at', '-created_at',          # 생성일 오름/내림(모델에 created_at이 있다고 가정)
+    'name', '-name',                       # 강좌명 오름/내림
+    'study_start', '-study_start' # 수강일
+]
+
+# 목록 캐시 키에 포함할 파라미터 (응답에 영향을 주는 파라미터만, 그 외 값으로 캐시가 쪼개지지 않도록)
+CACHE_KEY_PARAMS = {
+    'search', 'search_mode', 'classfy_name', 'middle_classfy_name', 'org_name', 'professor',
+    'ordering', 'page', 'page_size', 'pagination', 'cursor',
+}
+# 목록 캐시 키에서 값 순서를 무시할 다중 값 파라미터 (getlist로 읽는 파라미터)
+CACHE_KEY_MULTI_VALUE_PARAMS = {'middle_classfy_name'}
+
+# 정렬 키 -> CourseRatingStats 컬럼 매핑 (인덱스 정렬용)
+STATS_ORDERING_FIELDS = {
+    'average_rating': 'rating_stats__average_rating',
+    'review_count': 'rating_stats__review_count',
+}
+
+# 패싯(필터별 강좌 수) 집계 대상 필드 = 목록 필터 파라미터 이름
+FACET_FIELDS = ('classfy_name', 'middle_classfy_name', 'org_name')
+# 패싯 캐시 키에 포함할 파라미터 (검색/필터만, 정렬/페이지는 개수에 영향 없음)
+FACET_KEY_PARAMS = {'search', 'search_mode', 'classfy_name', 'middle_classfy_name', 'org_name', 'professor'}
+
+# 자동완성 기본 결과 수 (?limit=, 최대 suggest_index.MAX_LIMIT)
+SUGGEST_DEFAULT_LIMIT = 10
+
+
+# ========================
+# 0. 목록 검색/필터 공용 함수 (CourseListView, CourseFacetView)
+# ========================
+
+def normalize_query_params(query_params, allowed_params):
+    """
+    [설계 의도]
+    - 같은 결과를 내는 요청이 같은 캐시 키를 갖도록 검색/필터 파라미터를 정규화
+
+    [로직]
+    1. 빈 값/allowed_params 외 파라미터 제거, 다중 값(중분류 OR 필터)은 정렬, 단일 값은 마지막 값만 유지
+    2. 검색어는 앞뒤/연속 공백 정리 (apply_course_search의 토큰화 결과와 동일)
+    3. 검색어가 없거나 기본 모드면 search_mode 제거 (결과에 영향 없음)
+
+    Returns:
+        (params, is_fulltext): {파라미터: [값, ...]}, 전문 검색 모드 여부
+    """
+    params = {}
+    for key, values in query_params.lists():
+        values = [value for value in values if value]
+        if key not in allowed_params or not values:
+            continue
+        # 다중 값 파라미터는 순서 무관하므로 정렬, 단일 값 파라미터는 View와 같이 마지막 값만 사용
+        params[key] = sorted(set(values)) if key in CACHE_KEY_MULTI_VALUE_PARAMS else values[-1:]
+
+    if 'search' in params:
+        search_query = ' '.join(params['search'][0].split())
+        if search_query:
+            params['search'] = [search_query]
+        else:
+            params.pop('search')
+    is_fulltext = 'search' in params and params.get('search_mode') == [SEARCH_MODE_FULLTEXT]
+    if 'search' not in params or not is_fulltext:
+        params.pop('search_mode', None)  # 검색어가 없거나 기본 모드면 search_mode는 결과에 영향 없음
+    return params, is_fulltext
+
+
+def _last_value(query_params, key, default=''):
+    """마지막 비어 있지 않은 값 (normalize_query_params와 같은 규칙 -> 캐시 키와 실제 필터가 어긋나지 않도록)"""
+    values = [value for value in query_params.getlist(key) if value]
+    return values[-1] if values else default
+
+
+def apply_course_search(queryset, query_params):
+    """
+    검색어(search) 적용 -> (queryset, is_fulltext)
+    - search_mode=name(기본): 강좌명 부분 일치 / search_mode=fulltext: 강좌명+교수자+요약 전문 검색
+    """
+    # ?search=" 파이썬  웹 " -> ['파이썬', '웹']
+    search_query = _last_value(query_params, 'search').strip()  # 공백 제거
+    search_mode = _last_value(query_params, 'search_mode', SEARCH_MODE_NAME)
+    is_fulltext = bool(search_query) and search_mode == SEARCH_MODE_FULLTEXT
+
+    if is_fulltext:
+        # tsvector GIN 인덱스 검색 + 일치도(relevance) annotate
+        queryset = queryset.full_text_search(search_query)
+
+    elif search_query: # 빈 문자열이면 건너뜀
+        keywords = search_query.split() # 공백을 기준으로 토큰화
+        search_filter = Q()  # 복합 조건을 처리하기 위한 Q 객체
+
+        for keyword in keywords:
+            # 각 키워드가 강좌명에 포함되어야 함 (AND 조건)
+            # - UPPER(name) 트라이그램 GIN 인덱스로 처리되어 순차 스캔하지 않음
+            search_filter &= Q(name__icontains=keyword)  # 강좌명이 키워드를 포함(대소문자 무시)
+
+        queryset = queryset.filter(search_filter)
+
+    return queryset, is_fulltext
+
+
+def build_course_filters(query_params, exclude=None):
+    """
+    [설계 의도]
+    - 특정 필드 기반 필터링(카테고리/기관/교수 등) 파라미터 -> Q 객체
+
+    [상세 고려사항]
+    - exclude: 적용하지 않을 필터 파라미터 이름
+      (패싯 집계 시 자기 자신의 필터는 빼고 계산 -> 이미 선택한 항목 외 다른 선택지의 개수도 보여줌)
+    - 빈 값은 무시 (normalize_query_params와 같은 규칙, ?middle_classfy_name= 은 필터 없음과 같은 결과/캐시 키)
+    """
+    filters = Q()
+
+    # 대분류 필터 (단일 값)
+    classfy_name = _last_value(query_params, 'classfy_name')
+    if classfy_name and exclude != 'classfy_name':
+        filters &= Q(classfy_name=classfy_name)
+
+    # 중분류 필터 (다중 값 지원)
+    # ?middle_classfy_name=컴퓨터·통신&middle_classfy_name=전기·전자 형태로 받음
+    middle_classfy_names = [name for name in query_params.getlist('middle_classfy_name') if name]
+    if middle_classfy_names and exclude != 'middle_classfy_name':
+        # OR 조건으로 처리 (하나라도 일치하면 포함)
+        middle_filter = Q()
+        for name in middle_classfy_names:
+            middle_filter |= Q(middle_classfy_name=name)
+        filters &= middle_filter
+
+    # 운영기관 필터 (부분 일치)
+    org_name = _last_value(query_params, 'org_name')
+    if org_name and exclude != 'org_name':
+        filters &= Q(org_name__icontains=org_name)
+
+    # 교수명 필터 (부분 일치)
+    professor = _last_value(query_params, 'professor')
+    if professor and exclude != 'professor':
+        filters &= Q(professor__icontains=professor)
+
+    return filters
+
 # ========================
 # 1. 강의 목록 API
 # ========================
@@ -54,7 +225,148 @@ class CourseListPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = MAX_PAGE_SIZE
 
-# 1.2 CourseListView | 강의 목록 조회
+# 1.2 CourseCursorPagination | 강의 목록 커서(keyset) 페이지네이션
+class CourseCursorPagination(BasePagination):
+    """
+    [설계 의도]
+    - 무한 스크롤/크롤러처럼 목록 전체를 순회하는 클라이언트를 위한 keyset 페이지네이션
+    - ?pagination=cursor 로 opt-in, 이후 응답의 next/previous URL(opaque cursor)을 그대로 따라가면 됨
+    - OFFSET 스캔과 전체 COUNT 없이 "마지막으로 본 위치 이후 N개"만 조회
+
+    [상세 고려사항]
+    - 정렬 키: View가 확정한 ordering(CourseListView.ordering_key) + id 타이브레이커
+      -> 값이 같은 강좌가 많아도(평점 0.0 등) 누락/중복 없이 순회 가능
+    - NULL이 가능한 정렬 값은 Coalesce로 고정값 치환 후 비교 (keyset 비교식이 NULL에서 깨지지 않도록)
+    - cursor: {정렬값, id, 방향}을 JSON -> base64로 인코딩한 불투명 문자열 (클라이언트는 해석하지 않음)
+    - 전체 개수(count)는 제공하지 않음
+    """
+    page_size = PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = '잘못된 cursor 값입니다.'
+
+    # 정렬 키 -> (keyset 비교용 NULL 없는 표현식, cursor 값 복원 함수)
+    KEYSET_FIELDS = {
+        'average_rating': (lambda: F('average_rating'), float),
+        'review_count': (lambda: F('review_count'), int),
+        'created_at': (lambda: F('created_at'), parse_datetime),
+        'name': (lambda: F('name'), str),
+        'study_start': (lambda: Coalesce('study_start', Value(datetime.date.min)), parse_date),
+        'relevance': (lambda: F('relevance'), float),
+    }
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        ordering = getattr(view, 'ordering_key', '-average_rating')
+        self.field_name = ordering.lstrip('-')
+        self.descending = ordering.startswith('-') or ordering == 'relevance'
+        expression, self.parse_value = self.KEYSET_FIELDS[self.field_name]
+
+        cursor = self.decode_cursor(request)
+        # 이전 페이지 조회는 정렬을 뒤집어 가져온 뒤 결과를 다시 뒤집음
+        self.is_reverse = bool(cursor and cursor['reverse'])
+        descending = self.descending != self.is_reverse
+
+        queryset = queryset.annotate(cursor_value=expression())
+        if descending:
+            queryset = queryset.order_by(F('cursor_value').desc(), '-id')
+        else:
+            queryset = queryset.order_by(F('cursor_value').asc(), 'id')
+
+        if cursor:
+            value, last_id = cursor['value'], cursor['id']
+            if descending:
+                position = Q(cursor_value__lt=value) | Q(cursor_value=value, id__lt=last_id)
+            else:
+                position = Q(cursor_value__gt=value) | Q(cursor_value=value, id__gt=last_id)
+            queryset = queryset.filter(position)
+
+        # page_size + 1개 조회 -> 다음 페이지 존재 여부 판단 (COUNT 쿼리 없음)
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if self.is_reverse:
+            results.reverse()
+
+        # 진행 방향 쪽은 has_more로, 반대 방향은 cursor 존재 여부(처음 페이지가 아닌지)로 판단
+        if self.is_reverse:
+            self.has_next, self.has_previous = bool(cursor), has_more
+        else:
+            self.has_next, self.has_previous = has_more, bool(cursor)
+
+        self.page = results
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            if payload['f'] != self.field_name:
+                # 정렬 키가 바뀐 cursor는 사용할 수 없음
+                raise ValueError('ordering mismatch')
+            value = self.parse_value(payload['v'])
+            if value is None:
+                raise ValueError('invalid value')
+            return {'value': value, 'id': int(payload['id']), 'reverse': bool(payload['r'])}
+        except (KeyError, TypeError, ValueError, UnicodeError, json.JSONDecodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, instance, reverse):
+        value = instance.cursor_value
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            value = value.isoformat()
+        payload = {'f': self.field_name, 'v': value, 'id': instance.id, 'r': reverse}
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # 결과가 비어 있으면 첫 페이지로 되돌아가는 링크 제공
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+# 1.3 CourseListView | 강의 목록 조회
 class CourseListView(generics.ListAPIView):
     """
     [API]
@@ -66,7 +378,7 @@ class CourseListView(generics.ListAPIView):
     - 페이지네이션으로 성능 최적화
 
     [처리 흐름]
-    1. QuerySet에 average_rating, review_count annotate
+    1. 대표 강좌(is_canonical)만 조회 + average_rating, review_count annotate
     2. 검색 조건 적용 (search 파라미터)
     3. 필터링 적용 (classfy_name, org_name 등)
     4. 정렬 적용 (ordering 파라미터, 기본값: -average_rating)
@@ -75,158 +387,244 @@ class CourseListView(generics.ListAPIView):
 
     [상세 고려사항]
     - permission_classes = [AllowAny]: 비로그인 사용자도 조회 가능
-    - annotate 활용: N+1 쿼리 방지
+    - annotate 활용: N+1 쿼리 방지 (평점/리뷰 수는 CourseRatingStats에 미리 계산된 값 사용)
     - Q 객체: 복합 검색 조건 (name OR summary)
     - Coalesce: average_rating이 NULL이면 0.0으로 처리
         - COALESCE(값, 대체값) := 값이 NULL이 아니면 그대로, 값이 NULL이면 대체값 반환
     - default ordering: -average_rating (평점 높은순)
+    - search_mode=fulltext: 강좌명/교수자/요약 tsvector 검색, 기본 정렬은 relevance(관련도순)
+    - pagination=cursor: 커서(keyset) 페이지네이션 (count 없이 next/previous cursor만 제공)
     """
 
     serializer_class = CourseListSerializer
     permission_classes = [AllowAny]
     pagination_class = CourseListPagination
 
+    @property
+    def paginator(self):
+        """
+        [설계 의도]
+        - ?pagination=cursor 요청일 때만 커서(keyset) 페이지네이션 사용, 기본은 페이지 번호 방식
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == PAGINATION_CURSOR:
+                self._paginator = CourseCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_queryset(self):
         """
         [설계 의도]
         - QuerySet 구성: annotate → filter → search → order_by
 
         [처리 흐름]
-        1. annotate (평점, 리뷰수, Window Function으로 중복 제거용 row_num)
-        2. 중복 제거 (row_num=1 필터링: 이름+교수자가 같으면 study_start 최신순만 선택)
+        1. annotate (평점, 리뷰수)
+        2. 중복 제거 (is_canonical=True: 이름+교수자가 같으면 study_start 최신 강좌만 선택)
         3. 검색 (search)
         4. 필터 (category, org 등)
         5. 정렬 (ordering)
-        6. Distinct (JOIN으로 인한 추가 중복 방지)
         """
         # DRF ListAPIView는 요청마다 get_queryset()을 호출해서 최종 queryset을 만든다.
         # 따라서 이 함수는 "목록 쿼리 1방"으로 끝나도록 DB 레벨 계산/필터/정렬을 조합한다.
 
         # 1. Base QuerySet with annotate
 
-        # - 목록 화면에서 필요한 집계 값(평균 평점, 리뷰 수)을 미리 계산하여 N+1을 방지한다.
-        # - Window Function으로 중복 제거 처리
-        queryset = Course.objects.annotate(
-            # 평균 평점 계산 (NULL이면 0.0)
-            # - 리뷰가 없는 강좌는 Avg 결과가 NULL이 되므로 Coalesce로 0.0으로 대체
-            # - 이렇게 하면 Serializer/프론트에서 None 처리 분기를 줄일 수 있음
-            average_rating=Coalesce(
-                Avg('reviews__rating'),
-                0.0 # 대체값
-            ),
-            # 리뷰 개수
-            review_count=Count('reviews', distinct=True), # distinct=True: 중복 리뷰 방지
-
-            # 2. 중복 제거를 위한 Window Function
-            # [설계 의도]
-            # - 강좌명(name)과 교수자(professor)가 같다면,
-            #   수강 시작일(study_start)이 가장 최신인(Null 포함 정렬 주의) 강좌 1개만 남김
-            row_num=Window(
-                expression=RowNumber(),
-                partition_by=[F('name'), F('professor')],  # 그룹핑 기준
-                order_by=F('study_start').desc(nulls_last=True)  # 정렬 기준 (NULL은 마지막)
-            )
-        ).filter(
-            row_num=1  # 각 그룹에서 첫 번째(최신) 강좌만 선택
-        )
-        
-        # 3. Search (강좌명만 검색)
-        # ?search=" 파이썬  웹 " -> ['파이썬', '웹']
-        search_query = self.request.query_params.get('search', '').strip()  # 공백 제거
-
-        if search_query: # 빈 문자열이면 건너뜀
-            keywords = search_query.split() # 공백을 기준으로 토큰화
-            search_filter = Q()  # 복합 조건을 처리하기 위한 Q 객체
+        # - 목록 화면에서 필요한 집계 값(평균 평점, 리뷰 수)은 CourseRatingStats에 미리 계산되어 있음
+        #   -> 리뷰 테이블 JOIN + GROUP BY 없이 1:1 JOIN으로 읽어옴 (N+1 방지)
 
-            for keyword in keywords:
-                # 각 키워드가 강좌명에 포함되어야 함 (AND 조건)
-                search_filter &= Q(name__icontains=keyword)  # 강좌명이 키워드를 포함(대소문자 무시)
-
-            queryset = queryset.filter(search_filter)
+        # 2. 중복 제거
+        # [설계 의도]
+        # - 강좌명(name)과 교수자(professor)가 같다면 수강 시작일(study_start)이 가장 최신인 강좌 1개만 남김
+        # - 대표 강좌 여부(is_canonical)는 적재 시점에 미리 계산되어 있으므로 인덱스 컬럼 필터 한 번으로 처리
+        #   (요청마다 Window Function을 돌리지 않음 -> 페이지네이션 COUNT도 단순 COUNT로 끝남)
+        queryset = Course.objects.canonical().with_rating_stats()
+        
+        # 3. Search (apply_course_search)
+        # 4. Filter (build_course_filters) - 패싯 API(CourseFacetView)와 같은 규칙 공유
+        queryset, is_fulltext = apply_course_search(queryset, self.request.query_params)
+        queryset = queryset.filter(build_course_filters(self.request.query_params))  # 누적된 필터는 한 번에 적용
 
-        # 4. Filter
-        # - 특정 필드 기반 필터링(카테고리/기관/교수 등)을 파라미터로 받아 적용한다.
+        # 5. Ordering
+        # - 정렬 파라미터를 받아 허용된 값만 적용한다, 화이트리스트!!
+        # - 기본값: -average_rating (전문 검색 모드에서는 관련도순)
+        default_ordering = 'relevance' if is_fulltext else '-average_rating'
+        ordering = self.request.query_params.get('ordering', default_ordering)
 
-        filters = Q()
+        # ordering 옵션 검증
+        allowed_ordering = list(ALLOWED_ORDERING)
+        if is_fulltext:
+            allowed_ordering.append('relevance')  # 관련도순 (전문 검색 모드에서만)
 
-        # 대분류 필터 (단일 값)
-        classfy_name = self.request.query_params.get('classfy_name')
-        if classfy_name:
-            filters &= Q(classfy_name=classfy_name)
+        if ordering not in allowed_ordering:  # 허용되지 않은 정렬 키가 들어오면
+            ordering = default_ordering        # 안전한 기본 정렬로 강제 fallback
 
-        # 중분류 필터 (다중 값 지원)
-        # ?middle_classfy_name=컴퓨터·통신&middle_classfy_name=전기·전자 형태로 받음
-        middle_classfy_names = self.request.query_params.getlist('middle_classfy_name')
-        if middle_classfy_names:
-            # OR 조건으로 처리 (하나라도 일치하면 포함)
-            middle_filter = Q()
-            for name in middle_classfy_names:
-                middle_filter |= Q(middle_classfy_name=name)
-            filters &= middle_filter
+        # 커서 페이지네이션이 같은 정렬 키로 keyset을 구성할 수 있도록 확정된 정렬 키 보관
+        self.ordering_key = ordering
 
-        # 운영기관 필터 (부분 일치)
-        org_name = self.request.query_params.get('org_name')
-        if org_name:
-            filters &= Q(org_name__icontains=org_name)
+        if ordering == 'relevance':
+            # 관련도 높은순, 동점이면 평점 높은순
+            return queryset.order_by(
+                F('relevance').desc(),
+                F(STATS_ORDERING_FIELDS['average_rating']).desc(nulls_last=True),
+            )
 
-        # 교수명 필터 (부분 일치)
-        professor = self.request.query_params.get('professor')
-        if professor:
-            filters &= Q(professor__icontains=professor)
+        # 평점/리뷰 수 정렬은 Coalesce 결과가 아닌 통계 테이블 컬럼으로 직접 정렬 (인덱스 사용)
+        # - 통계 행이 없는(NULL) 강좌는 기존 Coalesce(0) 동작과 같도록 평점 낮은 쪽에 배치
+        field_name = ordering.lstrip('-')
+        if field_name in STATS_ORDERING_FIELDS:
+            column = F(STATS_ORDERING_FIELDS[field_name])
+            ordering = column.desc(nulls_last=True) if ordering.startswith('-') else column.asc(nulls_first=True)
 
-        queryset = queryset.filter(filters) # 누적된 필터는 한 번에 적용
+        # 통계 테이블은 Course와 1:1 JOIN이므로 중복 row가 생기지 않음 -> distinct() 불필요
+        return queryset.order_by(ordering)  # 정렬 적용한 최종 QuerySet 반환
 
-        # 5. Ordering
-        # - 정렬 파라미터를 받아 허용된 값만 적용한다, 화이트리스트!!
-        ordering = self.request.query_params.get('ordering', '-average_rating') # 기본값: -average_rating
+    def get_cache_key(self):
+        """
+        [설계 의도]
+        - 같은 결과를 내는 요청은 같은 캐시 키를 갖도록 쿼리 파라미터를 정규화
+          (?a=1&b=2 와 ?b=2&a=1, ?page=1 과 파라미터 없음, 허용되지 않은 ordering과 기본 정렬 등)
+
+        [로직]
+        1. 빈 값/응답과 무관한 파라미터 제거(CACHE_KEY_PARAMS 외), 다중 값(중분류 OR 필터)은 정렬, 단일 값은 마지막 값만 유지
+        2. 검색어는 앞뒤/연속 공백 정리 (1~2: normalize_query_params, 패싯 캐시 키와 공용)
+        3. 기본값 채우기: page, search_mode, pagination / page_size는 페이지네이터가 확정한 값 사용
+        4. ordering은 get_queryset과 같은 규칙으로 확정 (허용되지 않은 값 -> 기본 정렬)
+        5. 키 이름순으로 정렬 후 urlencode
+        """
+        params, is_fulltext = normalize_query_params(self.request.query_params, CACHE_KEY_PARAMS)
 
-        # ordering 옵션 검증
-        allowed_ordering = [
-            'average_rating', '-average_rating',  # 평균 평점 오름/내림
-            'review_count', '-review_count',      # 리뷰 수 오름/내림
-            'created_at', '-created_at',          # 생성일 오름/내림(모델에 created_at이 있다고 가정)
-            'name', '-name',                       # 강좌명 오름/내림
-            'study_start', '-study_start' # 수강일
-        ]
+        if self.request.query_params.get('pagination') == PAGINATION_CURSOR:
+            params['pagination'] = [PAGINATION_CURSOR]
+            params.pop('page', None)
+        else:
+            params.pop('pagination', None)
+            params.pop('cursor', None)
+            params.setdefault('page', ['1'])
+        params['page_size'] = [str(self.paginator.get_page_size(self.request))]  # 잘못된 값/최대값 초과 보정 반영
 
-        if ordering not in allowed_ordering:  # 허용되지 않은 정렬 키가 들어오면
-            ordering = '-average_rating'       # 안전한 기본 정렬로 강제 fallback
+        default_ordering = 'relevance' if is_fulltext else '-average_rating'
+        allowed_ordering = ALLOWED_ORDERING + (['relevance'] if is_fulltext else [])
+        ordering = self.request.query_params.get('ordering', default_ordering)
+        params['ordering'] = [ordering if ordering in allowed_ordering else default_ordering]
 
-        # 6. Distinct (추가 중복 제거)
-        # - Window Function으로 이미 주요 중복은 제거했지만,
-        #   annotate/filter 과정에서 JOIN이 생기면 동일 Course가 중복 row로 나올 수 있음
-        # - distinct()는 최종 결과에서 중복 Course 제거(단, DB에 따라 성능 영향이 있으니 최소화가 이상적)
-        return queryset.order_by(ordering).distinct()  # 정렬 적용 후 중복 제거한 최종 QuerySet 반환
+        return urlencode(sorted(params.items()), doseq=True)
 
     def list(self, request, *args, **kwargs):
         """
         [설계 의도]
-        - 캐싱을 적용하여 동일한 쿼리 파라미터 요청 시 DB 조회 없이 캐시에서 응답
-        - 캐시 키: 쿼리 파라미터를 기반으로 생성
-        - 캐시 TTL: 5분 (300초)
-
-        [처리 흐름]
-        1. 쿼리 파라미터로 캐시 키 생성
-        2. 캐시에서 데이터 확인
-        3. 캐시 히트 시 캐시 데이터 반환
-        4. 캐시 미스 시 DB 조회 후 캐시 저장 및 반환
+        - 캐싱을 적용하여 동일한 조회 조건 요청 시 DB 조회 없이 캐시에서 응답
+        - 캐시 키: 정규화된 쿼리 파라미터 (get_cache_key)
+        - 캐시 TTL: 5분 (300초), 단 Course/CourseReview 변경 시 즉시 무효화 (세대 번호 증가, signals.py)
+
+        [상세 고려사항]
+        - 인기 페이지가 동시에 만료되어 모든 워커가 같은 쿼리를 재계산하지 않도록
+          course_list_cache.get_or_set()이 single-flight 락 + 확률적 조기 갱신을 처리
+        - 잘못된 페이지/커서(404)는 예외로 전파되어 캐시에 저장되지 않음
+        - 조건부 GET: ETag = (캐시 세대 번호, 캐시 키)
+          -> 세대 번호는 목록에 영향을 주는 모든 변경 시 증가하므로 304 판단에 DB/캐시 본문 조회가 필요 없음
+          -> 목록 응답에는 사용자별 값이 없으므로 로그인 여부와 무관하게 공유 캐시 허용
         """
-        # 1. 캐시 키 생성 (쿼리 파라미터 기반)
-        query_params = request.GET.urlencode()
-        cache_key = f"course_list:{query_params}"
+        # 네임스페이스(course_list:)와 세대 번호는 course_list_cache가 붙임
+        cache_key = self.get_cache_key()
+        # 세대 번호를 본문보다 먼저 읽음 -> 사이에 세대가 바뀌어도 다음 요청에서 ETag 불일치로 새 본문을 받음
+        etag = make_etag('course_list', course_list_cache.get_generation(), cache_key)
+
+        def build_response():
+            data = course_list_cache.get_or_set(
+                cache_key,
+                lambda: super(CourseListView, self).list(request, *args, **kwargs).data,
+            )
+            return Response(data)
+
+        return conditional_response(request, build_response, etag=etag)
+
+
+# 1.4 CourseFacetView | 강의 목록 필터 패싯(항목별 강좌 수) 조회
+class CourseFacetView(APIView):
+    """
+    [API]
+    - GET: /api/v1/courses/facets/?search=...&classfy_name=...&middle_classfy_name=...&org_name=...&professor=...
+
+    [설계 의도]
+    - 필터 UI(대분류/중분류/운영기관)의 항목별 강좌 수를 현재 검색/필터 상태 기준으로 한 번에 제공
+      -> 클라이언트가 체크박스마다 목록 API를 호출하지 않아도 됨
 
-        # 2. 캐시에서 데이터 확인
-        cached_response = cache.get(cache_key)
-        if cached_response is not None:
-            return Response(cached_response)
+    [처리 흐름]
+    1. 검색/필터 파라미터 정규화 -> 캐시 키(filter signature) + ETag
+    2. 캐시 미스 시 목록 API와 같은 검색/필터 규칙(apply_course_search, build_course_filters)으로
+       대표 강좌 기준 GROUP BY 집계 (필드별 1쿼리 + 전체 개수 1쿼리)
+    3. 결과를 course_facets_cache에 저장 (강좌 변경/적재 시 세대 번호 증가로 무효화)
+
+    [상세 고려사항]
+    - 패싯별로 자기 자신의 필터는 제외하고 집계 (예: 대분류 '인문'을 선택해도 다른 대분류의 개수가 보임)
+      -> 다중 선택(중분류 OR 필터)에서 선택 가능한 항목과 예상 개수를 그대로 표시 가능
+    - total은 모든 필터를 적용한 강좌 수 (목록 API의 count와 동일)
+    - 사용자별 값이 없으므로 공유 캐시 허용 (조건부 GET, apps.core.utils.conditional)
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request):
+        params, _ = normalize_query_params(request.query_params, FACET_KEY_PARAMS)
+        cache_key = urlencode(sorted(params.items()), doseq=True)
+        # 세대 번호를 본문보다 먼저 읽음 -> 사이에 세대가 바뀌어도 다음 요청에서 ETag 불일치로 새 본문을 받음
+        etag = make_etag('course_facets', course_facets_cache.get_generation(), cache_key)
+
+        def build_response():
+            return Response(course_facets_cache.get_or_set(cache_key, lambda: self._aggregate(request.query_params)))
+
+        return conditional_response(request, build_response, etag=etag)
+
+    def _aggregate(self, query_params):
+        queryset, _ = apply_course_search(Course.objects.canonical(), query_params)
+
+        facets = {}
+        for field in FACET_FIELDS:
+            rows = (
+                queryset.filter(build_course_filters(query_params, exclude=field))
+                .exclude(**{f'{field}__isnull': True})
+                .exclude(**{field: ''})
+                .values(field)
+                .annotate(count=Count('id'))
+                .order_by('-count', field)
+            )
+            facets[field] = [{'value': row[field], 'count': row['count']} for row in rows]
+
+        facets['total'] = queryset.filter(build_course_filters(query_params)).count()
+        return facets
+
+
+# 1.5 CourseSuggestView | 강좌명 자동완성
+class CourseSuggestView(APIView):
+    """
+    [API]
+    - GET: /api/v1/courses/suggest/?q=파이&limit=10
 
-        # 3. 캐시 미스 - DB 조회
-        response = super().list(request, *args, **kwargs)
+    [설계 의도]
+    - 검색창 입력(키 입력마다)에 대한 강좌명 자동완성 전용 경로
+    - 키워드 검색(ES fuzzy multi_match + DB hydration)을 거치지 않고 프로세스 내 접두사 인덱스에서 바로 응답
+      (suggest_index.course_suggest_index, DB/ES 조회 없음)
 
-        # 4. 캐시에 저장 (5분 TTL)
-        cache.set(cache_key, response.data, 300)
+    [상세 고려사항]
+    - 응답은 id, name, professor만 포함 (목록 카드용 필드는 검색 실행 시 목록/검색 API에서 조회)
+    - limit: 기본 SUGGEST_DEFAULT_LIMIT, 최대 SUGGEST_MAX_LIMIT (잘못된 값은 기본값)
+    - ETag = (인덱스 버전, 질의, limit) -> 같은 입력 반복 시 304, 비로그인 응답은 nginx가 재사용
+    """
+    permission_classes = [AllowAny]
 
-        return response
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        try:
+            limit = min(max(int(request.query_params.get('limit', SUGGEST_DEFAULT_LIMIT)), 1), SUGGEST_MAX_LIMIT)
+        except ValueError:
+            limit = SUGGEST_DEFAULT_LIMIT
+
+        results = course_suggest_index.suggest(query, limit)
+        return conditional_response(
+            request,
+            lambda: Response({'results': results}),
+            etag=make_etag('course_suggest', course_suggest_index.version, query, limit),
+        )
 
 
 
@@ -238,20 +636,103 @@ class CourseListView(generics.ListAPIView):
 
 # 2.1 CourseDetailView | 강의 상세 정보 조회
 class CourseDetailView(generics.RetrieveAPIView):
-    queryset = Course.objects.all()
+    """
+    [설계 의도]
+    - 모든 사용자에게 같은 부분(강좌 필드 + 평점 통계 + AI 요약)은 강좌별로 캐시하고,
+      사용자별 값(is_wished)만 요청 시점에 계산 (가장 조회가 많은 페이지)
+
+    [상세 고려사항]
+    - 캐시 미스: 강좌 + CourseRatingStats + CourseAIReview를 JOIN 쿼리 1번으로 조회
+      (응답에 쓰지 않는 embedding/search_vector 컬럼은 제외)
+    - 캐시 히트: 비로그인 0쿼리, 로그인 시 찜 여부 EXISTS 1쿼리
+    - 무효화: 강좌/리뷰/AI 평가 저장·삭제 signal에서 해당 강좌 키 삭제 (caches.invalidate_course_detail)
+    - 없는 강좌(404)는 캐시하지 않음 (get_object()의 Http404가 그대로 전달됨)
+    - 조건부 GET: 캐시 항목에 검증자(강좌/평점 통계/AI 평가 updated_at)를 함께 저장
+      -> 캐시 히트 시 DB 조회/직렬화 없이 304 판단
+      -> 로그인 사용자는 찜 여부까지 ETag에 포함하고 private 응답 (공유 캐시 저장 금지)
+    """
+    # 평점/리뷰 수/점수 분포는 CourseRatingStats, AI 요약은 CourseAIReview에서 JOIN으로 함께 조회
+    queryset = (
+        Course.objects.with_rating_stats()
+        .select_related('rating_stats', 'ai_review')
+        .defer('embedding', 'search_vector')
+    )
     serializer_class = CourseDetailSerializer
     permission_classes = [AllowAny]
 
-    def get_serializer_context(self):
-        context = super().get_serializer_context()
-        context.update({"request": self.request})
-        return context
+    def retrieve(self, request, *args, **kwargs):
+        course_id = self.kwargs['pk']
+        entry = course_detail_cache.get_or_set(str(course_id), self._build_shared_entry)
+        is_wished = self._is_wished(course_id)
+
+        def build_response():
+            data = dict(entry['data'])
+            data['is_wished'] = is_wished
+            return Response(data)
+
+        return conditional_response(
+            request,
+            build_response,
+            etag=make_etag(*entry['version'], is_wished),
+            last_modified=entry['last_modified'],
+            shared=not request.user.is_authenticated,
+        )
+
+    def _build_shared_entry(self):
+        """
+        캐시 항목 = 공용 응답 데이터 + 검증자
+        - data: request 없이 직렬화 -> is_wished는 False로 채워지고 응답 시 사용자별 값으로 덮어씀
+        - version / last_modified: 응답에 반영된 행들의 updated_at (리뷰 변경은 평점 통계 갱신 시각으로 반영)
+        """
+        course = self.get_object()
+        timestamps = [course.updated_at]
+        for relation in ('rating_stats', 'ai_review'):
+            related = getattr(course, relation, None)
+            timestamps.append(related.updated_at if related else None)
+        return {
+            'data': dict(self.get_serializer_class()(course).data),
+            'version': ['course_detail', course.pk] + [
+                timestamp.isoformat() if timestamp else '-' for timestamp in timestamps
+            ],
+            'last_modified': max(timestamp for timestamp in timestamps if timestamp),
+        }
+
+    def _is_wished(self, course_id):
+        user = self.request.user
+        return user.is_authenticated and Wishlist.objects.filter(user=user, course_id=course_id).exists()
 
 # 2.2 CourseReviewListView | 강의 리뷰 목록 조회
 class CourseReviewListView(generics.ListAPIView):
+    """
+    [상세 고려사항]
+    - 조건부 GET: 리뷰 작성/수정/삭제 시 항상 CourseRatingStats가 다시 저장되므로 통계 updated_at을 검증자로 사용
+      -> 304 판단은 통계 행 PK 조회 1번 (리뷰 목록 조회/직렬화 생략)
+    - 로그인 사용자는 is_owner 값이 달라지므로 사용자 id를 ETag에 포함하고 private 응답
+    - 작성자 이름(user_name) 변경은 검증자에 반영되지 않음 (해당 강좌의 다음 리뷰 변경 시 갱신)
+    """
     serializer_class = CourseReviewSerializer
     permission_classes = [AllowAny]
 
+    def list(self, request, *args, **kwargs):
+        course_id = self.kwargs.get('course_id')
+        user = request.user
+        stats_updated_at = (
+            CourseRatingStats.objects.filter(course_id=course_id)
+            .values_list('updated_at', flat=True)
+            .first()
+        )
+        return conditional_response(
+            request,
+            lambda: super(CourseReviewListView, self).list(request, *args, **kwargs),
+            etag=make_etag(
+                'course_reviews', course_id,
+                stats_updated_at.isoformat() if stats_updated_at else '-',
+                user.pk if user.is_authenticated else '-',
+            ),
+            last_modified=stats_updated_at,
+            shared=not user.is_authenticated,
+        )
+
     def get_queryset(self):
         course_id = self.kwargs.get('course_id')
         return CourseReview.objects.filter(course_id=course_id).select_related('user').order_by('-created_at')
@@ -263,62 +744,108 @@ class CourseReviewListView(generics.ListAPIView):
 
 # ES 클라이언트 설정
 ES_CLIENT = Elasticsearch(getattr(settings, 'ELASTICSEARCH_URL', 'http://elasticsearch:9200'))
+ES_MAX_RESULT_WINDOW = 10000       # ES index.max_result_window 기본값 (from + size 상한)
+KEYWORD_PAGE_SIZE = 3              # 키워드 검색 기본 페이지 크기
+KEYWORD_SORT = [{"_score": "desc"}, {"id": "asc"}]  # 키워드 검색 정렬 (동점은 id순으로 고정, 커서 방식 search_after 키)
+SEMANTIC_RESULT_SIZE = 20          # 시맨틱 검색 결과 수
+
+
+def build_es_filters(query_params):
+    """
+    [설계 의도]
+    - 목록 필터 파라미터(classfy_name, middle_classfy_name, org_name, professor) -> ES filter 절
+    - 키워드 검색(bool.filter)과 시맨틱 검색(knn.filter)에서 공용으로 사용
+
+    [상세 고려사항]
+    - setup_es 매핑상 네 필드 모두 keyword 타입
+      - 대분류/중분류: term/terms 정확히 일치
+      - 운영기관/교수명: DB의 icontains와 같도록 대소문자 무시 부분 일치(wildcard)
+    """
+    filters = []
+
+    # 대분류 필터 (정확히 일치)
+    classfy_name = _last_value(query_params, 'classfy_name')
+    if classfy_name:
+        filters.append({"term": {"classfy_name": classfy_name}})
+
+    # 중분류 필터 (다중 값 지원)
+    middle_classfy_names = [name for name in query_params.getlist('middle_classfy_name') if name]
+    if middle_classfy_names:
+        filters.append({"terms": {"middle_classfy_name": middle_classfy_names}})
+
+    # 운영기관 필터 (부분 일치)
+    org_name = _last_value(query_params, 'org_name')
+    if org_name:
+        filters.append({"wildcard": {"org_name": {"value": f"*{_escape_wildcard(org_name)}*", "case_insensitive": True}}})
+
+    # 교수명 필터 (부분 일치)
+    professor = _last_value(query_params, 'professor')
+    if professor:
+        filters.append({"wildcard": {"professor": {"value": f"*{_escape_wildcard(professor)}*", "case_insensitive": True}}})
+
+    return filters
+
+
+def _escape_wildcard(value):
+    """wildcard 패턴 특수문자(*, ?, \\) 이스케이프"""
+    return value.replace('\\', '\\\\').replace('*', '\\*').replace('?', '\\?')
+
 
 # 2.3 CourseRecommendationView | 추천 강의 조회
 class CourseRecommendationView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request, course_id):
-        target_course = get_object_or_404(Course, id=course_id)
+        # 1. 미리 계산된 유사 강좌 테이블 조회 (build_course_neighbors)
+        # - (course_id, rank) 유니크 인덱스로 상위 4개만 조회, 임베딩/kNN/중복 제거 불필요
+        # - canonical(): 커맨드 실행 이후 재적재로 대표 강좌가 바뀐 경우를 대비한 안전장치
+        precomputed = list(
+            Course.objects.canonical().filter(recommended_in__course_id=course_id)
+            .defer('embedding')
+            .order_by('recommended_in__rank')[:4]
+        )
+        if precomputed:
+            serializer = SimpleCourseSerializer(precomputed, many=True)
+            return Response(serializer.data)
+
+        # 2. 테이블에 없으면(신규 강좌, 커맨드 미실행) 실시간 kNN
+        # 기본 매니저는 embedding을 제외하므로 필요한 컬럼만 명시적으로 포함
+        target_course = get_object_or_404(
+            Course.objects.with_embedding().only('id', 'series_key', 'embedding'), id=course_id
+        )
         query_vector = target_course.embedding
 
         if query_vector is None:
             return Response([])
 
         try:
-            # 중복 필터링을 위해 넉넉히 30개 가져옴, 출력은 4개
-            res = ES_CLIENT.search(
-                index="kmooc_courses",
-                knn={
-                    "field": "embedding",
-                    "query_vector": list(query_vector),
-                    "k": 30,
-                    "num_candidates": 200
-                },
-                source=["id"]
-            )
-            
-            hits = res.get("hits", {}).get("hits", [])
-            candidate_ids = [int(h["_source"]["id"]) for h in hits]
-
-            # 후보군 정보 한꺼번에 조회
-            courses_queryset = Course.objects.filter(id__in=candidate_ids)
-            course_data_map = {c.id: c for c in courses_queryset}
-
-            final_courses = []
-            seen_identity = set()
-
-            # 현재 강의 정보(이름, 교수)를 중복 기준에 추가
-            target_name = target_course.name.strip()
-            target_professor = target_course.professor.strip()
-            seen_identity.add((target_name, target_professor))
-
-            for c_id in candidate_ids:
-                course = course_data_map.get(c_id)
-                if not course or course.id == target_course.id:
-                    continue
-
-                curr_name = course.name.strip()
-                curr_professor = course.professor.strip()
-
-                # 이름과 교수가 모두 같으면 같은 강의의 다른 기수로 판단하여 제외
-                identity = (curr_name, curr_professor)
-                if identity not in seen_identity:
-                    final_courses.append(course)
-                    seen_identity.add(identity)
-
-                if len(final_courses) >= 4:
-                    break
+            if settings.VECTOR_SEARCH_BACKEND == VECTOR_BACKEND_PGVECTOR:
+                # pgvector: 같은 시리즈 제외 + 대표 강좌 kNN을 SQL 한 번으로 처리
+                final_courses = Course.objects.canonical().exclude(
+                    series_key=target_course.series_key
+                ).knn(query_vector, 4)
+            else:
+                # 중복 필터링을 위해 넉넉히 30개 가져옴, 출력은 4개
+                res = ES_CLIENT.search(
+                    index=ES_INDEX,
+                    knn={
+                        "field": "embedding",
+                        "query_vector": to_serving_vector(query_vector).tolist(),
+                        "k": 30,
+                        "num_candidates": 200
+                    },
+                    source=["id"]
+                )
+
+                hits = res.get("hits", {}).get("hits", [])
+                candidate_ids = [int(h["_source"]["id"]) for h in hits]
+
+                # 후보군을 시리즈 단위 대표 강좌로 변환 (ES 순서 유지)
+                # - 현재 강의와 같은 시리즈(이름+교수가 같은 다른 기수)는 제외
+                candidates = Course.objects.exclude(
+                    series_key=target_course.series_key
+                ).canonical_from_hits(candidate_ids)
+                final_courses = candidates[:4]
 
             serializer = SimpleCourseSerializer(final_courses, many=True)
             return Response(serializer.data)
@@ -339,126 +866,157 @@ class CourseKeywordSearchView(APIView):
     - ES의 multi_match + fuzziness로 오타 보정 기능 제공
     - 제목(name) 필드만 검색
     - 필터링 및 페이지네이션 지원
-    - 중복 제거 (같은 이름+교수 조합)
+    - 중복 제거 (같은 이름+교수 조합, is_canonical 대표 강좌로 통일)
+      페이지 번호/커서 방식 모두 같은 대표 강좌 필터 사용 -> 두 방식의 결과 집합과 순서가 같음
+      (collapse는 정렬 필드가 collapse 필드일 때만 search_after와 함께 쓸 수 있어 점수순 커서 방식에 사용 불가)
     """
     permission_classes = [AllowAny]
 
     def _build_es_filters(self):
-        """ES query용 필터 조건 생성"""
-        filters = []
-
-        # 대분류 필터 (정확히 일치)
-        classfy_name = self.request.query_params.get('classfy_name')
-        if classfy_name:
-            filters.append({"term": {"classfy_name.keyword": classfy_name}})
-
-        # 중분류 필터 (다중 값 지원)
-        middle_classfy_names = self.request.query_params.getlist('middle_classfy_name')
-        if middle_classfy_names:
-            filters.append({"terms": {"middle_classfy_name.keyword": middle_classfy_names}})
-
-        # 운영기관 필터 (부분 일치)
-        org_name = self.request.query_params.get('org_name')
-        if org_name:
-            filters.append({"match": {"org_name": org_name}})
+        """ES query용 필터 조건 생성 (시맨틱 검색 kNN filter와 공용)"""
+        return build_es_filters(self.request.query_params)
+
+    def _build_es_query(self, search_query):
+        """강좌명 fuzzy 검색 + 필터 + 대표 강좌 bool 쿼리 (페이지 번호/커서 방식 공용)"""
+        es_query = {
+            "bool": {
+                "must": [
+                    {
+                        "multi_match": {
+                            "query": search_query,
+                            "fields": ["name^2"],  # name 필드만, 가중치 2배
+                            "fuzziness": 1,        # 1글자 차이까지 허용
+                            "operator": "and",     # 모든 키워드 포함
+                            "prefix_length": 1     # 첫 글자는 정확히 일치해야 함
+                        }
+                    }
+                ]
+            }
+        }
 
-        # 교수명 필터 (부분 일치)
-        professor = self.request.query_params.get('professor')
-        if professor:
-            filters.append({"match": {"professor": professor}})
+        # 필터 추가 (대표 강좌만 -> 시리즈당 1건)
+        es_query["bool"]["filter"] = self._build_es_filters() + [{"term": {"is_canonical": True}}]
+        return es_query
 
-        return filters
+    def _hydrate(self, candidate_ids):
+        """ES 결과 id -> 대표 강좌 (ES 순서 유지, 평점 통계 포함)"""
+        return Course.objects.with_rating_stats().canonical_from_hits(candidate_ids)
 
     def get(self, request):
         search_query = request.query_params.get('search', '').strip()
         if not search_query:
             return Response({"results": [], "count": 0}, status=status.HTTP_200_OK)
 
-        # 페이지네이션 파라미터
-        page = int(request.query_params.get('page', 1))
-        page_size = int(request.query_params.get('page_size', 3))
-        from_index = (page - 1) * page_size
-
         try:
-            # ES 필터 조건 생성
-            es_filters = self._build_es_filters()
-
-            # ES 검색 쿼리 구성
-            es_query = {
-                "bool": {
-                    "must": [
-                        {
-                            "multi_match": {
-                                "query": search_query,
-                                "fields": ["name^2"],  # name 필드만, 가중치 2배
-                                "fuzziness": 1,        # 1글자 차이까지 허용
-                                "operator": "and",     # 모든 키워드 포함
-                                "prefix_length": 1     # 첫 글자는 정확히 일치해야 함
-                            }
-                        }
-                    ]
-                }
-            }
-
-            # 필터 추가
-            if es_filters:
-                es_query["bool"]["filter"] = es_filters
-
-            # ES 검색 실행 (넉넉하게 가져와서 중복 제거 후 페이지네이션)
-            res = ES_CLIENT.search(
-                index="kmooc_courses",
-                query=es_query,
-                size=200,  # 중복 제거를 위해 넉넉히 가져옴
-                source=["id"]
-            )
+            es_query = self._build_es_query(search_query)
+            if request.query_params.get('pagination') == PAGINATION_CURSOR:
+                return self._get_cursor_page(request, es_query)
+            return self._get_numbered_page(request, es_query)
 
-            hits = res.get("hits", {}).get("hits", [])
-            candidate_ids = [int(h["_source"]["id"]) for h in hits]
-
-            # DB 조회
-            courses_queryset = Course.objects.filter(id__in=candidate_ids).annotate(
-                average_rating=Coalesce(Avg('reviews__rating'), 0.0),
-                review_count=Count('reviews', distinct=True)
-            )
-            course_data_map = {c.id: c for c in courses_queryset}
-
-            # 중복 제거 (ES 순서 유지)
-            final_courses = []
-            seen_identity = set()
-
-            for c_id in candidate_ids:
-                course = course_data_map.get(c_id)
-                if not course:
-                    continue
-
-                curr_name = course.name.strip()
-                curr_professor = course.professor.strip()
-                identity = (curr_name, curr_professor)
+        except NotFound:
+            raise
+        except Exception as e:
+            import traceback
+            print(f"❌ ES 키워드 검색 에러: {e}")
+            print(traceback.format_exc())
+            return Response({"results": [], "count": 0}, status=status.HTTP_200_OK)
 
-                if identity not in seen_identity:
-                    final_courses.append(course)
-                    seen_identity.add(identity)
+    def _get_numbered_page(self, request, es_query):
+        """
+        [설계 의도]
+        - 페이지 번호 방식 (기본): 요청한 페이지의 page_size개만 ES에서 가져옴
 
-            # 전체 개수
-            total_count = len(final_courses)
+        [로직]
+        - 대표 강좌 필터(_build_es_query)로 시리즈당 1건 -> from/size가 곧 시리즈 단위 페이지 (index.max_result_window 이내)
+        - 전체 개수: hits.total (track_total_hits=True, 정확한 값)
+        """
+        page = max(int(request.query_params.get('page', 1)), 1)
+        page_size = min(max(int(request.query_params.get('page_size', KEYWORD_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        from_index = (page - 1) * page_size
+        if from_index + page_size > ES_MAX_RESULT_WINDOW:
+            return Response({"results": [], "count": 0}, status=status.HTTP_200_OK)
 
-            # 페이지네이션 적용
-            start = from_index
-            end = from_index + page_size
-            paginated_courses = final_courses[start:end]
+        res = ES_CLIENT.search(
+            index=ES_INDEX,
+            query=es_query,
+            from_=from_index,
+            size=page_size,
+            source=["id"],
+            sort=KEYWORD_SORT,
+            track_total_hits=True,
+        )
 
-            serializer = CourseListSerializer(paginated_courses, many=True)
+        hits = res.get("hits", {}).get("hits", [])
+        candidate_ids = [int(h["_source"]["id"]) for h in hits]
+        total_count = res.get("hits", {}).get("total", {}).get("value", 0)
 
-            return Response({
-                "results": serializer.data,
-                "count": total_count
-            })
+        serializer = CourseListSerializer(self._hydrate(candidate_ids), many=True)
+        return Response({
+            "results": serializer.data,
+            "count": total_count
+        })
 
-        except Exception as e:
-            import traceback
-            print(f"❌ ES 키워드 검색 에러: {e}")
-            print(traceback.format_exc())
-            return Response({"results": [], "count": 0}, status=status.HTTP_200_OK)
+    def _get_cursor_page(self, request, es_query):
+        """
+        [설계 의도]
+        - 커서 방식 (?pagination=cursor): search_after로 깊은 페이지도 일정한 비용으로 조회
+        - 응답: {"results", "count", "next"} (next: 다음 페이지 URL, 마지막이면 null)
+
+        [상세 고려사항]
+        - 중복 제거/정렬은 페이지 번호 방식과 동일 (대표 강좌 필터, KEYWORD_SORT)
+        - 정렬: _score 내림차순 + id 오름차순 (동점 순서 고정) -> cursor에 마지막 (score, id)만 담으면 이어서 조회 가능
+        - point-in-time은 사용하지 않음 (첫 페이지마다 열고 마지막 페이지에서만 닫게 되어
+          중간에 이탈한 사용자의 PIT가 keep_alive 동안 ES에 남음)
+          -> 페이지 사이에 색인이 바뀌면 순서가 일부 달라질 수 있으나, 검색 결과 목록에서는 허용
+        - 전체 개수는 첫 페이지에서만 계산 (이후 페이지는 cursor에 담아 전달)
+        """
+        page_size = min(max(int(request.query_params.get('page_size', KEYWORD_PAGE_SIZE)), 1), MAX_PAGE_SIZE)
+        cursor = self._decode_cursor(request.query_params.get('cursor'))
+
+        search_kwargs = {
+            "query": es_query,
+            "size": page_size + 1,  # 다음 페이지 존재 여부 확인용 1건 추가
+            "source": ["id"],
+            "sort": KEYWORD_SORT,
+            "track_total_hits": not cursor,  # 전체 개수는 첫 페이지에서만 계산
+        }
+        if cursor:
+            search_kwargs["search_after"] = cursor["after"]
+
+        res = ES_CLIENT.search(index=ES_INDEX, **search_kwargs)
+
+        hits = res.get("hits", {}).get("hits", [])
+        has_more = len(hits) > page_size
+        hits = hits[:page_size]
+        candidate_ids = [int(h["_source"]["id"]) for h in hits]
+
+        if cursor:
+            total_count = cursor["count"]
+        else:
+            total_count = res.get("hits", {}).get("total", {}).get("value", 0)
+
+        next_link = None
+        if has_more:
+            next_cursor = {"after": hits[-1]["sort"], "count": total_count}
+            encoded = base64.urlsafe_b64encode(json.dumps(next_cursor).encode('utf-8')).decode('ascii')
+            next_link = replace_query_param(request.build_absolute_uri(), 'cursor', encoded)
+
+        serializer = CourseListSerializer(self._hydrate(candidate_ids), many=True)
+        return Response({
+            "results": serializer.data,
+            "count": total_count,
+            "next": next_link,
+        })
+
+    @staticmethod
+    def _decode_cursor(encoded):
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            return {"after": list(payload["after"]), "count": int(payload["count"])}
+        except (KeyError, TypeError, ValueError, UnicodeError, json.JSONDecodeError):
+            raise NotFound('잘못된 cursor 값입니다.')
 
 
 class CourseSemanticSearchView(APIView):
@@ -469,8 +1027,19 @@ class CourseSemanticSearchView(APIView):
     permission_classes = [AllowAny]
 
     def _get_embedding(self, text):
-        """내부용 임베딩 생성 메서드"""
-        GMS_URL = "https://gms.ssafy.io/gmsapi/api.openai.com/v1/embeddings"
+        """
+        내부용 임베딩 조회 메서드
+        - 같은 질의(정규화 기준)는 프로세스 LRU -> QueryEmbedding 테이블 순으로 재사용
+        - 캐시 미스일 때만 임베딩 API 호출 (_request_embedding)
+        - 반환 값은 float32 배열 (ES 질의 JSON에 넣을 때만 리스트로 변환)
+        """
+        return query_embedding_cache.get_or_fetch(text, EMBEDDING_MODEL, fetch=self._request_embedding)
+
+    def _request_embedding(self, clean_text):
+        """
+        임베딩 API 호출 (질의 원문을 받음, 정규화는 캐시 키에만 사용)
+        - 공용 HTTP 클라이언트의 query_embedding 엔드포인트 사용 (keep-alive, 짧은 타임아웃, 재시도 1회)
+        """
         GMS_KEY = os.environ.get("GMS_KEY")
 
         if not GMS_KEY:
@@ -482,17 +1051,13 @@ class CourseSemanticSearchView(APIView):
             "Authorization": f"Bearer {GMS_KEY}"
         }
 
-        clean_text = text.replace('\n', ' ').replace('\r', ' ').strip()
-        if not clean_text:
-            return None
-
         data = {
-            "model": "text-embedding-3-small",
+            "model": EMBEDDING_MODEL,
             "input": clean_text
         }
 
         try:
-            response = requests.post(GMS_URL, headers=headers, data=json.dumps(data), timeout=5)
+            response = gms_client.post('query_embedding', json=data, headers=headers)
             if response.status_code == 200:
                 result = response.json()
                 return result['data'][0]['embedding']
@@ -504,33 +1069,8 @@ class CourseSemanticSearchView(APIView):
             return None
 
     def _apply_filters(self, queryset):
-        """필터링 로직 (CourseListView와 동일)"""
-        filters = Q()
-
-        # 대분류 필터 (단일 값)
-        classfy_name = self.request.query_params.get('classfy_name')
-        if classfy_name:
-            filters &= Q(classfy_name=classfy_name)
-
-        # 중분류 필터 (다중 값 지원)
-        middle_classfy_names = self.request.query_params.getlist('middle_classfy_name')
-        if middle_classfy_names:
-            middle_filter = Q()
-            for name in middle_classfy_names:
-                middle_filter |= Q(middle_classfy_name=name)
-            filters &= middle_filter
-
-        # 운영기관 필터 (부분 일치)
-        org_name = self.request.query_params.get('org_name')
-        if org_name:
-            filters &= Q(org_name__icontains=org_name)
-
-        # 교수명 필터 (부분 일치)
-        professor = self.request.query_params.get('professor')
-        if professor:
-            filters &= Q(professor__icontains=professor)
-
-        return queryset.filter(filters)
+        """필터링 로직 (CourseListView와 공용 build_course_filters 사용)"""
+        return queryset.filter(build_course_filters(self.request.query_params))
 
     def get(self, request):
         query = request.query_params.get('query', '').strip()
@@ -539,51 +1079,54 @@ class CourseSemanticSearchView(APIView):
 
         # 1. 검색어 임베딩 생성
         query_vector = self._get_embedding(query)
-        if not query_vector:
+        if query_vector is None:
             # 임베딩 실패 시 빈 결과 반환
             return Response([], status=status.HTTP_200_OK)
 
         try:
-            # 2. ES 벡터 검색
-            res = ES_CLIENT.search(
-                index="kmooc_courses",
-                knn={
-                    "field": "embedding",
-                    "query_vector": query_vector,
-                    "k": 50,
-                    "num_candidates": 500
-                },
-                source=["id"]
-            )
-
-            hits = res.get("hits", {}).get("hits", [])
-            candidate_ids = [int(h["_source"]["id"]) for h in hits]
-
-            # 3. DB 조회 및 필터 적용
-            courses_queryset = Course.objects.filter(id__in=candidate_ids)
-            courses_queryset = self._apply_filters(courses_queryset)  # 필터 적용
-            course_data_map = {c.id: c for c in courses_queryset}
-
-            # 4. 중복 필터링 (ES 순서 유지)
-            final_courses = []
-            seen_identity = set()
-
-            for c_id in candidate_ids:
-                course = course_data_map.get(c_id)
-                if not course:
-                    continue
-
-                curr_name = course.name.strip()
-                curr_professor = course.professor.strip()
-                identity = (curr_name, curr_professor)
-
-                if identity not in seen_identity:
-                    final_courses.append(course)
-                    seen_identity.add(identity)
-
+            if settings.VECTOR_SEARCH_BACKEND == VECTOR_BACKEND_PGVECTOR:
+                # 2-A. pgvector: 대표 강좌 + 필터 + kNN을 SQL 한 번으로 처리 (ES 왕복 없음)
+                final_courses = self._apply_filters(Course.objects.canonical()).knn(query_vector, SEMANTIC_RESULT_SIZE)
+            else:
+                candidate_ids = None
+                if settings.VECTOR_SEARCH_BACKEND == VECTOR_BACKEND_MMAP:
+                    # 2-B. 메모리 매핑 벡터 인덱스 (대분류/중분류는 인덱스 마스크로 사전 필터)
+                    # - 인덱스가 아직 없으면 None -> ES로 대체
+                    hits = course_vector_index.search(
+                        query_vector,
+                        k=50,  # 기관/교수 필터는 DB 단계에서 적용되므로 여유 있게
+                        classfy_name=request.query_params.get('classfy_name'),
+                        middle_classfy_names=request.query_params.getlist('middle_classfy_name'),
+                    )
+                    if hits is not None:
+                        candidate_ids = [course_id for course_id, _ in hits]
+
+                if candidate_ids is None:
+                    # 2-C. ES 벡터 검색
+                    # - 필터(분류/기관/교수) + 대표 강좌 조건을 kNN filter로 전달
+                    #   -> ES가 조건을 만족하는 문서만 HNSW 탐색하므로 필터가 좁아도 결과 20개를 채움
+                    res = ES_CLIENT.search(
+                        index=ES_INDEX,
+                        knn={
+                            "field": "embedding",
+                            "query_vector": to_serving_vector(query_vector).tolist(),
+                            "k": SEMANTIC_RESULT_SIZE,
+                            "num_candidates": 500,
+                            "filter": build_es_filters(request.query_params) + [{"term": {"is_canonical": True}}],
+                        },
+                        size=SEMANTIC_RESULT_SIZE,
+                        source=["id"]
+                    )
+
+                    hits = res.get("hits", {}).get("hits", [])
+                    candidate_ids = [int(h["_source"]["id"]) for h in hits]
+
+                # 3. DB 조회, 필터 적용 및 중복 제거 (ES 순서 유지)
+                # - 같은 시리즈(이름+교수)의 여러 기수는 대표 강좌 1개로 합쳐짐
+                # - ES에서 이미 필터링되었으므로 여기서는 인덱스 동기화 지연 대비 안전장치 역할
+                courses_queryset = self._apply_filters(Course.objects.all())  # 필터 적용
                 # 검색 결과는 조금 더 많이 보여줘도 됨 (예: 20개)
-                if len(final_courses) >= 20:
-                    break
+                final_courses = courses_queryset.canonical_from_hits(candidate_ids)[:SEMANTIC_RESULT_SIZE]
 
             serializer = SimpleCourseSerializer(final_courses, many=True)
             return Response(serializer.data)
@@ -176,7 +176,8 @@ class RecentCourseView(APIView):
         # select_related('course'):
         # - Enrollment가 참조하는 course(FK)를 JOIN으로 미리 가져옴
         # - Serializer에서 enrollment.course 접근 시 추가 쿼리(N+1) 발생 방지
-        ).select_related('course').order_by(  
+        # - JOIN은 Course 기본 매니저를 거치지 않으므로 응답에 쓰지 않는 embedding 컬럼은 직접 제외
+        ).select_related('course').defer('course__embedding').order_by(  
             '-last_studied_at', '-created_at' # 내림차순
         ).first() # 가장 최근 1건
 
@@ -258,9 +259,10 @@ class EnrollmentListView(generics.ListAPIView):
         # 기본 QuerySet: 현재 사용자 수강 기록 전체
         # - 내 수강 기록만 필터링
         # - course를 미리 조인으로 가져와서 추가 쿼리 발생 방지(N+1 문제 해결)
+        # - 응답에 쓰지 않는 강좌 embedding 컬럼은 제외
         queryset = Enrollment.objects.filter(
             user=user
-        ).select_related('course')
+        ).select_related('course').defer('course__embedding')
 
         # status 필터링
         if status_param == 'enrolled': # 수강 중 
@@ -336,7 +338,8 @@ class EnrollmentStatusView(generics.RetrieveAPIView):
         enrollment = get_object_or_404(
             # Enrollment.objects.select_related('course'):
             # - course(ForeignKey)를 JOIN으로 미리 가져옴
-            Enrollment.objects.select_related('course'),
+            # - 응답에 쓰지 않는 강좌 embedding 컬럼은 제외
+            Enrollment.objects.select_related('course').defer('course__embedding'),
             user=user,
             course_id=course_id
         )
@@ -492,7 +495,8 @@ class WishlistListView(generics.ListAPIView):
         # select_related('course'):
         # - FK인 course를 JOIN으로 미리 로드
         # - Serializer에서 wishlist.course 접근 시 추가 쿼리 발생 방지(N+1 방지)
-        ).select_related('course').order_by('-created_at') # 최신 순
+        # - 응답에 쓰지 않는 강좌 embedding 컬럼은 제외
+        ).select_related('course').defer('course__embedding').order_by('-created_at') # 최신 순
     
 
 # 2.5.2 WishlistToggleView | 위시리스트 추가/삭제
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_asgi_application()
+
+# 워커 시작 시 강좌명 자동완성 인덱스를 백그라운드에서 구축 (첫 요청이 구축 비용을 떠안지 않도록)
+from apps.courses.suggest_index import course_suggest_index  # noqa: E402
+
+course_suggest_index.start()
@@ -71,6 +71,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 AUTH_USER_MODEL = 'accounts.User'
@@ -172,15 +173,78 @@ WSGI_APPLICATION = 'config.wsgi.application'
 
 # Cache
 # https://docs.djangoproject.com/en/5.2/topics/cache/
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
-        'OPTIONS': {
-            'MAX_ENTRIES': 1000,  # 최대 캐시 항목 수
+# CACHE_BACKEND 환경변수로 선택 (모든 캐시는 apps.core.utils.cache.NamespacedCache를 통해 접근)
+# - redis : 워커/컨테이너 간 공유 + 재시작 후에도 유지 (운영 필수, 용량/eviction은 Redis maxmemory 정책)
+#           single-flight 락(add)과 적중률 카운터(incr)가 원자적으로 동작하는 유일한 백엔드
+# - file  : 외부 서비스 없이 같은 호스트의 gunicorn 워커끼리 공유 (로컬 개발용)
+#           add/incr가 원자적이지 않음 -> single-flight는 best-effort, 카운터는 근사값
+# - locmem: 워커별 개별 메모리 캐시 (기본값, 테스트용)
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+CACHE_DEFAULT_TIMEOUT = 300     # 기본 TTL (초)
+CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 5000))  # file/locmem 최대 항목 수
+CACHE_CULL_FREQUENCY = 3        # 최대 항목 수 초과 시 1/3 제거
+
+if CACHE_BACKEND == 'redis':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL', 'redis://redis:6379/1'),
+            'TIMEOUT': CACHE_DEFAULT_TIMEOUT,
+            'KEY_PREFIX': 'moduway',
         }
     }
-}
+elif CACHE_BACKEND == 'file':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / '.cache')),
+            'TIMEOUT': CACHE_DEFAULT_TIMEOUT,
+            'KEY_PREFIX': 'moduway',
+            'OPTIONS': {
+                'MAX_ENTRIES': CACHE_MAX_ENTRIES,
+                'CULL_FREQUENCY': CACHE_CULL_FREQUENCY,
+            }
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+            'TIMEOUT': CACHE_DEFAULT_TIMEOUT,
+            'OPTIONS': {
+                'MAX_ENTRIES': CACHE_MAX_ENTRIES,  # 최대 캐시 항목 수
+                'CULL_FREQUENCY': CACHE_CULL_FREQUENCY,
+            }
+        }
+    }
+
+
+# HTTP 조건부 GET (apps.core.utils.conditional)
+# 공유 캐시(nginx proxy_cache)가 비로그인 조회 응답을 재사용하는 시간 (초, Cache-Control: s-maxage)
+# - 브라우저는 max-age=0으로 매번 ETag 검증(304), 로그인 사용자별 응답은 private으로 공유 캐시에 저장하지 않음
+HTTP_CACHE_SHARED_MAX_AGE = int(os.environ.get('HTTP_CACHE_SHARED_MAX_AGE', 60))
+
+
+# Vector search (kNN)
+# VECTOR_SEARCH_BACKEND 환경변수로 추천/시맨틱 검색의 kNN 엔진 선택
+# - elasticsearch: ES dense_vector kNN 후 DB에서 강좌 조회 (기본값)
+# - pgvector     : Course.embedding HNSW 인덱스로 kNN + 필터를 SQL 한 번에 처리 (ES 없이 동작, 소규모 배포/로컬용)
+# - mmap         : 시맨틱 검색만 메모리 매핑 인덱스 사용 (아래 VECTOR_INDEX_DIR, 인덱스가 없으면 ES로 대체)
+VECTOR_SEARCH_BACKEND = os.environ.get('VECTOR_SEARCH_BACKEND', 'elasticsearch')
+PGVECTOR_EF_SEARCH = int(os.environ.get('PGVECTOR_EF_SEARCH', 100))  # HNSW 탐색 후보 수 (클수록 정확, 느림)
+# export_vector_index 커맨드 출력 디렉토리 (mmap 백엔드, 워커 간 페이지 캐시 공유)
+VECTOR_INDEX_DIR = os.environ.get('VECTOR_INDEX_DIR', str(BASE_DIR.parent / 'data' / 'vector_index'))
+
+# Embedding storage profile (apps/courses/embedding_profile.py)
+# - DB(Course.embedding)에는 항상 1536차원 원본을 보관하고, 검색 인덱스(ES/mmap/pgvector)에만 축소 프로파일 적용
+# - EMBEDDING_DIMENSIONS: 검색용 차원 수 (1536 / 768 / 512, Matryoshka 방식으로 앞부분만 사용)
+#   -> 변경 후 reindex_es / export_vector_index / build_pgvector_index 재실행 필요
+# - ES_VECTOR_INDEX_TYPE: ES dense_vector HNSW 타입 (hnsw / int8_hnsw, int8_hnsw는 ES 8.12 이상)
+# - PGVECTOR_HALFVEC: pgvector kNN을 halfvec 표현식 인덱스로 수행 (pgvector 0.7 이상, build_pgvector_index로 생성)
+EMBEDDING_DIMENSIONS = int(os.environ.get('EMBEDDING_DIMENSIONS', 1536))
+ES_VECTOR_INDEX_TYPE = os.environ.get('ES_VECTOR_INDEX_TYPE', 'hnsw')
+PGVECTOR_HALFVEC = os.environ.get('PGVECTOR_HALFVEC', 'false').lower() == 'true'
 
 
 # Password validation
@@ -25,6 +25,13 @@ ACCOUNT_LOGIN_ON_EMAIL_CONFIRMATION = True
 if not SECRET_KEY:
     raise RuntimeError("SECRET_KEY is not set")
 
+# 여러 gunicorn 워커가 캐시 락/무효화 세대를 공유하려면 Redis 필요 (file/locmem은 원자성 보장 없음)
+if CACHE_BACKEND != 'redis':
+    logging.getLogger(__name__).warning(
+        "CACHE_BACKEND=%s: 운영 환경에서는 redis를 사용하세요. (워커 간 single-flight/무효화가 보장되지 않음)",
+        CACHE_BACKEND,
+    )
+
 # 운영용 PostgreSQL (Docker 환경)
 DATABASES = {
     "default": {